@@ -5,7 +5,7 @@ Currently includes MySQL and Drizzle.
 """
 
 from . import Connector
-from ..engine import base as engine_base, default
+from ..engine import base as engine_base, default, result as _result
 from ..sql import operators as sql_operators
 from .. import exc, log, schema, sql, types as sqltypes, util, processors
 import re
@@ -24,6 +24,22 @@ class MySQLDBExecutionContext(Connector):
         else:
             return self.cursor.rowcount
 
+    def create_cursor(self):
+        self._is_server_side = \
+                self.execution_options.get('stream_results', False)
+        if self._is_server_side:
+            # the "SSCursor" leaves rows on the server until fetched,
+            # rather than reading the whole result into memory
+            return self._dbapi_connection.cursor(self.dialect._sscursor)
+        else:
+            return self._dbapi_connection.cursor()
+
+    def get_result_proxy(self):
+        if self._is_server_side:
+            return _result.BufferedRowResultProxy(self)
+        else:
+            return _result.ResultProxy(self)
+
 
 class MySQLDBCompiler(Connector):
     def visit_mod_binary(self, binary, operator, **kw):
@@ -56,6 +72,10 @@ class MySQLDBConnector(Connector):
         # is overridden when pymysql is used
         return __import__('MySQLdb')
 
+    @util.memoized_property
+    def _sscursor(self):
+        return self.dbapi.cursors.SSCursor
+
     def do_executemany(self, cursor, statement, parameters, context=None):
         rowcount = cursor.executemany(statement, parameters)
         if context is not None:
@@ -481,6 +481,15 @@ class FBDialect(default.DefaultDialect):
         """
         return [self.normalize_name(row[0]) for row in connection.execute(s)]
 
+    @reflection.cache
+    def get_sequence_names(self, connection, schema=None, **kw):
+        s = """
+        SELECT rdb$generator_name
+        FROM rdb$generators
+        WHERE rdb$system_flag IS NULL OR rdb$system_flag = 0
+        """
+        return [self.normalize_name(row[0]) for row in connection.execute(s)]
+
     @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
         s = """
@@ -2110,6 +2110,16 @@ class MySQLDialect(default.DefaultDialect):
                         for row in self._compat_fetchall(rp, charset=charset)
                                                 if row[1] == 'BASE TABLE']
 
+    def _get_existing_table_names(self, connection, schema=None):
+        # has_table() uses DESCRIBE, which locates views as well as
+        # tables; SHOW TABLES lists both
+        if schema is None:
+            schema = self.default_schema_name
+        charset = self._connection_charset
+        rp = connection.execute("SHOW TABLES FROM %s" %
+                self.identifier_preparer.quote_identifier(schema))
+        return [row[0] for row in self._compat_fetchall(rp, charset=charset)]
+
     @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
         if self.server_version_info < (5, 0, 2):
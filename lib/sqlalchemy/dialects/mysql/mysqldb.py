@@ -39,6 +39,24 @@ return encoded strings::
     # set client encoding to utf8; all strings come back as utf8 str
     create_engine('mysql+mysqldb:///mydb?charset=utf8&use_unicode=0')
 
+Streaming Results
+-----------------
+
+The ``stream_results`` execution option, which is also set by
+:meth:`.Query.yield_per`, causes MySQL-Python's ``SSCursor`` to be used
+for the statement, which leaves rows on the server until they are
+fetched rather than reading the full result into memory; the
+:class:`.ResultProxy` then fetches rows in batches of increasing size::
+
+    result = conn.execution_options(stream_results=True).\
+                    execute(table.select())
+
+As the MySQL client protocol doesn't allow other statements to be
+emitted on the connection until the result is fully fetched or closed,
+the result should be consumed before the connection is used again.
+
+.. versionadded:: 0.9.0
+
 Known Issues
 -------------
 
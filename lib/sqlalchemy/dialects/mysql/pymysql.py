@@ -17,7 +17,8 @@ MySQL-Python Compatibility
 
 The pymysql DBAPI is a pure Python port of the MySQL-python (MySQLdb) driver,
 and targets 100% compatibility.   Most behavioral notes for MySQL-python apply to
-the pymysql driver as well.
+the pymysql driver as well, including the use of ``SSCursor`` for the
+``stream_results`` execution option.
 
 """
 
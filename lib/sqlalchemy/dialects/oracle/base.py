@@ -883,6 +883,25 @@ class OracleDialect(default.DefaultDialect):
         cursor = connection.execute(s, owner=schema)
         return [self.normalize_name(row[0]) for row in cursor]
 
+    def _get_existing_table_names(self, connection, schema=None):
+        # corresponds to has_table(), which locates tables only, but
+        # unlike get_table_names() doesn't omit any of them
+        schema = self.denormalize_name(schema or self.default_schema_name)
+        cursor = connection.execute(
+            sql.text("SELECT table_name FROM all_tables "
+                        "WHERE owner = :schema_name"),
+            schema_name=schema)
+        return [self.normalize_name(row[0]) for row in cursor]
+
+    @reflection.cache
+    def get_sequence_names(self, connection, schema=None, **kw):
+        schema = self.denormalize_name(schema or self.default_schema_name)
+        cursor = connection.execute(
+            sql.text("SELECT sequence_name FROM all_sequences "
+                        "WHERE sequence_owner = :schema_name"),
+            schema_name=schema)
+        return [self.normalize_name(row[0]) for row in cursor]
+
     @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
         schema = self.denormalize_name(schema or self.default_schema_name)
@@ -687,7 +687,7 @@ class ARRAY(sqltypes.Concatenable, sqltypes.TypeEngine):
         return x == y
 
     def _proc_array(self, arr, itemproc, dim, collection):
-        if dim is None:
+        if dim is None and not isinstance(arr, (list, tuple)):
             arr = list(arr)
         if dim == 1 or dim is None and (
                         # this has to be (list, tuple), or at least
@@ -695,17 +695,14 @@ class ARRAY(sqltypes.Concatenable, sqltypes.TypeEngine):
                         # etc. have __iter__
                         not arr or not isinstance(arr[0], (list, tuple))):
             if itemproc:
-                return collection(itemproc(x) for x in arr)
-            else:
-                return collection(arr)
+                arr = [itemproc(x) for x in arr]
+            return arr if type(arr) is collection else collection(arr)
         else:
-            return collection(
-                    self._proc_array(
-                            x, itemproc,
-                            dim - 1 if dim is not None else None,
-                            collection)
+            dim = dim - 1 if dim is not None else None
+            return collection([
+                    self._proc_array(x, itemproc, dim, collection)
                     for x in arr
-                )
+                ])
 
     def bind_processor(self, dialect):
         item_proc = self.item_type.\
@@ -864,18 +861,40 @@ class ENUM(sqltypes.Enum):
         else:
             return False
 
+    def _has_type(self, bind, checkfirst, kw):
+        """Check for the existence of the type, using the names of all
+        types in its schema fetched once per 'ddl runner', rather than
+        querying for each type.
+
+        """
+        if not checkfirst or not bind.dialect.supports_native_enum:
+            # create() / drop() will take no action either way
+            return False
+        if '_ddl_runner' in kw:
+            memo = kw['_ddl_runner'].memo
+            type_names = memo.setdefault('_pg_type_names', {})
+            if self.schema not in type_names:
+                type_names[self.schema] = set(
+                        bind.dialect._get_type_names(bind, self.schema))
+            return self.name in type_names[self.schema]
+        else:
+            return bind.dialect.has_type(bind, self.name, schema=self.schema)
+
     def _on_table_create(self, target, bind, checkfirst, **kw):
-        if not self._check_for_name_in_memos(checkfirst, kw):
-            self.create(bind=bind, checkfirst=checkfirst)
+        if not self._check_for_name_in_memos(checkfirst, kw) and \
+                not self._has_type(bind, checkfirst, kw):
+            self.create(bind=bind, checkfirst=False)
 
     def _on_metadata_create(self, target, bind, checkfirst, **kw):
         if self.metadata is not None and \
-            not self._check_for_name_in_memos(checkfirst, kw):
-            self.create(bind=bind, checkfirst=checkfirst)
+            not self._check_for_name_in_memos(checkfirst, kw) and \
+                not self._has_type(bind, checkfirst, kw):
+            self.create(bind=bind, checkfirst=False)
 
     def _on_metadata_drop(self, target, bind, checkfirst, **kw):
-        if not self._check_for_name_in_memos(checkfirst, kw):
-            self.drop(bind=bind, checkfirst=checkfirst)
+        if not self._check_for_name_in_memos(checkfirst, kw) and \
+                (not checkfirst or self._has_type(bind, checkfirst, kw)):
+            self.drop(bind=bind, checkfirst=False)
 
 colspecs = {
     sqltypes.Interval: INTERVAL,
@@ -918,6 +937,17 @@ ischema_names = {
 
 class PGCompiler(compiler.SQLCompiler):
 
+    def visit_copy_from(self, copy, **kw):
+        if not self.dialect._supports_copy_from:
+            raise exc.CompileError(
+                "The '%s' dialect does not support COPY FROM STDIN" %
+                self.dialect.dialect_description)
+        return "COPY %s (%s) FROM STDIN" % (
+                    self.preparer.format_table(copy.table),
+                    ', '.join(self.preparer.format_column(c)
+                                for c in copy.columns)
+                )
+
     def visit_array(self, element, **kw):
         return "ARRAY[%s]" % self.visit_clauselist(element, **kw)
 
@@ -958,7 +988,9 @@ class PGCompiler(compiler.SQLCompiler):
                 (self.process(binary.left, **kw),
                     self.process(binary.right, **kw)) \
                 + (escape and
-                        (' ESCAPE ' + self.render_literal_value(escape, None))
+                        (' ESCAPE ' +
+                            self.render_literal_value(
+                                    escape, sql.sqltypes.STRINGTYPE))
                         or '')
 
     def visit_notilike_op_binary(self, binary, operator, **kw):
@@ -967,7 +999,9 @@ class PGCompiler(compiler.SQLCompiler):
                 (self.process(binary.left, **kw),
                     self.process(binary.right, **kw)) \
                 + (escape and
-                        (' ESCAPE ' + self.render_literal_value(escape, None))
+                        (' ESCAPE ' +
+                            self.render_literal_value(
+                                    escape, sql.sqltypes.STRINGTYPE))
                         or '')
 
     def render_literal_value(self, value, type_):
@@ -1337,6 +1371,7 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_multi_reflection = True
     default_paramstyle = 'pyformat'
     ischema_names = ischema_names
     colspecs = colspecs
@@ -1349,6 +1384,8 @@ class PGDialect(default.DefaultDialect):
     inspector = PGInspector
     isolation_level = None
 
+    _supports_copy_from = False
+
     # TODO: need to inspect "standard_conforming_strings"
     _backslash_escapes = True
 
@@ -1514,6 +1551,95 @@ class PGDialect(default.DefaultDialect):
 
         return bool(cursor.first())
 
+    @reflection.cache
+    def get_sequence_names(self, connection, schema=None, **kw):
+        if schema is not None:
+            current_schema = schema
+        else:
+            current_schema = self.default_schema_name
+
+        result = connection.execute(
+            sql.text("SELECT relname FROM pg_class c join pg_namespace n on "
+                "n.oid=c.relnamespace where relkind='S' and "
+                "n.nspname=:schema",
+                bindparams=[
+                    sql.bindparam('schema',
+                        util.text_type(current_schema),
+                        type_=sqltypes.Unicode)
+                ],
+                typemap={'relname': sqltypes.Unicode}
+            )
+        )
+        return [row[0] for row in result]
+
+    def _get_relation_names(self, connection, schema=None, relkind=None):
+        """Return the names of all relations in `schema`, or in
+        current_schema() if None, optionally of the given kind only;
+        corresponds to has_table() and has_sequence().
+
+        """
+        if schema is not None:
+            query = """
+                SELECT c.relname
+                FROM pg_catalog.pg_class c, pg_catalog.pg_namespace n
+                WHERE c.relnamespace = n.oid
+                AND n.nspname = :nspname
+                """
+        else:
+            query = """
+                SELECT c.relname
+                FROM pg_catalog.pg_class c, pg_catalog.pg_namespace n
+                WHERE c.relnamespace = n.oid
+                AND n.nspname = current_schema()
+                """
+        if relkind is not None:
+            query += "AND c.relkind = :relkind"
+        result = connection.execute(sql.text(query,
+                        bindparams=[
+                            sql.bindparam('nspname',
+                                util.text_type(schema),
+                                type_=sqltypes.Unicode),
+                            sql.bindparam('relkind', relkind)
+                        ],
+                        typemap={'relname': sqltypes.Unicode}))
+        return [row[0] for row in result]
+
+    def _get_existing_table_names(self, connection, schema=None):
+        # has_table() locates relations of any kind in current_schema(),
+        # not just the tables in the default schema which
+        # get_table_names() reports.
+        return self._get_relation_names(connection, schema)
+
+    def _get_existing_sequence_names(self, connection, schema=None):
+        return self._get_relation_names(connection, schema, relkind='S')
+
+    def _get_type_names(self, connection, schema=None):
+        """Return the names of all types in `schema`, or of all types
+        visible in the search path if None; corresponds to has_type().
+
+        """
+        if schema is not None:
+            query = """
+                SELECT t.typname
+                FROM pg_catalog.pg_type t, pg_catalog.pg_namespace n
+                WHERE t.typnamespace = n.oid
+                AND n.nspname = :nspname
+                """
+        else:
+            query = """
+                SELECT t.typname
+                FROM pg_catalog.pg_type t
+                WHERE pg_type_is_visible(t.oid)
+                """
+        result = connection.execute(sql.text(query,
+                        bindparams=[
+                            sql.bindparam('nspname',
+                                util.text_type(schema),
+                                type_=sqltypes.Unicode)
+                        ],
+                        typemap={'typname': sqltypes.Unicode}))
+        return [row[0] for row in result]
+
     def has_type(self, connection, type_name, schema=None):
         bindparams = [
             sql.bindparam('typname',
@@ -1865,7 +1991,6 @@ class PGDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
 
@@ -1888,38 +2013,41 @@ class PGDialect(default.DefaultDialect):
                                 'conname': sqltypes.Unicode,
                                 'condef': sqltypes.Unicode})
         c = connection.execute(t, table=table_oid)
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
-            m = re.search('FOREIGN KEY \((.*?)\) REFERENCES '
-                            '(?:(.*?)\.)?(.*?)\((.*?)\)', condef).groups()
-            constrained_columns, referred_schema, \
-                    referred_table, referred_columns = m
-            constrained_columns = [preparer._unquote_identifier(x)
-                        for x in re.split(r'\s*,\s*', constrained_columns)]
-
-            if referred_schema:
-                referred_schema =\
-                                preparer._unquote_identifier(referred_schema)
-            elif schema is not None and schema == conschema:
-                # no schema was returned by pg_get_constraintdef().  This
-                # means the schema is in the search path.   We will leave
-                # it as None, unless the actual schema, which we pull out
-                # from pg_namespace even though pg_get_constraintdef() doesn't
-                # want to give it to us, matches that of the referencing table,
-                # and an explicit schema was given for the referencing table.
-                referred_schema = schema
-            referred_table = preparer._unquote_identifier(referred_table)
-            referred_columns = [preparer._unquote_identifier(x)
-                        for x in re.split(r'\s*,\s', referred_columns)]
-            fkey_d = {
-                'name': conname,
-                'constrained_columns': constrained_columns,
-                'referred_schema': referred_schema,
-                'referred_table': referred_table,
-                'referred_columns': referred_columns
-            }
-            fkeys.append(fkey_d)
-        return fkeys
+        return [
+            self._get_fkey_info(conname, condef, conschema, schema)
+            for conname, condef, conschema in c.fetchall()
+        ]
+
+    def _get_fkey_info(self, conname, condef, conschema, schema):
+        preparer = self.identifier_preparer
+        m = re.search('FOREIGN KEY \((.*?)\) REFERENCES '
+                        '(?:(.*?)\.)?(.*?)\((.*?)\)', condef).groups()
+        constrained_columns, referred_schema, \
+                referred_table, referred_columns = m
+        constrained_columns = [preparer._unquote_identifier(x)
+                    for x in re.split(r'\s*,\s*', constrained_columns)]
+
+        if referred_schema:
+            referred_schema =\
+                            preparer._unquote_identifier(referred_schema)
+        elif schema is not None and schema == conschema:
+            # no schema was returned by pg_get_constraintdef().  This
+            # means the schema is in the search path.   We will leave
+            # it as None, unless the actual schema, which we pull out
+            # from pg_namespace even though pg_get_constraintdef() doesn't
+            # want to give it to us, matches that of the referencing table,
+            # and an explicit schema was given for the referencing table.
+            referred_schema = schema
+        referred_table = preparer._unquote_identifier(referred_table)
+        referred_columns = [preparer._unquote_identifier(x)
+                    for x in re.split(r'\s*,\s', referred_columns)]
+        return {
+            'name': conname,
+            'constrained_columns': constrained_columns,
+            'referred_schema': referred_schema,
+            'referred_table': referred_table,
+            'referred_columns': referred_columns
+        }
 
     @reflection.cache
     def get_indexes(self, connection, table_name, schema, **kw):
@@ -1949,11 +2077,13 @@ class PGDialect(default.DefaultDialect):
 
         t = sql.text(IDX_SQL, typemap={'attname': sqltypes.Unicode})
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_index_info(c.fetchall())
 
+    def _get_index_info(self, rows):
         indexes = defaultdict(lambda: defaultdict(dict))
 
         sv_idx_name = None
-        for row in c.fetchall():
+        for row in rows:
             idx_name, unique, expr, prd, col, col_num, idx_key = row
 
             if expr:
@@ -1984,6 +2114,290 @@ class PGDialect(default.DefaultDialect):
             for name, idx in indexes.items()
         ]
 
+    def _execute_multi(self, connection, query, schema, typemap,
+                                table_names=None, table_oids=None):
+        """Execute a catalog query against many tables at once; the query
+        selects from pg_class as "c" joined to pg_namespace as "n".
+
+        The query is limited to the tables of the given oids if
+        `table_oids` is given, else to those of the given names if
+        `table_names` is given, else it applies to all tables in the
+        schema.
+
+        """
+        bindparams = []
+        params = {}
+        if table_oids is not None:
+            if not table_oids:
+                return []
+            where_clause = "c.oid IN (:table_oids)"
+            bindparams.append(sql.bindparam('table_oids',
+                            type_=sqltypes.Integer, expanding=True))
+            params['table_oids'] = list(table_oids)
+        else:
+            if schema is not None:
+                where_clause = "n.nspname = :schema"
+                bindparams.append(sql.bindparam('schema',
+                            type_=sqltypes.Unicode))
+                params['schema'] = util.text_type(schema)
+            else:
+                where_clause = "pg_catalog.pg_table_is_visible(c.oid)"
+            if table_names is not None:
+                if not table_names:
+                    return []
+                where_clause += " AND c.relname IN (:table_names)"
+                bindparams.append(sql.bindparam('table_names',
+                            type_=sqltypes.Unicode, expanding=True))
+                params['table_names'] = [
+                            util.text_type(name) for name in table_names]
+        s = sql.text(query % where_clause, bindparams=bindparams,
+                            typemap=typemap)
+        return connection.execute(s, **params).fetchall()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # Postgresql has no catalog change counter; use the number of
+        # catalog rows describing the schema's relations, along with the
+        # most recent transaction id to have written any of them.
+        # Transaction ids are 32 bit and can wrap around or be frozen,
+        # which at worst produces a different fingerprint for an
+        # unchanged schema.
+        FINGERPRINT_SQL = """
+            SELECT count(*), max(c.xmin::text::bigint),
+              sum((SELECT count(*) FROM pg_catalog.pg_attribute a
+                WHERE a.attrelid = c.oid)),
+              max((SELECT max(a.xmin::text::bigint)
+                FROM pg_catalog.pg_attribute a
+                WHERE a.attrelid = c.oid)),
+              sum((SELECT count(*) FROM pg_catalog.pg_constraint r
+                WHERE r.conrelid = c.oid)),
+              max((SELECT max(r.xmin::text::bigint)
+                FROM pg_catalog.pg_constraint r
+                WHERE r.conrelid = c.oid)),
+              max((SELECT max(d.xmin::text::bigint)
+                FROM pg_catalog.pg_attrdef d
+                WHERE d.adrelid = c.oid))
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND c.relkind in ('r', 'v', 'i', 'S')
+        """
+        row, = self._execute_multi(connection, FINGERPRINT_SQL, schema, {})
+        return tuple(row)
+
+    def _multi_table_oids(self, connection, schema, table_names, **kw):
+        """Return a dictionary of oid->table name for the given tables and
+        views, or for all tables in the schema if `table_names` is None.
+
+        The result is kept in the info cache, so that it's queried
+        once for the get_multi_*() methods.
+
+        """
+        info_cache = kw.get('info_cache')
+        key = ('_multi_table_oids', schema,
+                    tuple(table_names) if table_names is not None else None)
+        if info_cache is not None and key in info_cache:
+            return info_cache[key]
+
+        query = """
+            SELECT c.oid, c.relname
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%%s)
+            AND c.relkind in (%s)
+        """ % ("'r'" if table_names is None else "'r','v'")
+        table_oids = dict(self._execute_multi(connection, query, schema,
+                                {'oid': sqltypes.Integer,
+                                'relname': sqltypes.Unicode},
+                                table_names=table_names))
+        if info_cache is not None:
+            info_cache[key] = table_oids
+        return table_oids
+
+    def _multi_oids_filter(self, table_names, table_oids):
+        # the oids by which to limit a get_multi_*() query; when
+        # reflecting the whole schema, the schema criteria are used
+        # instead
+        if table_names is None:
+            return None
+        else:
+            return list(table_oids)
+
+    def get_multi_columns(self, connection, schema=None,
+                                table_names=None, **kw):
+        table_oids = self._multi_table_oids(connection, schema,
+                                            table_names, **kw)
+        SQL_COLS = """
+            SELECT a.attrelid, a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (SELECT substring(pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                for 128)
+                FROM pg_catalog.pg_attrdef d
+               WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+               AND a.atthasdef)
+              AS DEFAULT,
+              a.attnotnull
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND c.relkind in ('r','v')
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY a.attrelid, a.attnum
+        """
+        rows = self._execute_multi(connection, SQL_COLS, schema,
+                            {'attrelid': sqltypes.Integer,
+                            'attname': sqltypes.Unicode,
+                            'default': sqltypes.Unicode},
+                            table_oids=self._multi_oids_filter(
+                                            table_names, table_oids))
+        domains = self._load_domains(connection)
+        enums = self._load_enums(connection)
+
+        columns = dict((name, []) for name in table_oids.values())
+        for table_oid, name, format_type, column_default, notnull in rows:
+            if table_oid in table_oids:
+                columns[table_oids[table_oid]].append(
+                    self._get_column_info(
+                        name, format_type, column_default, notnull,
+                        domains, enums, schema))
+        return columns
+
+    def get_multi_pk_constraint(self, connection, schema=None,
+                                table_names=None, **kw):
+        table_oids = self._multi_table_oids(connection, schema,
+                                            table_names, **kw)
+        if self.server_version_info < (8, 4):
+            # unnest() and generate_subscripts() both introduced in
+            # version 8.4
+            PK_SQL = """
+                SELECT c.oid, a.attname
+                FROM
+                    pg_catalog.pg_class c
+                    join pg_catalog.pg_index ix on c.oid = ix.indrelid
+                    join pg_catalog.pg_attribute a
+                        on c.oid=a.attrelid and a.attnum=ANY(ix.indkey)
+                    left join pg_catalog.pg_namespace n
+                        on n.oid = c.relnamespace
+                WHERE (%s)
+                AND ix.indisprimary = 't'
+                ORDER BY c.oid, a.attnum
+            """
+        else:
+            PK_SQL = """
+                SELECT k.indrelid, a.attname
+                FROM pg_catalog.pg_attribute a JOIN (
+                    SELECT ix.indrelid,
+                           unnest(ix.indkey) attnum,
+                           generate_subscripts(ix.indkey, 1) ord
+                    FROM pg_catalog.pg_index ix
+                    JOIN pg_catalog.pg_class c ON c.oid = ix.indrelid
+                    LEFT JOIN pg_catalog.pg_namespace n
+                        ON n.oid = c.relnamespace
+                    WHERE (%s)
+                    AND ix.indisprimary
+                    ) k ON a.attrelid = k.indrelid AND a.attnum = k.attnum
+                ORDER BY k.indrelid, k.ord
+            """
+        pks = dict(
+            (name, {'constrained_columns': [], 'name': None})
+            for name in table_oids.values())
+        for table_oid, attname in self._execute_multi(
+                                connection, PK_SQL, schema,
+                                {'attname': sqltypes.Unicode},
+                                table_oids=self._multi_oids_filter(
+                                            table_names, table_oids)):
+            if table_oid in table_oids:
+                pks[table_oids[table_oid]]['constrained_columns'].\
+                                        append(attname)
+
+        PK_CONS_SQL = """
+            SELECT r.conrelid, r.conname
+            FROM pg_catalog.pg_constraint r
+            JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND r.contype = 'p'
+            ORDER BY 1, 2
+        """
+        for table_oid, conname in self._execute_multi(
+                                connection, PK_CONS_SQL, schema,
+                                {'conname': sqltypes.Unicode},
+                                table_oids=self._multi_oids_filter(
+                                            table_names, table_oids)):
+            if table_oid in table_oids:
+                pk = pks[table_oids[table_oid]]
+                if pk['name'] is None:
+                    pk['name'] = conname
+        return pks
+
+    def get_multi_foreign_keys(self, connection, schema=None,
+                                table_names=None, **kw):
+        table_oids = self._multi_table_oids(connection, schema,
+                                            table_names, **kw)
+        FK_SQL = """
+          SELECT r.conrelid, r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
+                rn.nspname as conschema
+          FROM  pg_catalog.pg_constraint r
+                JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+                LEFT JOIN pg_catalog.pg_namespace n
+                    ON n.oid = c.relnamespace
+                JOIN pg_catalog.pg_class rc ON rc.oid = r.confrelid
+                JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+          WHERE (%s)
+          AND r.contype = 'f'
+          ORDER BY 1, 2
+        """
+        fkeys = dict((name, []) for name in table_oids.values())
+        for table_oid, conname, condef, conschema in self._execute_multi(
+                                connection, FK_SQL, schema,
+                                {'conname': sqltypes.Unicode,
+                                'condef': sqltypes.Unicode},
+                                table_oids=self._multi_oids_filter(
+                                            table_names, table_oids)):
+            if table_oid in table_oids:
+                fkeys[table_oids[table_oid]].append(
+                    self._get_fkey_info(conname, condef, conschema, schema))
+        return fkeys
+
+    def get_multi_indexes(self, connection, schema=None,
+                                table_names=None, **kw):
+        table_oids = self._multi_table_oids(connection, schema,
+                                            table_names, **kw)
+        IDX_SQL = """
+          SELECT
+              c.oid, i.relname as relname,
+              ix.indisunique, ix.indexprs, ix.indpred,
+              a.attname, a.attnum, ix.indkey
+          FROM
+              pg_catalog.pg_class c
+                    join pg_catalog.pg_index ix on c.oid = ix.indrelid
+                    join pg_catalog.pg_class i on i.oid=ix.indexrelid
+                    left outer join
+                        pg_catalog.pg_attribute a
+                        on c.oid=a.attrelid and a.attnum=ANY(ix.indkey)
+                    left join pg_catalog.pg_namespace n
+                        on n.oid = c.relnamespace
+          WHERE (%s)
+              and c.relkind = 'r'
+              and ix.indisprimary = 'f'
+          ORDER BY
+              c.oid,
+              i.relname
+        """
+        rows = defaultdict(list)
+        for row in self._execute_multi(connection, IDX_SQL, schema,
+                                {'attname': sqltypes.Unicode},
+                                table_oids=self._multi_oids_filter(
+                                            table_names, table_oids)):
+            if row[0] in table_oids:
+                rows[row[0]].append(tuple(row[1:]))
+
+        return dict(
+            (name, self._get_index_info(rows[table_oid]))
+            for table_oid, name in table_oids.items()
+        )
+
     @reflection.cache
     def get_unique_constraints(self, connection, table_name,
                                schema=None, **kw):
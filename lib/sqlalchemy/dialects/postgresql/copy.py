@@ -0,0 +1,233 @@
+# postgresql/copy.py
+# Copyright (C) 2013 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+import binascii
+import datetime
+
+from ... import exc, inspection, util
+from ... import types as sqltypes
+from ...sql.base import Executable
+from ...sql.elements import ClauseElement
+from .hstore import _serialize_hstore
+
+
+class CopyFrom(Executable, ClauseElement):
+    """Represent a ``COPY <table> FROM STDIN`` statement, along with
+    the rows to be sent.
+
+    The :class:`.CopyFrom` construct is produced using the
+    :func:`.postgresql.copy_from` function.
+
+    """
+
+    __visit_name__ = 'copy_from'
+
+    _execution_options = \
+        Executable._execution_options.union({'autocommit': True})
+
+    def __init__(self, entity, rows, columns=None, buffer_size=65536):
+        insp = inspection.inspect(entity)
+        mapper = insp if getattr(insp, 'is_mapper', False) else None
+        if mapper is not None:
+            self.table = mapper.local_table
+        else:
+            self.table = insp
+
+        if columns is None:
+            columns = list(self.table.c)
+
+        self.columns = []
+        self.keys = []
+        for col in columns:
+            if isinstance(col, util.string_types):
+                key = col
+                if mapper is not None:
+                    col = mapper.get_property(key).columns[0]
+                else:
+                    col = self.table.c[key]
+            elif mapper is not None:
+                key = mapper.get_property_by_column(col).key
+            else:
+                key = col.key
+            if col.table is not self.table:
+                raise exc.ArgumentError(
+                    "Column %s is not part of table %s" %
+                    (col, self.table.description))
+            self.columns.append(col)
+            self.keys.append(key)
+
+        self.rows = rows
+        self.buffer_size = buffer_size
+
+    @property
+    def bind(self):
+        return self.table.bind
+
+    def get_children(self, **kwargs):
+        return self.table,
+
+    def _copy_stream(self, dialect, encoding):
+        return _CopyStream(self, dialect, encoding)
+
+
+def copy_from(entity, rows, columns=None, buffer_size=65536):
+    """Produce a :class:`.CopyFrom` construct, which when executed loads
+    the given rows using ``COPY <table> FROM STDIN``.
+
+    E.g.::
+
+        from sqlalchemy.dialects.postgresql import copy_from
+
+        conn.execute(
+            copy_from(mytable, ((i, "name %d" % i) for i in range(100000)))
+        )
+
+    The rows are converted into the text format of the ``COPY``
+    statement as they are sent, after being passed through the bind
+    processor of each column's type, so that an iterator of any size
+    may be passed without materializing it in memory.
+
+    The construct may also be used with the ORM, given a mapped class in
+    place of the :class:`.Table`, in which case the rows are loaded into
+    the class' local table, and the names in ``columns`` as well as the
+    keys of dictionary rows refer to mapped attribute names::
+
+        session.execute(
+            copy_from(User, ({"id": i, "name": "name %d" % i}
+                                for i in range(100000)))
+        )
+
+    The :class:`.Session` locates the bind for the statement based on
+    the table as with any other statement.  As with
+    :meth:`.Query.update` and similar, the rows are not added to the
+    :class:`.Session` as objects.
+
+    Execution of the construct is currently supported only by the
+    psycopg2 dialect.
+
+    :param entity: a :class:`.Table`, or a mapped class.
+
+    :param rows: an iterable of rows, each of which is either a tuple
+     of values in the order of ``columns``, or a dictionary of values
+     keyed on the keys of ``columns``.  ``None`` indicates NULL.
+
+    :param columns: optional sequence of :class:`.Column` objects or
+     column keys (attribute names, when a mapped class is given) to be
+     loaded; defaults to all columns of the table.
+
+    :param buffer_size: the number of bytes to be read from the rows
+     and sent to the database at a time.
+
+    .. versionadded:: 0.9.0
+
+    """
+    return CopyFrom(entity, rows, columns=columns, buffer_size=buffer_size)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('\t', '\\t').\
+                replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _array_element(value):
+    if value is None:
+        return 'NULL'
+    elif isinstance(value, (list, tuple)):
+        return _array(value)
+    else:
+        return '"%s"' % _text(value).replace('\\', '\\\\').\
+                                replace('"', '\\"')
+
+
+def _array(value):
+    return '{%s}' % ','.join(_array_element(elem) for elem in value)
+
+
+def _text(value):
+    if isinstance(value, util.string_types):
+        return value
+    elif isinstance(value, bool):
+        return value and 't' or 'f'
+    elif isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, datetime.timedelta):
+        return '%d days %d seconds %d microseconds' % (
+                    value.days, value.seconds, value.microseconds)
+    elif isinstance(value, float):
+        return repr(value)
+    elif isinstance(value, (list, tuple)):
+        return _array(value)
+    elif isinstance(value, dict):
+        return _serialize_hstore(value)
+    else:
+        return util.text_type(value)
+
+
+def _binary_processor(value):
+    if value is None:
+        return None
+    return '\\x' + binascii.hexlify(value).decode('ascii')
+
+
+class _CopyStream(object):
+    """A file-like object which renders the rows of a :class:`.CopyFrom`
+    into ``COPY`` text format as they are read, no more than
+    the requested size plus one row at a time.
+
+    """
+
+    def __init__(self, copy, dialect, encoding):
+        self.keys = copy.keys
+        self.rows = iter(copy.rows)
+        self.encoding = encoding
+        self.processors = []
+        for col in copy.columns:
+            if isinstance(col.type, sqltypes._Binary):
+                # render bytes directly rather than as a DBAPI
+                # Binary() wrapper
+                self.processors.append(_binary_processor)
+            else:
+                self.processors.append(
+                    col.type._cached_bind_processor(dialect))
+        self._buf = []
+        self._buflen = 0
+
+    def _line(self, row):
+        if isinstance(row, dict):
+            row = [row.get(key) for key in self.keys]
+        values = []
+        for proc, value in zip(self.processors, row):
+            if proc is not None:
+                value = proc(value)
+            if value is None:
+                values.append('\\N')
+            else:
+                values.append(_escape(_text(value)))
+        line = '\t'.join(values) + '\n'
+        if not isinstance(line, util.binary_type):
+            line = line.encode(self.encoding)
+        return line
+
+    def read(self, size=-1):
+        buf = self._buf
+        while size < 0 or self._buflen < size:
+            try:
+                row = next(self.rows)
+            except StopIteration:
+                break
+            line = self._line(row)
+            buf.append(line)
+            self._buflen += len(line)
+
+        data = util.b('').join(buf)
+        if size >= 0 and len(data) > size:
+            data, remainder = data[:size], data[size:]
+            self._buf = [remainder]
+            self._buflen = len(remainder)
+        else:
+            self._buf = []
+            self._buflen = 0
+        return data
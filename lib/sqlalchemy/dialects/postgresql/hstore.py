@@ -65,23 +65,31 @@ def _parse_hstore(hstore_str):
     """
     result = {}
     pos = 0
-    pair_match = HSTORE_PAIR_RE.match(hstore_str)
+    match_pair = HSTORE_PAIR_RE.match
+    match_delimiter = HSTORE_DELIMITER_RE.match
+
+    # match at successive positions within the string, rather than
+    # against slices of it, so that the parse is a single pass
+    pair_match = match_pair(hstore_str)
 
     while pair_match is not None:
-        key = pair_match.group('key').replace(r'\"', '"').replace("\\\\", "\\")
-        if pair_match.group('value_null'):
+        key, value_null, value = pair_match.group(
+                                    'key', 'value_null', 'value')
+        if '\\' in key:
+            key = _unescape(key)
+        if value_null:
             value = None
-        else:
-            value = pair_match.group('value').replace(r'\"', '"').replace("\\\\", "\\")
+        elif '\\' in value:
+            value = _unescape(value)
         result[key] = value
 
-        pos += pair_match.end()
+        pos = pair_match.end()
 
-        delim_match = HSTORE_DELIMITER_RE.match(hstore_str[pos:])
+        delim_match = match_delimiter(hstore_str, pos)
         if delim_match is not None:
-            pos += delim_match.end()
+            pos = delim_match.end()
 
-        pair_match = HSTORE_PAIR_RE.match(hstore_str[pos:])
+        pair_match = match_pair(hstore_str, pos)
 
     if pos != len(hstore_str):
         raise ValueError(_parse_error(hstore_str, pos))
@@ -89,6 +97,10 @@ def _parse_hstore(hstore_str):
     return result
 
 
+def _unescape(s):
+    return s.replace(r'\"', '"').replace("\\\\", "\\")
+
+
 def _serialize_hstore(val):
     """Serialize a dictionary into an hstore literal.  Keys and values must
     both be strings (except None for values).
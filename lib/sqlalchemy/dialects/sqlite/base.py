@@ -128,10 +128,12 @@ for new connections through the usage of events::
 """
 
 import datetime
+import hashlib
 import re
 
 from sqlalchemy import sql, exc
-from sqlalchemy.engine import default, base, reflection
+from sqlalchemy.engine import default, base, reflection, \
+    result as _result
 from sqlalchemy import types as sqltypes
 from sqlalchemy import util
 from sqlalchemy.sql import compiler
@@ -160,6 +162,13 @@ class _DateTimeMixin(object):
             kw["regexp"] = self._reg
         return util.constructor_copy(self, cls, **kw)
 
+    def literal_processor(self, dialect):
+        bp = self.bind_processor(dialect)
+
+        def process(value):
+            return "'%s'" % bp(value)
+        return process
+
 class DATETIME(_DateTimeMixin, sqltypes.DateTime):
     """Represent a Python datetime object in SQLite using a string.
 
@@ -576,16 +585,31 @@ class SQLiteIdentifierPreparer(compiler.IdentifierPreparer):
 
 
 class SQLiteExecutionContext(default.DefaultExecutionContext):
+    def get_result_proxy(self):
+        # the cursor steps through rows as they're fetched; fetch
+        # in growing batches rather than all at once when streaming
+        if self.execution_options.get('stream_results', False):
+            return _result.BufferedRowResultProxy(self)
+        else:
+            return _result.ResultProxy(self)
+
     @util.memoized_property
     def _preserve_raw_colnames(self):
         return self.execution_options.get("sqlite_raw_colnames", False)
 
-    def _translate_colname(self, colname):
+    @property
+    def _translate_colname(self):
+        if self._preserve_raw_colnames:
+            return None
+        else:
+            return self._translate_dotted_colname
+
+    def _translate_dotted_colname(self, colname):
         # adjust for dotted column names.  SQLite
         # in the case of UNION may store col names as
         # "tablename.colname"
         # in cursor.description
-        if not self._preserve_raw_colnames  and "." in colname:
+        if "." in colname:
             return colname.split(".")[1], colname
         else:
             return colname, None
@@ -602,6 +626,11 @@ class SQLiteDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     supports_right_nested_joins = False
 
+    # has_table() also locates tables in attached databases and
+    # internal tables which get_table_names() doesn't report, and
+    # there's no network round trip to save.
+    batch_checkfirst = False
+
     default_paramstyle = 'qmark'
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -641,6 +670,11 @@ class SQLiteDialect(default.DefaultDialect):
             self._broken_fk_pragma_quotes = \
                                 self.dbapi.sqlite_version_info < (3, 6, 14)
 
+            # table-valued PRAGMA functions, used to reflect many
+            # tables at once
+            self.supports_multi_reflection = \
+                                self.dbapi.sqlite_version_info >= (3, 16, 0)
+
 
     _isolation_lookup = {
         'READ UNCOMMITTED': 1,
@@ -925,6 +959,198 @@ class SQLiteDialect(default.DefaultDialect):
                 cols.append(row[2])
         return indexes
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # the complete schema of a SQLite database is the contents of
+        # sqlite_master, which is small; a digest of it distinguishes
+        # between databases where "PRAGMA schema_version" may not, such
+        # as a database file recreated with the same number of changes.
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            master = '%s.sqlite_master' % qschema
+        else:
+            master = ("(SELECT * FROM sqlite_master UNION ALL "
+                        "SELECT * FROM sqlite_temp_master)")
+        rows = connection.execute(
+                    "SELECT type, name, tbl_name, sql FROM %s "
+                    "ORDER BY type, name" % master)
+        digest = hashlib.sha1()
+        for row in rows:
+            digest.update(repr(tuple(row)).encode('utf-8'))
+        return digest.hexdigest()
+
+    # maximum number of table names bound to a statement by
+    # _multi_pragma(), within the SQLITE_MAX_VARIABLE_NUMBER default
+    # of 999 for SQLite versions prior to 3.32
+    _multi_pragma_max_names = 500
+
+    def _multi_pragma(self, connection, schema, table_names,
+                                    columns, pragmas, order_by):
+        """Run one or more PRAGMA statements against many tables in a
+        schema at once, using the table-valued PRAGMA functions of
+        SQLite 3.16 and above, returning rows of the table name followed
+        by the given columns.
+
+        The PRAGMA functions are outer joined, so that each table is
+        present in the result, with NULL for the given columns if the
+        PRAGMA returns no rows for it.  If `table_names` is None, all
+        tables in the schema are included, else the given tables
+        and views.
+
+        """
+        if schema is not None:
+            qschema = self.identifier_preparer.quote_identifier(schema)
+            master = '%s.sqlite_master' % qschema
+            pragma_schema = ", :schema"
+        else:
+            master = ("(SELECT * FROM sqlite_master UNION ALL "
+                        "SELECT * FROM sqlite_temp_master)")
+            pragma_schema = ""
+
+        # a list of names too long to be bound to one statement
+        # covers a good part of the schema; rather than a statement
+        # per chunk of names, read the whole schema and filter here
+        filter_names = table_names is not None and \
+                    len(table_names) <= self._multi_pragma_max_names
+
+        bindparams = []
+        if table_names is None:
+            criteria = "m.type = 'table'"
+        else:
+            criteria = "m.type IN ('table', 'view')"
+            if filter_names:
+                criteria += " AND m.name IN (:table_names)"
+                bindparams.append(
+                        sql.bindparam('table_names', expanding=True))
+
+        s = sql.text(
+                "SELECT m.name, %s FROM %s AS m %s "
+                "WHERE %s ORDER BY m.name, %s" % (
+                    columns,
+                    master,
+                    " ".join(
+                        "LEFT OUTER JOIN pragma_%s(%s%s) AS %s" % (
+                            pragma, arg, pragma_schema, alias)
+                        for pragma, arg, alias in pragmas
+                    ),
+                    criteria,
+                    order_by
+                ),
+                bindparams=bindparams)
+
+        params = {}
+        if schema is not None:
+            params['schema'] = schema
+        if filter_names:
+            params['table_names'] = list(table_names)
+
+        rows = connection.execute(s, **params)
+        if table_names is None or filter_names:
+            return rows.fetchall()
+        else:
+            table_names = set(table_names)
+            return [row for row in rows if row[0] in table_names]
+
+    def _multi_table_info(self, connection, schema, table_names, **kw):
+        """Return the rows of "PRAGMA table_info" for many tables at
+        once, shared by get_multi_columns() and get_multi_pk_constraint()
+        by way of the info cache.
+
+        """
+        info_cache = kw.get('info_cache')
+        key = ('_multi_table_info', schema,
+                    tuple(table_names) if table_names is not None else None)
+        if info_cache is not None and key in info_cache:
+            return info_cache[key]
+        rows = self._multi_pragma(connection, schema, table_names,
+                    'p.name, p.type, p."notnull", p.dflt_value, p.pk',
+                    [('table_info', 'm.name', 'p')],
+                    'p.cid')
+        if info_cache is not None:
+            info_cache[key] = rows
+        return rows
+
+    def get_multi_columns(self, connection, schema=None,
+                                table_names=None, **kw):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_columns(
+                        connection, schema, table_names, **kw)
+
+        columns = {}
+        for table_name, name, type_, notnull, column_default, primary_key \
+                in self._multi_table_info(connection, schema,
+                                            table_names, **kw):
+            cols = columns.setdefault(table_name, [])
+            if name is not None:
+                cols.append(
+                    self._get_column_info(name, type_.upper(), not notnull,
+                                    column_default, primary_key))
+        return columns
+
+    def get_multi_pk_constraint(self, connection, schema=None,
+                                table_names=None, **kw):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_pk_constraint(
+                        connection, schema, table_names, **kw)
+
+        pks = {}
+        for table_name, name, type_, notnull, column_default, primary_key \
+                in self._multi_table_info(connection, schema,
+                                            table_names, **kw):
+            pk = pks.setdefault(table_name,
+                        {'constrained_columns': [], 'name': None})
+            if primary_key:
+                pk['constrained_columns'].append(name)
+        return pks
+
+    def get_multi_foreign_keys(self, connection, schema=None,
+                                table_names=None, **kw):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_foreign_keys(
+                        connection, schema, table_names, **kw)
+
+        fkeys = {}
+        fks = {}
+        for table_name, numerical_id, rtbl, lcol, rcol in \
+                self._multi_pragma(connection, schema, table_names,
+                    'f.id, f."table", f."from", f."to"',
+                    [('foreign_key_list', 'm.name', 'f')],
+                    'f.id, f.seq'):
+            table_fkeys = fkeys.setdefault(table_name, [])
+            if numerical_id is not None:
+                self._parse_fk(fks.setdefault(table_name, {}),
+                            table_fkeys, numerical_id, rtbl, lcol, rcol)
+        return fkeys
+
+    def get_multi_indexes(self, connection, schema=None,
+                                table_names=None, **kw):
+        if not self.supports_multi_reflection:
+            return super(SQLiteDialect, self).get_multi_indexes(
+                        connection, schema, table_names, **kw)
+
+        include_auto_indexes = kw.pop('include_auto_indexes', False)
+        indexes = {}
+        by_name = {}
+        for table_name, name, unique, column_name in \
+                self._multi_pragma(connection, schema, table_names,
+                    'il.name, il."unique", ii.name',
+                    [('index_list', 'm.name', 'il'),
+                        ('index_info', 'il.name', 'ii')],
+                    'il.seq, ii.seqno'):
+            indexes.setdefault(table_name, [])
+            # ignore implicit primary key index.
+            # http://www.mail-archive.com/sqlite-users@sqlite.org/msg30517.html
+            if name is None or (
+                    not include_auto_indexes and
+                    name.startswith('sqlite_autoindex')):
+                continue
+            key = (table_name, name)
+            if key not in by_name:
+                by_name[key] = idx = dict(name=name, column_names=[],
+                                                unique=unique)
+                indexes[table_name].append(idx)
+            by_name[key]['column_names'].append(column_name)
+        return indexes
+
     @reflection.cache
     def get_unique_constraints(self, connection, table_name,
                                schema=None, **kw):
@@ -193,6 +193,21 @@ require unicode, however, so that non-``unicode`` values passed inadvertently
 will emit a warning.  Pysqlite will emit an error if a non-``unicode`` string
 is passed containing non-ASCII characters.
 
+Streaming Results
+-----------------
+
+The pysqlite cursor steps through the rows of a result as they are
+fetched, so that a :class:`.ResultProxy` which is iterated does not hold
+all rows in memory.  When the ``stream_results`` execution option is set,
+as is the case for a :class:`.Query` using :meth:`.Query.yield_per`, the
+:class:`.ResultProxy` additionally fetches rows from the cursor in
+batches of increasing size, rather than one at a time::
+
+    result = conn.execution_options(stream_results=True).\
+                    execute(table.select())
+
+.. versionadded:: 0.9.0
+
 .. _pysqlite_serializable:
 
 Serializable Transaction Isolation
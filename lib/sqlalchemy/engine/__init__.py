@@ -314,6 +314,18 @@ def create_engine(*args, **kwargs):
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param prepared_statement_cache_size=None: if set to an integer,
+        each DBAPI connection keeps up to that many idle cursors, keyed on
+        the SQL string of the compiled statement each one last executed,
+        and a cursor is re-used when the same statement is executed again,
+        so that the database doesn't parse and plan the statement for
+        each execution.  The cached cursors belong to the DBAPI connection
+        and are discarded when it is invalidated.  Supported by the
+        cx_Oracle and OurSQL dialects only; other dialects raise
+        :class:`.ArgumentError`.
+
+        .. versionadded:: 0.9.0
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
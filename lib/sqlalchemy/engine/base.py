@@ -198,8 +198,8 @@ class Connection(Connectable):
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
-          of many DBAPIs.  The flag is currently understood only by the
-          psycopg2 dialect.
+          of many DBAPIs.  The flag is currently understood by the
+          psycopg2, MySQL-Python, pymysql, oursql and pysqlite dialects.
 
         """
         c = self._clone()
@@ -844,6 +844,14 @@ class Connection(Connectable):
                             fn(self, cursor, statement, parameters,
                                         context, context.executemany)
 
+            if context._statement_cache is not None and \
+                    statement != context.statement:
+                # the statement cache is keyed on the compiled
+                # statement; a cursor executing a different one
+                # is neither reused as prepared nor cached
+                context._statement_cache = None
+                context._cursor_prepared = False
+
         if self._echo:
             self.engine.logger.info(statement)
             self.engine.logger.info("%r",
@@ -58,6 +58,11 @@ class DefaultDialect(interfaces.Dialect):
 
     supports_simple_order_by_label = True
 
+    batch_checkfirst = True
+
+    supports_statement_cache = False
+    prepared_statement_cache_size = None
+
     # if the NUMERIC type
     # returns decimal.Decimal.
     # *not* the FLOAT type however.
@@ -95,6 +100,7 @@ class DefaultDialect(interfaces.Dialect):
     supports_default_values = False
     supports_empty_insert = True
     supports_multivalues_insert = False
+    supports_multi_reflection = False
 
     server_version_info = None
 
@@ -112,7 +118,8 @@ class DefaultDialect(interfaces.Dialect):
                  implicit_returning=None,
                  supports_right_nested_joins=None,
                  case_sensitive=True,
-                 label_length=None, **kwargs):
+                 label_length=None,
+                 prepared_statement_cache_size=None, **kwargs):
 
         if not getattr(self, 'ported_sqla_06', True):
             util.warn(
@@ -147,6 +154,14 @@ class DefaultDialect(interfaces.Dialect):
                     (label_length, self.max_identifier_length))
         self.label_length = label_length
 
+        if prepared_statement_cache_size and \
+                not self.supports_statement_cache:
+            raise exc.ArgumentError(
+                    "The %s dialect does not support "
+                    "prepared_statement_cache_size" %
+                    self.dialect_description)
+        self.prepared_statement_cache_size = prepared_statement_cache_size
+
         if self.description_encoding == 'use_encoding':
             self._description_decoder = \
                             processors.to_unicode_processor_factory(
@@ -288,9 +303,72 @@ class DefaultDialect(interfaces.Dialect):
         return sqltypes.adapt_type(typeobj, self.colspecs)
 
     def reflecttable(self, connection, table, include_columns,
-                    exclude_columns=None):
+                    exclude_columns=None, **opts):
         insp = reflection.Inspector.from_engine(connection)
-        return insp.reflecttable(table, include_columns, exclude_columns)
+        return insp.reflecttable(table, include_columns, exclude_columns,
+                                        **opts)
+
+    def _get_multi(self, fn, connection, schema, table_names, **kw):
+        """Default implementation of the get_multi_* methods, calling
+        upon the given single-table method for each table.
+
+        """
+        if table_names is None:
+            table_names = self.get_table_names(connection, schema, **kw)
+        multi = {}
+        for table_name in table_names:
+            try:
+                multi[table_name] = fn(connection, table_name, schema, **kw)
+            except exc.NoSuchTableError:
+                pass
+        return multi
+
+    def get_multi_columns(self, connection, schema=None,
+                                table_names=None, **kw):
+        return self._get_multi(self.get_columns,
+                                connection, schema, table_names, **kw)
+
+    def get_multi_pk_constraint(self, connection, schema=None,
+                                table_names=None, **kw):
+        return self._get_multi(self.get_pk_constraint,
+                                connection, schema, table_names, **kw)
+
+    def get_multi_foreign_keys(self, connection, schema=None,
+                                table_names=None, **kw):
+        return self._get_multi(self.get_foreign_keys,
+                                connection, schema, table_names, **kw)
+
+    def get_multi_indexes(self, connection, schema=None,
+                                table_names=None, **kw):
+        return self._get_multi(self.get_indexes,
+                                connection, schema, table_names, **kw)
+
+    def _get_existing_table_names(self, connection, schema=None):
+        """Return the names of the relations in the given schema which
+        :meth:`.has_table` reports as existing, used by ``checkfirst``
+        operations when ``batch_checkfirst`` is set.
+
+        These are the names of tables and views by default, as
+        :meth:`.has_table` locates views for most dialects.
+
+        """
+        names = list(self.get_table_names(connection, schema))
+        try:
+            names.extend(self.get_view_names(connection, schema))
+        except NotImplementedError:
+            pass
+        return names
+
+    def _get_existing_sequence_names(self, connection, schema=None):
+        """Return the names of the sequences in the given schema which
+        :meth:`.has_sequence` reports as existing, used by ``checkfirst``
+        operations when ``batch_checkfirst`` is set.
+
+        """
+        return self.get_sequence_names(connection, schema)
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        return None
 
     def get_pk_constraint(self, conn, table_name, schema=None, **kw):
         """Compatibility method, adapts the result of get_primary_keys()
@@ -399,6 +477,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     _is_implicit_returning = False
     _is_explicit_returning = False
 
+    _expanded_parameters = util.immutabledict()
+    _expanded_positiontup = None
+
+    # set when the cursor is checked out from the
+    # connection's prepared statement cache
+    _statement_cache = None
+    _cursor_prepared = False
+
     # a hook for SQLite's translation of
     # result column names
     _translate_colname = None
@@ -488,50 +574,150 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
             self.executemany = len(parameters) > 1
 
-        self.cursor = self.create_cursor()
+        if dialect.prepared_statement_cache_size and \
+                not compiled.contains_expanding_parameters:
+            self.cursor = self._checkout_cached_cursor()
+        else:
+            self.cursor = self.create_cursor()
         if self.isinsert or self.isupdate:
             self.postfetch_cols = self.compiled.postfetch
             self.prefetch_cols = self.compiled.prefetch
             self.__process_defaults()
 
-        processors = compiled._bind_processors
+        if compiled.contains_expanding_parameters:
+            positiontup, processors = self._expand_in_parameters(
+                                    compiled, compiled._bind_processors)
+            if dialect.positional:
+                pipeline = [(key, processors.get(key))
+                                for key in positiontup]
+        elif dialect.positional:
+            pipeline = compiled._positional_bind_processors
+        else:
+            processors = compiled._bind_processors
+
+        compiled_parameters = self.compiled_parameters
+
+        if dialect.positional:
+            keys = None
+        else:
+            # all parameter sets share the same keys, as they're
+            # generated from the compiled bind parameters
+            keys = list(compiled_parameters[0])
+            pipeline = [(key, processors.get(key)) for key in keys]
+            if not dialect.supports_unicode_statements:
+                keys = [dialect._encoder(key)[0] for key in keys]
 
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
-        # execute() or executemany() method.
-        parameters = []
-        if dialect.positional:
-            for compiled_params in self.compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
-                parameters.append(dialect.execute_sequence_format(param))
+        # execute() or executemany() method, one column of
+        # values at a time across all parameter sets.
+        columns = [
+            [processor(params[key]) for params in compiled_parameters]
+            if processor is not None
+            else [params[key] for params in compiled_parameters]
+            for key, processor in pipeline
+        ]
+        if columns:
+            rows = list(zip(*columns))
         else:
-            encode = not dialect.supports_unicode_statements
-            for compiled_params in self.compiled_parameters:
-                param = {}
-                if encode:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[dialect._encoder(key)[0]] = \
-                                        processors[key](compiled_params[key])
-                        else:
-                            param[dialect._encoder(key)[0]] = \
-                                    compiled_params[key]
-                else:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key] = processors[key](compiled_params[key])
-                        else:
-                            param[key] = compiled_params[key]
-                parameters.append(param)
+            rows = [()] * len(compiled_parameters)
+
+        if keys is None:
+            if dialect.execute_sequence_format is tuple:
+                parameters = rows
+            else:
+                parameters = [dialect.execute_sequence_format(row)
+                                for row in rows]
+        else:
+            parameters = [dict(zip(keys, row)) for row in rows]
         self.parameters = dialect.execute_sequence_format(parameters)
 
         return self
 
+    def _expand_in_parameters(self, compiled, processors):
+        """Render "expanding" bind parameters into the statement as
+        one placeholder per element of their sequence value.
+
+        Returns the positional names to be used for this execution
+        along with the bind processors dictionary, extended to
+        include the newly generated parameter names.
+
+        """
+        if self.executemany:
+            raise exc.InvalidRequestError(
+                "'expanding' parameters can't be used with "
+                "executemany()")
+        if compiled.positional and \
+                self.dialect.paramstyle == 'numeric':
+            raise exc.CompileError(
+                "'expanding' parameters are not supported with "
+                "the 'numeric' paramstyle")
+
+        compiled_params = self.compiled_parameters[0]
+        processors = dict(processors)
+        positiontup = [] if compiled.positional else None
+        expanded_parameters = {}
+        replacement_expressions = {}
+        empty_in_expressions = compiled._empty_in_expressions
+        empty_in_occurrences = {}
+        statement = self.unicode_statement
+
+        if compiled.positional:
+            names = compiled.positiontup
+        else:
+            names = compiled.bind_names.values()
+
+        for name in names:
+            parameter = compiled.binds[name]
+            if not parameter.expanding:
+                if compiled.positional:
+                    positiontup.append(name)
+                continue
+
+            if name in expanded_parameters:
+                to_update = expanded_parameters[name]
+            else:
+                values = compiled_params.pop(name)
+                to_update = expanded_parameters[name] = \
+                            ["%s_%d" % (name, i)
+                                for i in range(1, len(values) + 1)]
+                compiled_params.update(zip(to_update, values))
+                if name in processors:
+                    processors.update(
+                            (key, processors[name]) for key in to_update)
+                replacement_expressions[name] = ", ".join(
+                            compiled.bindtemplate % {'name': key}
+                            for key in to_update) or "NULL"
+                if not to_update:
+                    # an empty sequence; the IN expression is replaced
+                    # with a comparison of its left side to itself
+                    for text, empty_text, left_names in \
+                            empty_in_expressions.get(name, ()):
+                        statement = statement.replace(text, empty_text)
+            if compiled.positional:
+                positiontup.extend(to_update)
+                if not to_update and name in empty_in_expressions:
+                    # the second rendering of the left side directly
+                    # follows the first
+                    idx = empty_in_occurrences.get(name, 0)
+                    empty_in_occurrences[name] = idx + 1
+                    positiontup.extend(empty_in_expressions[name][idx][2])
+
+        self._expanded_parameters = expanded_parameters
+        self._expanded_positiontup = positiontup
+
+        self.unicode_statement = re.sub(
+                        r"\[EXPANDING_(\S+?)\]",
+                        lambda m: replacement_expressions[m.group(1)],
+                        statement)
+        if not self.dialect.supports_unicode_statements:
+            self.statement = self.unicode_statement.encode(
+                                        self.dialect.encoding)
+        else:
+            self.statement = self.unicode_statement
+
+        return positiontup, processors
+
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
                                                     statement, parameters):
@@ -631,6 +817,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         else:
             default_params = {}
 
+        self._cursor_prepared = False
         conn._cursor_execute(self.cursor, stmt, default_params, context=self)
         r = self.cursor.fetchone()[0]
         if type_ is not None:
@@ -653,6 +840,49 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     def create_cursor(self):
         return self._dbapi_connection.cursor()
 
+    def _checkout_cached_cursor(self):
+        """Return a cursor for this context's statement from the
+        connection's statement cache, if one is present, else a
+        new cursor which will be added to the cache when the result
+        is closed.
+
+        The cache holds cursors which aren't in use by any result,
+        keyed on the statement each one last executed, so that
+        DBAPIs which keep the statement prepared on the cursor can
+        execute it again without the database parsing it again.
+        It's stored in ``connection.info``, which is reset when
+        the connection is invalidated.
+
+        """
+        info = self._dbapi_connection.info
+        cache = info.get('prepared_statement_cache')
+        if cache is None:
+            cache = info['prepared_statement_cache'] = util.OrderedDict()
+        self._statement_cache = cache
+
+        cursor = cache.pop(self.statement, None)
+        if cursor is not None:
+            self._cursor_prepared = True
+            return cursor
+        else:
+            return self.create_cursor()
+
+    def _checkin_cached_cursor(self):
+        """Return this context's cursor to the connection's statement
+        cache, closing the least recently used cursor if the cache is
+        full.
+
+        """
+        conn = self.root_connection
+        cache = self._statement_cache
+        if not self._dbapi_connection.is_valid or self.statement in cache:
+            conn._safe_close_cursor(self.cursor)
+            return
+
+        cache[self.statement] = self.cursor
+        if len(cache) > self.dialect.prepared_statement_cache_size:
+            conn._safe_close_cursor(cache.pop(next(iter(cache))))
+
     def pre_exec(self):
         pass
 
@@ -772,9 +1002,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                 (self.compiled.bind_names[bindparam], bindparam.type)
                  for bindparam in self.compiled.bind_names)
 
+        for name, expanded in self._expanded_parameters.items():
+            type_ = types.pop(name)
+            types.update((key, type_) for key in expanded)
+
         if self.dialect.positional:
             inputsizes = []
-            for key in self.compiled.positiontup:
+            for key in self._expanded_positiontup or \
+                    self.compiled.positiontup:
                 typeengine = types[key]
                 dbtype = typeengine.dialect_impl(self.dialect).\
                                     get_dbapi_type(self.dialect.dbapi)
@@ -788,7 +1023,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                                 e, None, None, None, self)
         else:
             inputsizes = {}
-            for key in self.compiled.bind_names.values():
+            for key in types:
                 typeengine = types[key]
                 dbtype = typeengine.dialect_impl(self.dialect).\
                                 get_dbapi_type(self.dialect.dbapi)
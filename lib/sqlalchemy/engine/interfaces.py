@@ -128,6 +128,11 @@ class Dialect(object):
       Indicates if the construct ``INSERT INTO tablename DEFAULT
       VALUES`` is supported
 
+    supports_multi_reflection
+      Indicates if the ``get_multi_*`` methods retrieve information
+      about many tables using a fixed number of queries, rather than
+      querying each table individually.
+
     supports_sequences
       Indicates if the dialect supports CREATE SEQUENCE or similar.
 
@@ -148,6 +153,23 @@ class Dialect(object):
       This will prevent types.Boolean from generating a CHECK
       constraint when that type is used.
 
+    batch_checkfirst
+      If True, ``checkfirst`` operations such as
+      :meth:`.MetaData.create_all` determine which tables and sequences
+      exist using lists of names fetched once per schema, rather than
+      calling :meth:`.has_table` and :meth:`.has_sequence` for each
+      object.  The names of tables are those of all relations which
+      :meth:`.has_table` locates, by default those reported by
+      :meth:`.get_table_names` and :meth:`.get_view_names`; dialects
+      where :meth:`.has_table` differs override the private
+      ``_get_existing_table_names()`` method accordingly.
+
+    supports_statement_cache
+      Indicates if the ``prepared_statement_cache_size`` option is
+      supported, i.e. if the DBAPI keeps a statement prepared on a
+      cursor such that it can be executed again on that cursor without
+      being parsed by the database again.
+
     """
 
     def create_connect_args(self, url):
@@ -193,14 +215,21 @@ class Dialect(object):
 
         pass
 
-    def reflecttable(self, connection, table, include_columns=None):
+    def reflecttable(self, connection, table, include_columns,
+                                exclude_columns=None, **kw):
         """Load table description from the database.
 
         Given a :class:`.Connection` and a
         :class:`~sqlalchemy.schema.Table` object, reflect its columns and
         properties from the database.  If include_columns (a list or
         set) is specified, limit the autoload to the given column
-        names.
+        names; columns named in exclude_columns are skipped.
+
+        Additional keyword arguments may be passed by
+        :meth:`.MetaData.reflect`, such as table information which it
+        fetched for many tables at once; implementations should accept
+        ``**kw`` and pass them along to
+        :meth:`.Inspector.reflecttable`.
 
         The default implementation uses the
         :class:`~sqlalchemy.engine.reflection.Inspector` interface to
@@ -297,11 +326,104 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_multi_columns(self, connection, schema=None,
+                                table_names=None, **kw):
+        """Return information about columns in many tables at once.
+
+        Given a :class:`.Connection`, an optional string `schema` and
+        an optional list of `table_names`, return a dictionary mapping
+        each table name to a list of column dictionaries as returned by
+        :meth:`.Dialect.get_columns`.  If `table_names` is None, all
+        tables in the schema are included.  Tables which don't exist are
+        omitted from the result.
+
+        The default implementation calls :meth:`.Dialect.get_columns`
+        for each table; dialects may instead retrieve the information
+        for all tables in one query.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(self, connection, schema=None,
+                                table_names=None, **kw):
+        """Return information about the primary key constraints of many
+        tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary as
+        returned by :meth:`.Dialect.get_pk_constraint`.  See
+        :meth:`.Dialect.get_multi_columns`.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(self, connection, schema=None,
+                                table_names=None, **kw):
+        """Return information about the foreign keys of many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_foreign_keys`.  See
+        :meth:`.Dialect.get_multi_columns`.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(self, connection, schema=None,
+                                table_names=None, **kw):
+        """Return information about the indexes of many tables at once.
+
+        Returns a dictionary mapping each table name to a list as
+        returned by :meth:`.Dialect.get_indexes`.  See
+        :meth:`.Dialect.get_multi_columns`.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a value which changes whenever the definition of any
+        table or view in `schema` changes, or None if the dialect has no
+        inexpensive way of producing one.
+
+        The value is used to validate reflection information stored
+        by a :class:`.ReflectionCache`; it should be cheap to compute
+        relative to reflecting the schema, should support equality
+        comparison, and should be picklable.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
     def get_table_names(self, connection, schema=None, **kw):
         """Return a list of table names for `schema`."""
 
         raise NotImplementedError
 
+    def get_sequence_names(self, connection, schema=None, **kw):
+        """Return a list of all sequence names available in the database.
+
+        schema:
+          Optional, retrieve names from a non-default schema.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        raise NotImplementedError()
+
     def get_view_names(self, connection, schema=None, **kw):
         """Return a list of all view names available in the database.
 
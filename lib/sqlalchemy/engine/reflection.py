@@ -24,6 +24,12 @@ methods such as get_table_names, get_columns, etc.
    'name' attribute..
 """
 
+import copy
+import hashlib
+import os
+import sys
+import tempfile
+
 from .. import exc, sql
 from ..sql import schema as sa_schema
 from .. import util
@@ -222,6 +228,18 @@ class Inspector(object):
         return self.dialect.get_view_names(self.bind, schema,
                                                   info_cache=self.info_cache)
 
+    def get_sequence_names(self, schema=None):
+        """Return all sequence names in `schema`.
+
+        :param schema: Optional, retrieve names from a non-default schema.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        return self.dialect.get_sequence_names(self.bind, schema,
+                                                  info_cache=self.info_cache)
+
     def get_view_definition(self, view_name, schema=None):
         """Return definition for `view_name`.
 
@@ -361,7 +379,196 @@ class Inspector(object):
         return self.dialect.get_unique_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw)
 
-    def reflecttable(self, table, include_columns, exclude_columns=()):
+    def get_multi_columns(self, schema=None, table_names=None, **kw):
+        """Return information about columns in many tables at once.
+
+        Given an optional string `schema` and an optional list of
+        `table_names`, return a dictionary mapping each table name to
+        its column information, in the same format as that of
+        :meth:`.Inspector.get_columns`.  If `table_names` is omitted,
+        all tables in the schema are included.  Names of tables that
+        don't exist are not present in the result.
+
+        Dialects which support it retrieve the information for all
+        tables using a single query.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        multi = self.dialect.get_multi_columns(self.bind, schema,
+                                            table_names,
+                                            info_cache=self.info_cache,
+                                            **kw)
+        for col_defs in multi.values():
+            for col_def in col_defs:
+                coltype = col_def['type']
+                if not isinstance(coltype, TypeEngine):
+                    col_def['type'] = coltype()
+        return multi
+
+    def get_multi_pk_constraint(self, schema=None, table_names=None, **kw):
+        """Return information about the primary key constraints of many
+        tables at once.
+
+        Returns a dictionary mapping each table name to its primary key
+        information, in the same format as that of
+        :meth:`.Inspector.get_pk_constraint`.  See
+        :meth:`.Inspector.get_multi_columns` for a description of
+        the arguments.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        return self.dialect.get_multi_pk_constraint(self.bind, schema,
+                                            table_names,
+                                            info_cache=self.info_cache,
+                                            **kw)
+
+    def get_multi_foreign_keys(self, schema=None, table_names=None, **kw):
+        """Return information about the foreign keys of many tables
+        at once.
+
+        Returns a dictionary mapping each table name to its foreign key
+        information, in the same format as that of
+        :meth:`.Inspector.get_foreign_keys`.  See
+        :meth:`.Inspector.get_multi_columns` for a description of
+        the arguments.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        return self.dialect.get_multi_foreign_keys(self.bind, schema,
+                                            table_names,
+                                            info_cache=self.info_cache,
+                                            **kw)
+
+    def get_multi_indexes(self, schema=None, table_names=None, **kw):
+        """Return information about the indexes of many tables at once.
+
+        Returns a dictionary mapping each table name to its index
+        information, in the same format as that of
+        :meth:`.Inspector.get_indexes`.  See
+        :meth:`.Inspector.get_multi_columns` for a description of
+        the arguments.
+
+        .. versionadded:: 0.9.0
+
+        """
+
+        return self.dialect.get_multi_indexes(self.bind, schema,
+                                            table_names,
+                                            info_cache=self.info_cache,
+                                            **kw)
+
+    def _get_reflection_info(self, schema=None, table_names=None,
+                                                    parallel=None):
+        """Fetch everything needed by :meth:`.Inspector.reflecttable`
+        for the given tables up front, using the ``get_multi_*`` methods.
+
+        The result is passed to :meth:`.Inspector.reflecttable` as the
+        ``_reflect_info`` argument.
+
+        If ``parallel`` is greater than one, the table names are divided
+        among that many threads, each of which fetches the information
+        for its share using its own connection from the engine.  This
+        is skipped for dialects with ``supports_multi_reflection``,
+        which fetch each kind of information for all the tables in one
+        query; further connections would only add to the round trips.
+
+        """
+        if parallel and parallel > 1 and table_names and \
+                len(table_names) > 1 and \
+                not self.dialect.supports_multi_reflection:
+            return self._get_reflection_info_parallel(
+                                    schema, table_names, parallel)
+
+        return {
+            'schema': schema,
+            'columns': self.get_multi_columns(schema, table_names),
+            'pk_constraint': self.get_multi_pk_constraint(
+                                            schema, table_names),
+            'foreign_keys': self.get_multi_foreign_keys(
+                                            schema, table_names),
+            'indexes': self.get_multi_indexes(schema, table_names)
+        }
+
+    def _get_reflection_info_parallel(self, schema, table_names, parallel):
+        shards = [
+            table_names[i::parallel]
+            for i in range(min(parallel, len(table_names)))
+        ]
+        results = [None] * len(shards)
+        errors = []
+
+        def go(index):
+            try:
+                with self.engine.connect() as conn:
+                    insp = Inspector.from_engine(conn)
+                    results[index] = insp._get_reflection_info(
+                                                schema, shards[index])
+            except Exception:
+                errors.append(sys.exc_info())
+
+        threads = [
+            util.threading.Thread(target=go, args=(index, ))
+            for index in range(len(shards))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            util.reraise(*errors[0])
+
+        # merge in the order of the shards, rather than the order in
+        # which the threads completed
+        info = {'schema': schema}
+        for result in results:
+            for key in ('columns', 'pk_constraint',
+                            'foreign_keys', 'indexes'):
+                info.setdefault(key, {}).update(result[key])
+        return info
+
+    def _get_cached_reflection_info(self, reflection_cache, schema=None,
+                                                views=False, parallel=None):
+        """Return a tuple of the names of all tables in a schema, along
+        with views if ``views`` is True, and the result of
+        :meth:`.Inspector._get_reflection_info` for all of them.
+
+        The result is taken from the given :class:`.ReflectionCache` if
+        the fingerprint stored along with it matches that of the schema,
+        else it is fetched from the database and stored.  Returns None
+        if the dialect doesn't support schema fingerprints.
+
+        """
+        fingerprint = self.dialect.get_schema_fingerprint(self.bind, schema)
+        if fingerprint is None:
+            return None
+
+        url = copy.copy(self.engine.url)
+        url.password = None
+        key = (str(url), schema, views)
+
+        cached = reflection_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # the fingerprint is taken first, so that a schema change
+        # occurring while reflecting produces a mismatch the next time
+        table_names = self.get_table_names(schema)
+        if views:
+            table_names = table_names + self.get_view_names(schema)
+        info = (table_names, self._get_reflection_info(
+                                    schema, table_names, parallel=parallel))
+        reflection_cache.set(key, (fingerprint, info))
+        return info
+
+    def reflecttable(self, table, include_columns, exclude_columns=(),
+                                            _reflect_info=None):
         """Given a Table object, load its internal constructs based on
         introspection.
 
@@ -409,9 +616,26 @@ class Inspector(object):
             if isinstance(table_name, str):
                 table_name = table_name.decode(dialect.encoding)
 
+        # use information fetched up front for many tables at once,
+        # if present for this table
+        if _reflect_info is not None and \
+                _reflect_info['schema'] == schema and \
+                table_name in _reflect_info['columns']:
+            reflected = dict(
+                (key, _reflect_info[key].get(table_name))
+                for key in ('columns', 'pk_constraint',
+                            'foreign_keys', 'indexes')
+            )
+            reflection_options['_reflect_info'] = _reflect_info
+        else:
+            reflected = {}
+
         # columns
         found_table = False
-        for col_d in self.get_columns(table_name, schema, **tblkw):
+        col_defs = reflected.get('columns')
+        if col_defs is None:
+            col_defs = self.get_columns(table_name, schema, **tblkw)
+        for col_d in col_defs:
             found_table = True
             table.dispatch.column_reflect(self, table, col_d)
 
@@ -457,7 +681,10 @@ class Inspector(object):
             raise exc.NoSuchTableError(table.name)
 
         # Primary keys
-        pk_cons = self.get_pk_constraint(table_name, schema, **tblkw)
+        if 'pk_constraint' in reflected:
+            pk_cons = reflected['pk_constraint']
+        else:
+            pk_cons = self.get_pk_constraint(table_name, schema, **tblkw)
         if pk_cons:
             pk_cols = [
                 table.c[pk]
@@ -477,7 +704,10 @@ class Inspector(object):
             table.append_constraint(primary_key_constraint)
 
         # Foreign keys
-        fkeys = self.get_foreign_keys(table_name, schema, **tblkw)
+        if 'foreign_keys' in reflected:
+            fkeys = reflected['foreign_keys'] or []
+        else:
+            fkeys = self.get_foreign_keys(table_name, schema, **tblkw)
         for fkey_d in fkeys:
             conname = fkey_d['name']
             constrained_columns = fkey_d['constrained_columns']
@@ -508,7 +738,10 @@ class Inspector(object):
                 sa_schema.ForeignKeyConstraint(constrained_columns, refspec,
                                                conname, link_to_name=True))
         # Indexes
-        indexes = self.get_indexes(table_name, schema)
+        if 'indexes' in reflected:
+            indexes = reflected['indexes'] or []
+        else:
+            indexes = self.get_indexes(table_name, schema)
         for index_d in indexes:
             name = index_d['name']
             columns = index_d['column_names']
@@ -522,3 +755,89 @@ class Inspector(object):
                 continue
             sa_schema.Index(name, *[table.columns[c] for c in columns],
                          **dict(unique=unique))
+
+
+class ReflectionCache(object):
+    """Stores reflection information across processes, for use by
+    :meth:`.MetaData.reflect`.
+
+    Entries are keyed on the database URL, schema name and whether or
+    not views are included, and are stored along with a fingerprint
+    of the schema as provided by the dialect; when the fingerprint
+    no longer matches, the schema is reflected again and the entry
+    replaced.  Dialects which can't provide a fingerprint don't make use
+    of the cache.
+
+    Subclasses implement :meth:`.get` and :meth:`.set` in terms of a
+    particular storage; see :class:`.FileReflectionCache`.
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    def get(self, key):
+        """Return the value stored for the given key, or None."""
+
+        raise NotImplementedError()
+
+    def set(self, key, value):
+        """Store a picklable value for the given key, a tuple of
+        strings."""
+
+        raise NotImplementedError()
+
+
+class FileReflectionCache(ReflectionCache):
+    """A :class:`.ReflectionCache` which stores each entry as a pickle
+    file within a directory::
+
+        from sqlalchemy.engine.reflection import FileReflectionCache
+
+        cache = FileReflectionCache("/var/cache/myapp/reflection")
+        metadata.reflect(engine, reflection_cache=cache)
+
+    The directory is created if it doesn't exist.
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, "%s.pickle" %
+                        hashlib.sha1(repr(key).encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as file_:
+                return util.pickle.load(file_)
+        except Exception:
+            # missing, or unreadable such as written by an incompatible
+            # version; either way, reflect again.
+            return None
+
+    def set(self, key, value):
+        tmp = None
+        try:
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory)
+            fd, tmp = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as file_:
+                util.pickle.dump(value, file_, util.pickle.HIGHEST_PROTOCOL)
+
+            # rename into place, so that a partially written
+            # file is never read.
+            path = self._path(key)
+            try:
+                os.rename(tmp, path)
+            except OSError:
+                # windows won't rename over an existing file
+                os.remove(path)
+                os.rename(tmp, path)
+        except Exception as e:
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+            util.warn("Could not store reflection information "
+                        "in %s: %s" % (self.directory, e))
@@ -168,6 +168,10 @@ class ResultMetaData(object):
     """Handle cursor.description, applying additional info from an execution
     context."""
 
+    # set when the metadata is cached on a Compiled object and
+    # shared among the results of its executions
+    _shared = False
+
     def __init__(self, parent, metadata):
         self._processors = processors = []
 
@@ -251,10 +255,6 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
-        if parent._echo:
-            context.engine.logger.debug(
-                "Col %r", tuple(x[0] for x in metadata))
-
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                     "_translate_colname() now")
     def _set_keymap_synonym(self, name, origname):
@@ -314,7 +314,9 @@ class ResultMetaData(object):
                         expression._string_or_unprintable(key))
             else:
                 return None
-        else:
+        elif not self._shared:
+            # a shared keymap lives as long as the compiled cache
+            # entry, so arbitrary fallback keys aren't added to it
             map[key] = result
         return result
 
@@ -374,6 +376,11 @@ class ResultProxy(object):
     out_parameters = None
     _can_close_connection = False
     _metadata = None
+    _cursor_values = None
+
+    # subclasses which modify their ResultMetaData can't share it
+    # with other executions of a cached statement
+    _cache_metadata = True
 
     def __init__(self, context):
         self.context = context
@@ -388,7 +395,43 @@ class ResultProxy(object):
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            self._metadata = ResultMetaData(self, metadata)
+            context = self.context
+            if self._cache_metadata and \
+                    context.compiled is not None and \
+                    'compiled_cache' in context.execution_options:
+                self._metadata = self._cached_metadata(
+                                        context, metadata)
+            else:
+                self._metadata = ResultMetaData(self, metadata)
+
+            if self._echo:
+                context.engine.logger.debug(
+                    "Col %r", tuple(x[0] for x in metadata))
+
+    def _cached_metadata(self, context, metadata):
+        """Return a :class:`.ResultMetaData` for a statement
+        that's been retrieved from a "compiled cache", shared among all
+        executions of the compiled statement having the same
+        cursor.description.
+
+        """
+        compiled = context.compiled
+        cache = compiled._cached_metadata
+        if cache is None:
+            cache = compiled._cached_metadata = {}
+
+        key = (context.dialect,
+                    context._translate_colname is None,
+                    tuple(metadata))
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = result_metadata = ResultMetaData(self, metadata)
+            result_metadata._shared = True
+            return result_metadata
+        except TypeError:
+            # unhashable cursor.description
+            return ResultMetaData(self, metadata)
 
     def keys(self):
         """Return the current set of string keys for rows."""
@@ -438,6 +481,8 @@ class ResultProxy(object):
              rowcount.
 
         """
+        if self._cursor_values is not None:
+            return self._cursor_values[0]
         try:
             return self.context.rowcount
         except Exception as e:
@@ -460,6 +505,8 @@ class ResultProxy(object):
         regardless of database backend.
 
         """
+        if self._cursor_values is not None:
+            return self._cursor_values[1]
         try:
             return self._saved_cursor.lastrowid
         except Exception as e:
@@ -519,7 +566,17 @@ class ResultProxy(object):
 
         if not self.closed:
             self.closed = True
-            self.connection._safe_close_cursor(self.cursor)
+            if self.context._statement_cache is not None:
+                # the cursor may be used by another execution once
+                # it's back in the cache; keep the values which
+                # are read from it after the result is closed
+                self._cursor_values = (
+                    self.rowcount,
+                    getattr(self.cursor, 'lastrowid', None)
+                )
+                self.context._checkin_cached_cursor()
+            else:
+                self.connection._safe_close_cursor(self.cursor)
             if _autoclose_connection and \
                 self.connection.should_close_with_result:
                 self.connection.close()
@@ -958,6 +1015,7 @@ class BufferedColumnResultProxy(ResultProxy):
     """
 
     _process_row = BufferedColumnRow
+    _cache_metadata = False
 
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
@@ -65,6 +65,7 @@ from . import mapper as mapperlib
 from .query import AliasOption, Query
 from ..util.langhelpers import public_factory
 from .. import util as _sa_util
+from .. import exc as _sa_exc
 from . import strategies as _strategies
 
 def create_session(bind=None, **kwargs):
@@ -582,6 +583,54 @@ def undefer(*key):
     return _strategies.DeferredOption(key, defer=False)
 
 
+def load_only(*attrs):
+    """Return a :class:`.MapperOption` that will load only the given
+    column-based attributes of an entity, deferring all others.
+
+    Used with :meth:`.Query.options`.
+
+    e.g.::
+
+        from sqlalchemy.orm import load_only
+
+        query(MyClass).options(load_only("attribute_one", "attribute_two"))
+
+    A class bound descriptor is also accepted::
+
+        query(MyClass).options(
+                    load_only(MyClass.attribute_one, MyClass.attribute_two))
+
+    A dotted name will apply the option to a related object when
+    loaded; all attributes must refer to the same entity::
+
+        query(MyClass).options(
+                    load_only("related.attribute_one",
+                                "related.attribute_two"))
+
+    Primary key, polymorphic discriminator and version id columns
+    are always loaded.  The set of columns to be deferred for a given
+    group of attribute names is computed once per mapper and cached.
+
+    .. versionadded:: 0.9.0
+
+    See also:
+
+    :func:`.orm.defer`
+
+    :ref:`deferred`
+
+    :param \*attrs: Attributes to be loaded; unlike :func:`.orm.defer`,
+     each entry is a separate target attribute on the same entity.
+     :class:`.ArgumentError` is raised if they refer to different
+     entities or paths.
+
+    """
+    if not attrs:
+        raise _sa_exc.ArgumentError(
+                    "load_only() requires at least one attribute")
+    return _strategies.LoadOnlyOption(attrs)
+
+
 def undefer_group(name):
     """Return a :class:`.MapperOption` that will convert the given group of
     deferred column properties into a non-deferred (regular column) load.
@@ -184,6 +184,100 @@ class WeakInstanceDict(IdentityMap):
         return 0
 
 
+class LRUInstanceDict(WeakInstanceDict):
+    """A weak-referencing identity map which additionally maintains
+    strong references to a bounded number of recently used objects.
+
+    The :class:`.WeakInstanceDict` releases objects as soon as they
+    fall out of scope in the application, which means that a long-lived
+    :class:`.Session` will re-load the same rows repeatedly, while the
+    deprecated strong-referencing map grows without bound.
+    :class:`.LRUInstanceDict` holds on to the ``capacity`` most recently
+    added or accessed objects; when the number of strong references grows
+    past ``capacity + capacity * threshold``, the least recently used
+    references are released down to ``capacity``.  A released object
+    which is no longer referenced elsewhere is then garbage collected and
+    removed from the map in the same way as with :class:`.WeakInstanceDict`;
+    objects with pending changes remain strongly referenced by their
+    :class:`.InstanceState` until flushed, so that only clean, persistent
+    objects are ever evicted.
+
+    Usage is via the ``identity_cls`` argument to :class:`.Session`::
+
+        from functools import partial
+        from sqlalchemy.orm.identity import LRUInstanceDict
+
+        Session = sessionmaker(
+                    identity_cls=partial(LRUInstanceDict, capacity=5000))
+
+    .. versionadded:: 0.9.0
+
+    """
+
+    def __init__(self, capacity=1000, threshold=.5):
+        WeakInstanceDict.__init__(self)
+        self.capacity = capacity
+        self.threshold = threshold
+        self._counter = 0
+        self._recent = {}
+
+    def _touch(self, state, obj):
+        self._counter += 1
+        item = self._recent.get(state)
+        if item is None:
+            self._recent[state] = [obj, self._counter]
+            self._manage_size()
+        else:
+            item[1] = self._counter
+
+    def _manage_size(self):
+        if len(self._recent) > self.capacity + \
+                self.capacity * self.threshold:
+            by_counter = sorted(self._recent.items(),
+                            key=lambda item: item[1][1],
+                            reverse=True)
+            for state, item in by_counter[self.capacity:]:
+                self._recent.pop(state, None)
+
+    def __getitem__(self, key):
+        state = dict.__getitem__(self, key)
+        o = state.obj()
+        if o is None:
+            raise KeyError(key)
+        self._touch(state, o)
+        return o
+
+    def get(self, key, default=None):
+        state = dict.get(self, key, None)
+        if state is None:
+            return default
+        o = state.obj()
+        if o is None:
+            return default
+        self._touch(state, o)
+        return o
+
+    def _manage_incoming_state(self, state):
+        WeakInstanceDict._manage_incoming_state(self, state)
+        o = state.obj()
+        if o is not None:
+            self._touch(state, o)
+
+    def _manage_removed_state(self, state):
+        WeakInstanceDict._manage_removed_state(self, state)
+        self._recent.pop(state, None)
+
+    def prune(self):
+        """Release all strong references held by this map.
+
+        Returns the number of objects removed from the map as a result.
+
+        """
+        ref_count = len(self)
+        self._recent.clear()
+        return ref_count - len(self)
+
+
 class StrongInstanceDict(IdentityMap):
     def all_states(self):
         return [attributes.instance_state(o) for o in self.values()]
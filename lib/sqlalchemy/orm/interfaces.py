@@ -606,7 +606,7 @@ class PropertyOption(MapperOption):
         tokens = deque(self.key)
         while tokens:
             token = tokens.popleft()
-            if isinstance(token, str):
+            if isinstance(token, util.string_types):
                 # wildcard token
                 if token.endswith(':*'):
                     return [path.token(token)]
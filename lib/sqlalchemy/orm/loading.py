@@ -13,7 +13,7 @@ as well as some of the attribute loading strategies.
 """
 
 
-from .. import util
+from .. import util, sql
 from . import attributes, exc as orm_exc, state as statelib
 from .interfaces import EXT_CONTINUE
 from ..sql import util as sql_util
@@ -226,6 +226,48 @@ def load_on_ident(query, key,
         return None
 
 
+def load_on_idents(query, keys, chunksize):
+    """Load the given identity keys from the database, using one
+    SELECT per ``chunksize`` keys.
+
+    Returns a dictionary of identity key to instance for those
+    keys which were located.
+
+    """
+    mapper = query._mapper_zero()
+    pk_cols = mapper.primary_key
+
+    q = query._clone()
+    q._get_condition()
+    q._get_options(version_check=(q._lockmode is not None))
+
+    result = {}
+    for start in range(0, len(keys), chunksize):
+        chunk = keys[start:start + chunksize]
+
+        if len(pk_cols) == 1:
+            values = [ident[0] for cls, ident in chunk
+                            if ident[0] is not None]
+            if not values:
+                continue
+            criterion = pk_cols[0].in_(values)
+        else:
+            criterion = sql.or_(*[
+                            sql.and_(*[
+                                col == value
+                                for col, value in zip(pk_cols, ident)
+                            ])
+                            for cls, ident in chunk
+                        ])
+
+        chunk_q = q._clone()
+        chunk_q._criterion = chunk_q._adapt_clause(criterion, True, False)
+
+        for instance in chunk_q:
+            result[attributes.instance_state(instance).key] = instance
+    return result
+
+
 def instance_processor(mapper, context, path, adapter,
                             polymorphic_from=None,
                             only_load_props=None,
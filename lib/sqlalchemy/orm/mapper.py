@@ -109,6 +109,7 @@ class Mapper(_InspectionAttr):
                  column_prefix=None,
                  include_properties=None,
                  exclude_properties=None,
+                 load_only=None,
                  passive_updates=True,
                  eager_defaults=False,
                  legacy_is_orphan=False,
@@ -270,6 +271,20 @@ class Mapper(_InspectionAttr):
             is added to :func:`.orm.mapper` which re-establishes the
             legacy behavior.
 
+        :param load_only: A list or set of string attribute names which
+          establishes the "default column set" for this mapper.  All
+          other column-based attributes local to this mapper are
+          configured as deferred, as though :func:`.orm.deferred` had been
+          used for each one; primary key, polymorphic discriminator
+          and version id columns are always loaded.   Individual queries
+          may further adjust the columns loaded using the
+          :func:`.orm.load_only`, :func:`.orm.defer` and
+          :func:`.orm.undefer` options.
+
+          .. versionadded:: 0.9.0
+
+          See :ref:`deferred` for background on deferred columns.
+
         :param non_primary: Specify that this :class:`.Mapper` is in addition
           to the "primary" mapper, that is, the one used for persistence.
           The :class:`.Mapper` created here may be used for ad-hoc
@@ -548,6 +563,10 @@ class Mapper(_InspectionAttr):
             self.exclude_properties = util.to_set(exclude_properties)
         else:
             self.exclude_properties = None
+        if load_only is not None:
+            self.load_only = util.to_set(load_only)
+        else:
+            self.load_only = None
 
         self.configured = False
 
@@ -1600,6 +1619,9 @@ class Mapper(_InspectionAttr):
         """
 
         self._log("_post_configure_properties() started")
+        if self.load_only is not None:
+            self._configure_load_only()
+
         l = [(key, prop) for key, prop in self._props.items()]
         for key, prop in l:
             self._log("initialize prop %s", key)
@@ -1633,6 +1655,91 @@ class Mapper(_InspectionAttr):
         self._init_properties[key] = prop
         self._configure_property(key, prop, init=self.configured)
 
+    def _configure_load_only(self):
+        """Configure as deferred all column-based properties local
+        to this mapper which aren't named in the ``load_only``
+        collection.
+
+        """
+        for key in self.load_only:
+            if key not in self._props:
+                raise sa_exc.ArgumentError(
+                    "Mapper %s has no property '%s' named in the "
+                    "'load_only' collection" % (self, key))
+
+        required = self._load_only_required_columns
+        for prop in self._props.values():
+            if prop.parent is self and \
+                    not prop._configure_started and \
+                    isinstance(prop, properties.ColumnProperty) and \
+                    not prop.deferred and \
+                    prop.key not in self.load_only and \
+                    not required.intersection(prop.columns):
+                prop.deferred = True
+                prop.strategy_class = prop._strategy_lookup(
+                                            deferred=True,
+                                            instrument=prop.instrument)
+
+    @_memoized_configured_property
+    def _load_only_required_columns(self):
+        """The set of columns which can't be deferred by
+        ``load_only``, across this mapper and its descendants.
+
+        """
+        cols = set()
+        for mapper in self.self_and_descendants:
+            for pks in mapper._pks_by_table.values():
+                cols.update(pks)
+            if mapper.polymorphic_on is not None:
+                cols.add(mapper.polymorphic_on)
+            if mapper.version_id_col is not None:
+                cols.add(mapper.version_id_col)
+        return cols
+
+    @_memoized_configured_property
+    def _load_only_cache(self):
+        return {}
+
+    def _load_only_props(self, keys):
+        """Given a collection of attribute keys, return a tuple
+        ``(load, defer)`` of column-based properties across this mapper
+        and its descendants which should be loaded and deferred,
+        respectively, in order to load only the given attributes.
+
+        The result is cached per distinct set of keys, so that
+        repeated :func:`.orm.load_only` options against the same
+        mapper only perform this search once.
+
+        """
+        keys = frozenset(keys)
+        try:
+            return self._load_only_cache[keys]
+        except KeyError:
+            pass
+
+        props = util.OrderedSet()
+        for mapper in self.self_and_descendants:
+            props.update(mapper._props.values())
+
+        for key in keys:
+            if not any(prop.key == key for prop in props):
+                raise sa_exc.ArgumentError(
+                    "Can't find property named '%s' on the "
+                    "mapped entity %s in this Query. " % (key, self))
+
+        required = self._load_only_required_columns
+        load, defer = [], []
+        for prop in props:
+            if not isinstance(prop, properties.ColumnProperty):
+                continue
+            if prop.key in keys or required.intersection(prop.columns):
+                load.append(prop)
+            else:
+                defer.append(prop)
+
+        self._load_only_cache[keys] = result = (tuple(load), tuple(defer))
+        return result
+
     def _expire_memoizations(self):
         for mapper in self.iterate_to_root():
             _memoized_configured_property.expire_instance(mapper)
@@ -1992,6 +2099,21 @@ class Mapper(_InspectionAttr):
             if isinstance(v, type_)
         ))
 
+    @_memoized_configured_property
+    def _propkey_to_col(self):
+        """A dictionary of table -> {attribute key: [columns]}, mapping
+        the key of each column-based attribute to the columns of each
+        table which it's mapped to.
+
+        """
+        result = {}
+        for table, cols in self._cols_by_table.items():
+            by_key = result[table] = {}
+            for col in cols:
+                by_key.setdefault(
+                        self._columntoproperty[col].key, []).append(col)
+        return result
+
     @_memoized_configured_property
     def _get_clause(self):
         """create a "get clause" based on the primary key.  this is used
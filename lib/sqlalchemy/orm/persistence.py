@@ -286,6 +286,8 @@ def _collect_update_commands(base_mapper, uowtransaction,
     """
 
     update = []
+    histories = _collect_column_histories(table, states_to_update)
+
     for state, state_dict, mapper, connection, has_identity, \
                     instance_key, row_switch in states_to_update:
         if table not in mapper._pks_by_table:
@@ -297,7 +299,16 @@ def _collect_update_commands(base_mapper, uowtransaction,
         value_params = {}
 
         hasdata = hasnull = False
-        for col in mapper._cols_by_table[table]:
+
+        # visit only those columns which have net changes,
+        # along with the primary key and version id columns.
+        changed = histories.get(state, {})
+        cols = set(pks).union(changed)
+        if mapper.version_id_col is not None and \
+                mapper.version_id_col in mapper._cols_by_table[table]:
+            cols.add(mapper.version_id_col)
+
+        for col in cols:
             if col is mapper.version_id_col:
                 params[col._label] = \
                     mapper._get_committed_state_attr_by_column(
@@ -322,18 +333,11 @@ def _collect_update_commands(base_mapper, uowtransaction,
                     # history is only
                     # in a different table than the one
                     # where the version_id_col is.
-                    for prop in mapper._columntoproperty.values():
-                        history = attributes.get_state_history(
-                                state, prop.key,
-                                attributes.PASSIVE_NO_INITIALIZE)
-                        if history.added:
-                            hasdata = True
+                    if _has_column_changes(state, state_dict, mapper):
+                        hasdata = True
             else:
-                prop = mapper._columntoproperty[col]
-                history = attributes.get_state_history(
-                                state, prop.key,
-                                attributes.PASSIVE_NO_INITIALIZE)
-                if history.added:
+                history = changed.get(col)
+                if history is not None:
                     if isinstance(history.added[0],
                                     sql.ClauseElement):
                         value_params[col] = history.added[0]
@@ -372,6 +376,7 @@ def _collect_update_commands(base_mapper, uowtransaction,
                     else:
                         hasdata = True
                 elif col in pks:
+                    prop = mapper._columntoproperty[col]
                     value = state.manager[prop.key].impl.get(
                                                     state, state_dict)
                     if value is None:
@@ -388,6 +393,55 @@ def _collect_update_commands(base_mapper, uowtransaction,
     return update
 
 
+def _collect_column_histories(table, states_to_update):
+    """Gather the net changes to the columns of the given table
+    across a list of states.
+
+    Returns a dictionary of state -> {column: History}, containing
+    only those columns with newly added values.  A column attribute
+    can only have net changes if its previous value was recorded in
+    the state's committed_state, so only the attributes present there
+    are checked, rather than every column of every state.
+
+    """
+    histories = {}
+    for state, state_dict, mapper, connection, has_identity, \
+                    instance_key, row_switch in states_to_update:
+        if not state.committed_state or \
+                table not in mapper._pks_by_table:
+            continue
+
+        propkey_to_col = mapper._propkey_to_col[table]
+        changed = {}
+        for key in state.committed_state:
+            if key not in propkey_to_col:
+                continue
+            history = state.manager[key].impl.get_history(
+                                state, state_dict,
+                                attributes.PASSIVE_NO_INITIALIZE)
+            if history.added:
+                for col in propkey_to_col[key]:
+                    if col is not mapper.version_id_col:
+                        changed[col] = history
+        if changed:
+            histories[state] = changed
+    return histories
+
+
+def _has_column_changes(state, state_dict, mapper):
+    """Return True if any column-based attribute of the given state,
+    across all of the mapper's tables, has newly added values.
+
+    """
+    column_attrs = mapper.column_attrs
+    for key in state.committed_state:
+        if key in column_attrs and state.manager[key].impl.get_history(
+                                state, state_dict,
+                                attributes.PASSIVE_NO_INITIALIZE).added:
+            return True
+    return False
+
+
 def _collect_post_update_commands(base_mapper, uowtransaction, table,
                         states_to_update, post_update_cols):
     """Identify sets of values to use in UPDATE statements for a
@@ -726,8 +726,13 @@ class Query(object):
 
         Also note that while :meth:`~sqlalchemy.orm.query.Query.yield_per`
         will set the ``stream_results`` execution option to True, currently
-        this is only understood by :mod:`~sqlalchemy.dialects.postgresql.psycopg2` dialect
-        which will stream results using server side cursors instead of pre-buffer
+        this is only understood by the
+        :mod:`~sqlalchemy.dialects.postgresql.psycopg2`,
+        :mod:`~sqlalchemy.dialects.mysql.mysqldb`,
+        :mod:`~sqlalchemy.dialects.mysql.pymysql`,
+        :mod:`~sqlalchemy.dialects.mysql.oursql` and
+        :mod:`~sqlalchemy.dialects.sqlite.pysqlite` dialects,
+        which will stream results instead of pre-buffering
         all rows for this query. Other DBAPIs pre-buffer all rows before
         making them available.
 
@@ -794,26 +799,10 @@ class Query(object):
 
         """
 
-        # convert composite types to individual args
-        if hasattr(ident, '__composite_values__'):
-            ident = ident.__composite_values__()
-
-        ident = util.to_list(ident)
-
         mapper = self._only_full_mapper_zero("get")
+        key = self._identity_key_from_ident(mapper, ident, "get")
 
-        if len(ident) != len(mapper.primary_key):
-            raise sa_exc.InvalidRequestError(
-            "Incorrect number of values in identifier to formulate "
-            "primary key for query.get(); primary key columns are %s" %
-            ','.join("'%s'" % c for c in mapper.primary_key))
-
-        key = mapper.identity_key_from_primary_key(ident)
-
-        if not self._populate_existing and \
-                not mapper.always_refresh and \
-                self._lockmode is None:
-
+        if self._use_identity_map(mapper):
             instance = loading.get_from_identity(
                 self.session, key, attributes.PASSIVE_OFF)
             if instance is not None:
@@ -825,6 +814,96 @@ class Query(object):
 
         return loading.load_on_ident(self, key)
 
+    def get_many(self, idents, chunksize=500):
+        """Return a list of instances based on the given sequence of
+        primary key identifiers.
+
+        E.g.::
+
+            users = session.query(User).get_many([5, 7, 12])
+
+        Each identifier is first located in the identity map of the
+        owning :class:`.Session` in the same way as :meth:`~.Query.get`.
+        All identifiers which aren't present are then loaded together
+        using a single SELECT per ``chunksize`` identifiers,
+        using an IN expression against the primary key (or an OR of
+        primary key comparisons for a composite primary key).
+
+        The returned list is in the same order as the given identifiers,
+        with ``None`` for each identifier that wasn't found.
+
+        :param idents: a sequence of identifiers, each of which is
+         a scalar or tuple value in the same format as that accepted
+         by :meth:`~.Query.get`.
+
+        :param chunksize: maximum number of identifiers to load
+         in a single SELECT statement.
+
+        .. versionadded:: 0.9.0
+
+        .. seealso::
+
+            :meth:`.Session.get_many`
+
+        """
+
+        mapper = self._only_full_mapper_zero("get_many")
+        keys = [
+            self._identity_key_from_ident(mapper, ident, "get_many")
+            for ident in idents
+        ]
+
+        found = {}
+        expired = {}
+        if self._use_identity_map(mapper):
+            for key in keys:
+                if key in found or key in expired:
+                    continue
+                # expired instances are refreshed along with
+                # the missing ones, rather than one at a time
+                instance = loading.get_from_identity(
+                    self.session, key, attributes.PASSIVE_NO_FETCH)
+                if instance is attributes.PASSIVE_NO_RESULT:
+                    expired[key] = self.session.identity_map[key]
+                elif instance is not None:
+                    if not issubclass(instance.__class__, mapper.class_):
+                        instance = None
+                    found[key] = instance
+
+        missing = util.unique_list(key for key in keys if key not in found)
+        if missing:
+            found.update(loading.load_on_idents(self, missing, chunksize))
+
+        deleted = [
+            attributes.instance_state(instance)
+            for key, instance in expired.items()
+            if key not in found
+        ]
+        if deleted:
+            self.session._remove_newly_deleted(deleted)
+
+        return [found.get(key) for key in keys]
+
+    def _identity_key_from_ident(self, mapper, ident, meth):
+        # convert composite types to individual args
+        if hasattr(ident, '__composite_values__'):
+            ident = ident.__composite_values__()
+
+        ident = util.to_list(ident)
+
+        if len(ident) != len(mapper.primary_key):
+            raise sa_exc.InvalidRequestError(
+            "Incorrect number of values in identifier to formulate "
+            "primary key for query.%s(); primary key columns are %s" %
+            (meth, ','.join("'%s'" % c for c in mapper.primary_key)))
+
+        return mapper.identity_key_from_primary_key(ident)
+
+    def _use_identity_map(self, mapper):
+        return not self._populate_existing and \
+                not mapper.always_refresh and \
+                self._lockmode is None
+
     @_generative()
     def correlate(self, *args):
         """Return a :class:`.Query` construct which will correlate the given
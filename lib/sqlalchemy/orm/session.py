@@ -477,7 +477,7 @@ class Session(_SessionClassMethods):
         '__contains__', '__iter__', 'add', 'add_all', 'begin', 'begin_nested',
         'close', 'commit', 'connection', 'delete', 'execute', 'expire',
         'expire_all', 'expunge', 'expunge_all', 'flush', 'get_bind',
-        'is_modified',
+        'get_many', 'is_modified',
         'merge', 'query', 'refresh', 'rollback',
         'scalar')
 
@@ -486,7 +486,7 @@ class Session(_SessionClassMethods):
                  autocommit=False, twophase=False,
                  weak_identity_map=True, binds=None, extension=None,
                  info=None,
-                 query_cls=query.Query):
+                 query_cls=query.Query, identity_cls=None):
         """Construct a new Session.
 
         See also the :class:`.sessionmaker` function which is used to
@@ -574,6 +574,19 @@ class Session(_SessionClassMethods):
            flush events, as well as a post-rollback event. **Deprecated.**
            Please see :class:`.SessionEvents`.
 
+        :param identity_cls: optional callable which returns a new,
+           empty identity map each time it's called; this is used for the
+           :attr:`.Session.identity_map` collection, which is re-created each
+           time the :class:`.Session` is closed.  The returned object should
+           be an instance of :class:`.orm.identity.IdentityMap`; the
+           built-in implementations are
+           :class:`.orm.identity.WeakInstanceDict` (the default) and
+           :class:`.orm.identity.LRUInstanceDict`, which keeps a bounded
+           number of recently used objects strongly referenced.
+           Takes precedence over the ``weak_identity_map`` argument.
+
+           .. versionadded:: 0.9.0
+
         :param info: optional dictionary of arbitrary data to be associated
            with this :class:`.Session`.  Is available via the :attr:`.Session.info`
            attribute.  Note the dictionary is copied at construction time so
@@ -602,7 +615,9 @@ class Session(_SessionClassMethods):
 
         """
 
-        if weak_identity_map:
+        if identity_cls is not None:
+            self._identity_cls = identity_cls
+        elif weak_identity_map:
             self._identity_cls = identity.WeakInstanceDict
         else:
             util.warn_deprecated("weak_identity_map=False is deprecated.  "
@@ -1150,6 +1165,24 @@ class Session(_SessionClassMethods):
 
         return self._query_cls(entities, self, **kwargs)
 
+    def get_many(self, entity, idents, chunksize=500):
+        """Return a list of instances of the given entity corresponding
+        to the given sequence of primary key identifiers, in the same
+        order, with ``None`` for identifiers that weren't found.
+
+        Objects already present in the identity map are returned
+        directly; the remaining objects are loaded using as few SELECT
+        statements as possible.  This is a shortcut for::
+
+            session.query(entity).get_many(idents, chunksize)
+
+        See :meth:`.Query.get_many` for details.
+
+        .. versionadded:: 0.9.0
+
+        """
+        return self.query(entity).get_many(idents, chunksize)
+
     @property
     @util.contextmanager
     def no_autoflush(self):
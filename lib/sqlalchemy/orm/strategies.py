@@ -9,7 +9,7 @@
 
 from .. import exc as sa_exc, inspect
 from .. import util, log, event
-from ..sql import util as sql_util, visitors
+from ..sql import util as sql_util, visitors, expression
 from . import (
         attributes, interfaces, exc as orm_exc, loading,
         unitofwork, util as orm_util
@@ -22,7 +22,9 @@ from .interfaces import (
     StrategizedProperty
     )
 from .session import _state_session
+from . import query
 import itertools
+import copy
 
 def _register_attribute(strategy, mapper, useobject,
         compare_function=None,
@@ -283,6 +285,42 @@ class DeferredOption(StrategizedOption):
             return ColumnLoader
 
 
+class LoadOnlyOption(PropertyOption):
+    propagate_to_loaders = True
+
+    def __init__(self, attrs):
+        # the path is taken from the first attribute, so the
+        # others must share its parent; a dotted name's parent is its
+        # leading tokens, a class-bound attribute's is its entity
+        parents = set(
+                    tuple(attr.split(".")[:-1])
+                    if isinstance(attr, util.string_types)
+                    else attr._parententity
+                    for attr in attrs)
+        if len(parents) > 1:
+            raise sa_exc.ArgumentError(
+                    "load_only() attributes must all refer to the same "
+                    "entity; got %s" %
+                    ", ".join(util.text_type(attr) for attr in attrs))
+        super(LoadOnlyOption, self).__init__(attrs[0:1])
+        self.attr_keys = tuple(
+                    attr.split(".")[-1]
+                    if isinstance(attr, util.string_types)
+                    else attr.key
+                    for attr in attrs)
+
+    def process_query_property(self, query, paths):
+        path = paths[-1]
+        entity_path = path.parent
+        load, defer = path.prop.parent._load_only_props(self.attr_keys)
+        for prop in load:
+            entity_path[prop].set(
+                query._attributes, "loaderstrategy", ColumnLoader)
+        for prop in defer:
+            entity_path[prop].set(
+                query._attributes, "loaderstrategy", DeferredColumnLoader)
+
+
 class UndeferGroupOption(MapperOption):
     propagate_to_loaders = True
 
@@ -543,15 +581,143 @@ class LazyLoader(AbstractRelationshipLoader):
             for pk in self.mapper.primary_key
         ]
 
-    def _emit_lazyload(self, session, state, ident_key, passive):
-        q = session.query(self.mapper)._adapt_all_clauses()
-
+    @util.memoized_instancemethod
+    def _baked_lazyload(self):
+        """Build the lazy load query for this relationship once, along
+        with its compiled :class:`.QueryContext`.
+
+        The criterion is expressed in terms of plain bound parameters so
+        that each subsequent load only needs to supply parameter values;
+        Query construction, criterion traversal and statement compilation
+        are skipped.   Returns ``None`` if the query can't be cached,
+        which is the case if the loaded mapper configures eager loading
+        on any of its relationships; eager loaders depend upon the
+        current load path and, for subquery loading, upon the Session.
+
+        """
+        for m in self.mapper.self_and_descendants:
+            for prop in m._props.values():
+                strategy = getattr(prop, 'strategy', None)
+                if isinstance(strategy, AbstractRelationshipLoader) and \
+                        not isinstance(strategy, LazyLoader):
+                    return None
+
+        q = query.Query(self.mapper)._adapt_all_clauses()
         q = q._with_invoke_all_eagers(False)
 
+        if self.use_get:
+            # load the same way as query.get(), keyed to the
+            # primary key of the target.
+            get_clause, get_params = self.mapper._get_clause
+            bind_keys = [get_params[pk].key for pk in self.mapper.primary_key]
+            q = q.filter(get_clause)
+        else:
+            if self.parent_property.order_by:
+                q = q.order_by(*util.to_list(self.parent_property.order_by))
+
+            for rev in self.parent_property._reverse_property:
+                if rev.direction is interfaces.MANYTOONE and \
+                            rev._use_get and \
+                            not isinstance(rev.strategy, LazyLoader):
+                    q = q.options(
+                            EagerLazyOption((rev.key,), lazy='select'))
+
+            # the "unique" binds within the lazy clause receive new
+            # keys each time they're cloned; replace them with plain
+            # binds whose keys remain fixed.
+            bind_keys = []
+
+            def replace(element):
+                if isinstance(element, expression.BindParameter) and \
+                        element._identifying_key in self._bind_to_col:
+                    bind = expression.bindparam(None, type_=element.type)
+                    bind_keys.append(
+                        (bind.key,
+                            self._bind_to_col[element._identifying_key]))
+                    return bind
+            q = q.filter(
+                    visitors.replacement_traverse(
+                            self._lazywhere, {}, replace))
+
+        q = q.execution_options(compiled_cache=self.mapper._compiled_cache)
+
+        # the compiled context doesn't depend on any particular
+        # Session; one is assigned to a copy of it for each load.
+        context = q._compile_context()
+        context.statement.use_labels = True
+
+        del context.session
+        del context.query
+        return q, context, bind_keys
+
+    def _emit_baked_lazyload(self, session, state, ident_key, passive):
+        q, baked_context, bind_keys = self._baked_lazyload()
+
         pending = not state.key
 
         # don't autoflush on pending
-        if pending:
+        if not pending:
+            session._autoflush()
+
+        if self.use_get:
+            ident = ident_key[1]
+            if None in ident:
+                # partial primary key; load_on_ident() will
+                # render "IS NULL" for those columns
+                return loading.load_on_ident(
+                            self._lazyload_query(session, state), ident_key)
+            params = dict(zip(bind_keys, ident))
+        else:
+            # parameter values are read after the autoflush, as the
+            # bind callables of the uncached lazy clause would be
+            mapper = self.parent_property.parent
+            if passive & attributes.LOAD_AGAINST_COMMITTED:
+                get_attr = mapper._get_committed_state_attr_by_column
+            else:
+                get_attr = mapper._get_state_attr_by_column
+
+            dict_ = state.dict
+            params = dict(
+                        (key, get_attr(state, dict_, col))
+                        for key, col in bind_keys
+                    )
+            if pending and None in params.values():
+                return None
+
+        q = q.with_session(session)
+        q._params = params
+
+        if state.load_path:
+            q = q._with_current_path(state.load_path[self.parent_property])
+
+        context = copy.copy(baked_context)
+        context.query = q
+        context.session = session
+        context.attributes = context.attributes.copy()
+
+        result = list(q._execute_and_instances(context))
+        if self.uselist:
+            return result
+        else:
+            l = len(result)
+            if l:
+                if l > 1:
+                    util.warn(
+                        "Multiple rows returned with "
+                        "uselist=False for lazily-loaded attribute '%s' "
+                        % self.parent_property)
+
+                return result[0]
+            else:
+                return None
+
+    def _lazyload_query(self, session, state):
+        q = session.query(self.mapper)._adapt_all_clauses()
+
+        q = q._with_invoke_all_eagers(False)
+
+        # don't autoflush on pending
+        if not state.key:
             q = q.autoflush(False)
 
         if state.load_path:
@@ -559,6 +725,20 @@ class LazyLoader(AbstractRelationshipLoader):
 
         if state.load_options:
             q = q._conditional_options(*state.load_options)
+        return q
+
+    def _emit_lazyload(self, session, state, ident_key, passive):
+        # the common case of a plain lazy load with no options
+        # in effect uses a cached, pre-compiled query.
+        if not state.load_options and \
+                session._query_cls is query.Query and \
+                self._baked_lazyload() is not None:
+            return self._emit_baked_lazyload(
+                                session, state, ident_key, passive)
+
+        q = self._lazyload_query(session, state)
+
+        pending = not state.key
 
         if self.use_get:
             return loading.load_on_ident(q, ident_key)
@@ -284,6 +284,11 @@ class AliasedClass(object):
     argument descriptions.
 
     """
+
+    # don't memoize annotated columns carrying this entity on the
+    # underlying table; see sql.annotation._memoized_annotation()
+    _annotation_no_memo = True
+
     def __init__(self, cls, alias=None,
                             name=None,
                             flat=False,
@@ -417,6 +422,8 @@ class AliasedInsp(_InspectionAttr):
     is_aliased_class = True
     "always returns True"
 
+    _annotation_no_memo = True
+
     @property
     def class_(self):
         """Return the mapped class ultimately represented by this
@@ -99,10 +99,74 @@ def py_fallback():
     TIME_RE = re.compile("(\d+):(\d+):(\d+)(?:\.(\d+))?")
     DATE_RE = re.compile("(\d+)-(\d+)-(\d+)")
 
-    str_to_datetime = str_to_datetime_processor_factory(DATETIME_RE,
-                                                        datetime.datetime)
-    str_to_time = str_to_datetime_processor_factory(TIME_RE, datetime.time)
-    str_to_date = str_to_datetime_processor_factory(DATE_RE, datetime.date)
+    regexp_str_to_datetime = str_to_datetime_processor_factory(
+                                    DATETIME_RE, datetime.datetime)
+    regexp_str_to_time = str_to_datetime_processor_factory(
+                                    TIME_RE, datetime.time)
+    regexp_str_to_date = str_to_datetime_processor_factory(
+                                    DATE_RE, datetime.date)
+
+    # the functions below parse strings in the fixed-width
+    # "YYYY-MM-DD HH:MM:SS.ffffff" layout produced by the default
+    # storage formats positionally, converting the date and the time
+    # portions each with a single int() call, which is a good deal
+    # faster than matching the regular expression.  Any other string,
+    # including those of the same layout which fail to convert, is
+    # passed on to the regular expression version.
+    datetime_datetime = datetime.datetime
+    datetime_time = datetime.time
+    datetime_date = datetime.date
+
+    def str_to_datetime(value):
+        if value is None:
+            return None
+        try:
+            length = len(value)
+            if length == 26 and value[4:20:3] == '-- ::.':
+                microsecond = int(value[20:26])
+            elif length == 19 and value[4:17:3] == '-- ::':
+                microsecond = 0
+            else:
+                return regexp_str_to_datetime(value)
+            ymd = int(value[0:4] + value[5:7] + value[8:10])
+            hms = int(value[11:13] + value[14:16] + value[17:19])
+            return datetime_datetime(
+                        ymd // 10000, ymd // 100 % 100, ymd % 100,
+                        hms // 10000, hms // 100 % 100, hms % 100,
+                        microsecond)
+        except (TypeError, ValueError):
+            return regexp_str_to_datetime(value)
+
+    def str_to_time(value):
+        if value is None:
+            return None
+        try:
+            length = len(value)
+            if length == 15 and value[2:9:3] == '::.':
+                microsecond = int(value[9:15])
+            elif length == 8 and value[2:6:3] == '::':
+                microsecond = 0
+            else:
+                return regexp_str_to_time(value)
+            hms = int(value[0:2] + value[3:5] + value[6:8])
+            return datetime_time(
+                        hms // 10000, hms // 100 % 100, hms % 100,
+                        microsecond)
+        except (TypeError, ValueError):
+            return regexp_str_to_time(value)
+
+    def str_to_date(value):
+        if value is None:
+            return None
+        try:
+            if len(value) == 10 and value[4:8:3] == '--':
+                ymd = int(value[0:4] + value[5:7] + value[8:10])
+                return datetime_date(
+                            ymd // 10000, ymd // 100 % 100, ymd % 100)
+        except (TypeError, ValueError):
+            pass
+        return regexp_str_to_date(value)
+
     return locals()
 
 try:
@@ -41,6 +41,7 @@ class Annotated(object):
 
     def __init__(self, element, values):
         self.__dict__ = element.__dict__.copy()
+        self.__dict__.pop('_annotation_cache', None)
         self.__element = element
         self._annotations = values
 
@@ -52,6 +53,7 @@ class Annotated(object):
     def _with_annotations(self, values):
         clone = self.__class__.__new__(self.__class__)
         clone.__dict__ = self.__dict__.copy()
+        clone.__dict__.pop('_annotation_cache', None)
         clone._annotations = values
         return clone
 
@@ -93,6 +95,48 @@ class Annotated(object):
 
 
 
+# maximum number of annotated copies memoized per element
+# by _memoized_annotation()
+_annotation_cache_size = 10
+
+
+def _memoized_annotation(element, values, create):
+    """Return ``create(element, values)``, memoizing the result
+    on the given element per distinct annotations dictionary.
+
+    This is used for immutable elements, i.e. table-bound columns,
+    which the ORM annotates with the same values over and over
+    again as expressions are constructed.  The copies are held in
+    a small LRU cache, so that an element annotated with many
+    different values doesn't grow without bound.  Annotations which
+    include a value having a true ``_annotation_no_memo`` attribute,
+    i.e. the ORM's aliased entities, aren't memoized, as such values
+    are typically short-lived and would otherwise be kept alive by
+    the element.
+
+    """
+    try:
+        key = frozenset(values.items())
+    except TypeError:
+        # unhashable annotation value
+        return create(element, values)
+
+    cache = element.__dict__.get('_annotation_cache')
+    if cache is None:
+        cache = element.__dict__['_annotation_cache'] = \
+                    util.LRUCache(_annotation_cache_size, threshold=0)
+    elif key in cache:
+        return cache[key]
+
+    annotated = create(element, values)
+    for value in values.values():
+        if getattr(value, '_annotation_no_memo', False):
+            break
+    else:
+        cache[key] = annotated
+    return annotated
+
+
 # hard-generate Annotated subclasses.  this technique
 # is used instead of on-the-fly types (i.e. type.__new__())
 # so that the resulting objects are pickleable.
@@ -11,6 +11,7 @@
 
 from .. import util, exc
 import itertools
+import operator
 from .visitors import ClauseVisitor
 
 
@@ -188,6 +189,7 @@ class ColumnCollection(util.OrderedProperties):
         super(ColumnCollection, self).__init__()
         self._data.update((c.key, c) for c in cols)
         self.__dict__['_all_cols'] = util.column_set(self)
+        self.__dict__['_proxy_index'] = None
 
     def __str__(self):
         return repr([str(c) for c in self])
@@ -217,6 +219,7 @@ class ColumnCollection(util.OrderedProperties):
             self._all_cols.remove(self._data[column.key])
         self._all_cols.add(column)
         self._data[column.key] = column
+        self.__dict__['_proxy_index'] = None
 
     def add(self, column):
         """Add a column to this collection.
@@ -253,19 +256,23 @@ class ColumnCollection(util.OrderedProperties):
             util.memoized_property.reset(value, "proxy_set")
         self._all_cols.add(value)
         self._data[key] = value
+        self.__dict__['_proxy_index'] = None
 
     def clear(self):
         self._data.clear()
         self._all_cols.clear()
+        self.__dict__['_proxy_index'] = None
 
     def remove(self, column):
         del self._data[column.key]
         self._all_cols.remove(column)
+        self.__dict__['_proxy_index'] = None
 
     def update(self, value):
         self._data.update(value)
         self._all_cols.clear()
         self._all_cols.update(self._data.values())
+        self.__dict__['_proxy_index'] = None
 
     def extend(self, iter):
         self.update((c.key, c) for c in iter)
@@ -289,11 +296,54 @@ class ColumnCollection(util.OrderedProperties):
     def __setstate__(self, state):
         self.__dict__['_data'] = state['_data']
         self.__dict__['_all_cols'] = util.column_set(self._data.values())
+        self.__dict__['_proxy_index'] = None
 
     def contains_column(self, col):
         # this has to be done via set() membership
         return col in self._all_cols
 
+    def _proxy_candidates(self, target_set):
+        """Return (column, expanded proxy set) tuples for those columns
+        in this collection which proxy any member of the given
+        target set, in collection order.
+
+        Used by :meth:`.FromClause.corresponding_column` so that
+        repeated lookups against the same collection, as when an
+        adapter translates many columns to an alias, don't need to
+        expand the proxy set of every column in the collection on
+        each call.   The index is discarded whenever the collection
+        is modified.
+
+        """
+        index = self._proxy_index
+        if index is None:
+            index = {}
+            for pos, c in enumerate(self):
+                expanded = set(itertools.chain(
+                                *[x._cloned_set for x in c.proxy_set]))
+                entry = (pos, c, expanded)
+                for proxied in expanded:
+                    if proxied in index:
+                        index[proxied].append(entry)
+                    else:
+                        index[proxied] = [entry]
+            self.__dict__['_proxy_index'] = index
+
+        entries = None
+        for t in target_set:
+            if t in index:
+                if entries is None:
+                    entries = index[t]
+                else:
+                    entries = entries + index[t]
+        if entries is None:
+            return ()
+        elif len(entries) > 1:
+            entries = sorted(dict(
+                            (entry[0], entry) for entry in entries
+                        ).values(), key=operator.itemgetter(0))
+        return [(c, expanded) for pos, c, expanded in entries]
+
     def as_immutable(self):
         return ImmutableColumnCollection(self._data, self._all_cols)
 
@@ -62,6 +62,18 @@ BIND_TEMPLATES = {
     'named': ":%(name)s"
 }
 
+# compiler class -> subclass which renders bound parameters as markers,
+# see SQLCompiler.literal_statements()
+_literal_template_compilers = {}
+
+
+def _bind_marker_string(self, name, **kw):
+    return "\x00%s\x00" % name
+
+# (compiler class, operator name, qualifiers) -> visit method or None,
+# see SQLCompiler._get_operator_dispatch()
+_operator_dispatch = {}
+
 REQUIRED = util.symbol('REQUIRED', """
 Placeholder for the value within a :class:`.BindParameter`
 which is required to be present when the statement is passed
@@ -169,6 +181,8 @@ class Compiled(object):
     defaults.
     """
 
+    _cached_metadata = None
+
     def __init__(self, dialect, statement, bind=None,
                 compile_kwargs=util.immutabledict()):
         """Construct a new ``Compiled`` object.
@@ -309,6 +323,13 @@ class SQLCompiler(Compiled):
     either implicitly or explicitly
     """
 
+    insert_single_values_expr = None
+    """When an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, the string is assigned here, where it can be
+    used by dialects which rewrite an executemany() of the statement
+    into a multiple-row VALUES expression.
+    """
+
     returning_precedes_values = False
     """set to True classwide to generate RETURNING
     clauses before the VALUES or WHERE clause (i.e. MSSQL)
@@ -328,6 +349,17 @@ class SQLCompiler(Compiled):
     driver/DB enforces this
     """
 
+    contains_expanding_parameters = False
+    """True if the statement contains "expanding" bind parameters,
+    which are rendered into individual placeholders at execution time.
+    """
+
+    _empty_in_expressions = util.immutabledict()
+    """IN expressions against "expanding" bind parameters, keyed on
+    bind parameter name, along with the text which replaces each one
+    when executed with an empty sequence.
+    """
+
     def __init__(self, dialect, statement, column_keys=None,
                     inline=False, **kwargs):
         """Construct a new ``DefaultCompiler`` object.
@@ -422,6 +454,15 @@ class SQLCompiler(Compiled):
                  if value is not None
             )
 
+    @util.memoized_property
+    def _positional_bind_processors(self):
+        """A tuple of (key, processor or None) for each positional
+        bind parameter, in the order in which they're rendered."""
+
+        processors = self._bind_processors
+        return tuple(
+                (key, processors.get(key)) for key in self.positiontup)
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -626,12 +667,39 @@ class SQLCompiler(Compiled):
             sep = " "
         else:
             sep = OPERATORS[clauselist.operator]
+
+        clauses = clauselist.clauses
+        if clauses and clauses[0].__class__ is clauselist.__class__:
+            clauses = self._unroll_clauselist(clauselist)
+
         return sep.join(
-                    s for s in
-                    (
-                        c._compiler_dispatch(self, **kw)
-                        for c in clauselist.clauses)
-                    if s)
+                    [s for s in
+                        [c._compiler_dispatch(self, **kw)
+                            for c in clauses]
+                    if s])
+
+    def _unroll_clauselist(self, clauselist):
+        """Given a clauselist which leads with nested clauselists of the
+        same operator, such as and_(and_(and_(a, b), c), d), return the
+        flat list of elements which renders the same way.
+
+        """
+        if self.__class__.visit_clauselist != SQLCompiler.visit_clauselist:
+            return clauselist.clauses
+        operator = clauselist.operator
+        chain = [clauselist]
+        link = clauselist.clauses[0]
+        while link.__class__ is clauselist.__class__ and \
+                link.operator is operator:
+            chain.append(link)
+            if not link.clauses:
+                break
+            link = link.clauses[0]
+
+        clauses = list(chain.pop().clauses)
+        while chain:
+            clauses.extend(chain.pop().clauses[1:])
+        return clauses
 
     def _order_by_clauselist(self, clauselist, order_by_select, **kw):
         # look through raw columns collection for labels.
@@ -767,18 +835,18 @@ class SQLCompiler(Compiled):
                 raise exc.CompileError(
                         "Unary expression does not support operator "
                         "and modifier simultaneously")
-            disp = getattr(self, "visit_%s_unary_operator" %
-                                    unary.operator.__name__, None)
+            disp = self._get_operator_dispatch(
+                                    unary.operator, "unary", "operator")
             if disp:
-                return disp(unary, unary.operator, **kw)
+                return disp(self, unary, unary.operator, **kw)
             else:
                 return self._generate_generic_unary_operator(unary,
                                     OPERATORS[unary.operator], **kw)
         elif unary.modifier:
-            disp = getattr(self, "visit_%s_unary_modifier" %
-                                    unary.modifier.__name__, None)
+            disp = self._get_operator_dispatch(
+                                    unary.modifier, "unary", "modifier")
             if disp:
-                return disp(unary, unary.modifier, **kw)
+                return disp(self, unary, unary.modifier, **kw)
             else:
                 return self._generate_generic_unary_modifier(unary,
                                     OPERATORS[unary.modifier], **kw)
@@ -794,16 +862,109 @@ class SQLCompiler(Compiled):
             kw['literal_binds'] = True
 
         operator = binary.operator
-        disp = getattr(self, "visit_%s_binary" % operator.__name__, None)
+        disp = self._get_operator_dispatch(operator, "binary", None)
         if disp:
-            return disp(binary, operator, **kw)
+            return disp(self, binary, operator, **kw)
         else:
             try:
                 opstring = OPERATORS[operator]
             except KeyError:
                 raise exc.UnsupportedCompilationError(self, operator)
             else:
-                return self._generate_generic_binary(binary, opstring, **kw)
+                if binary.left.__class__ is elements.BinaryExpression and \
+                        binary.left.left.__class__ is \
+                            elements.BinaryExpression:
+                    return self._visit_binary_chain(binary, **kw)
+
+                # inlined form of _generate_generic_binary()
+                return binary.left._compiler_dispatch(self, **kw) + \
+                                        opstring + \
+                            binary.right._compiler_dispatch(self, **kw)
+
+    def _visit_binary_chain(self, binary, **kw):
+        """Render a left-deep chain of binary expressions, such as
+        a + b + c + ..., iterating down the left side of the chain rather
+        than recursing into it.
+
+        Links are unrolled only while they would be rendered by the
+        generic form of visit_binary(); the innermost link, whose left
+        side is not itself a binary expression, is dispatched normally.
+
+        """
+        unroll = self.__class__.visit_binary == SQLCompiler.visit_binary
+        links = [binary]
+        element = binary.left
+        while unroll and element.left.__class__ is elements.BinaryExpression:
+            operator = element.operator
+            if operator not in OPERATORS or \
+                    self._get_operator_dispatch(operator, "binary", None):
+                break
+            links.append(element)
+            element = element.left
+
+        text = element._compiler_dispatch(self, **kw)
+        for link in reversed(links):
+            text += OPERATORS[link.operator] + \
+                        link.right._compiler_dispatch(self, **kw)
+        return text
+
+    def _get_operator_dispatch(self, operator_, qualifier1, qualifier2):
+        """Return the visit_<operator>_<qualifier> method of this
+        compiler's class for the given operator, or None.
+
+        The lookup is cached per compiler class and operator name.
+
+        """
+        key = (self.__class__, operator_.__name__, qualifier1, qualifier2)
+        try:
+            return _operator_dispatch[key]
+        except KeyError:
+            attrname = "visit_%s_%s%s" % (
+                            operator_.__name__, qualifier1,
+                            "_" + qualifier2 if qualifier2 else "")
+            disp = _operator_dispatch[key] = \
+                        getattr(self.__class__, attrname, None)
+            return disp
+
+    def visit_in_op_binary(self, binary, operator, **kw):
+        return self._generate_in_binary(binary, " IN ", " != ", **kw)
+
+    def visit_notin_op_binary(self, binary, operator, **kw):
+        return self._generate_in_binary(binary, " NOT IN ", " = ", **kw)
+
+    def _generate_in_binary(self, binary, opstring, empty_opstring, **kw):
+        bindparam = binary.right
+        if isinstance(bindparam, elements.Grouping):
+            bindparam = bindparam.element
+        if not isinstance(bindparam, elements.BindParameter) or \
+                not bindparam.expanding:
+            return self._generate_generic_binary(binary, opstring, **kw)
+
+        # an empty sequence renders the same expression as in_()
+        # against an empty list, comparing the left side to itself
+        if self.positional:
+            start = len(self.positiontup)
+        left = binary.left._compiler_dispatch(self, **kw)
+        empty_text = left + empty_opstring + left
+
+        if kw.get('literal_binds'):
+            if not bindparam.effective_value:
+                return empty_text
+            return left + opstring + \
+                        binary.right._compiler_dispatch(self, **kw)
+
+        if self.positional:
+            left_names = self.positiontup[start:]
+        else:
+            left_names = None
+        text = left + opstring + binary.right._compiler_dispatch(self, **kw)
+
+        if not self._empty_in_expressions:
+            self._empty_in_expressions = {}
+        self._empty_in_expressions.setdefault(
+                        self._truncate_bindparam(bindparam), []).append(
+                                (text, empty_text, left_names))
+        return text
 
     def visit_custom_op_binary(self, element, operator, **kw):
         return self._generate_generic_binary(element,
@@ -878,7 +1039,8 @@ class SQLCompiler(Compiled):
                             binary.left._compiler_dispatch(self, **kw),
                             binary.right._compiler_dispatch(self, **kw)) \
             + (escape and
-                    (' ESCAPE ' + self.render_literal_value(escape, None))
+                    (' ESCAPE ' +
+                        self.render_literal_value(escape, sqltypes.STRINGTYPE))
                     or '')
 
     def visit_notlike_op_binary(self, binary, operator, **kw):
@@ -887,7 +1049,8 @@ class SQLCompiler(Compiled):
                             binary.left._compiler_dispatch(self, **kw),
                             binary.right._compiler_dispatch(self, **kw)) \
             + (escape and
-                    (' ESCAPE ' + self.render_literal_value(escape, None))
+                    (' ESCAPE ' +
+                        self.render_literal_value(escape, sqltypes.STRINGTYPE))
                     or '')
 
     def visit_ilike_op_binary(self, binary, operator, **kw):
@@ -896,7 +1059,8 @@ class SQLCompiler(Compiled):
                             binary.left._compiler_dispatch(self, **kw),
                             binary.right._compiler_dispatch(self, **kw)) \
             + (escape and
-                    (' ESCAPE ' + self.render_literal_value(escape, None))
+                    (' ESCAPE ' +
+                        self.render_literal_value(escape, sqltypes.STRINGTYPE))
                     or '')
 
     def visit_notilike_op_binary(self, binary, operator, **kw):
@@ -905,7 +1069,8 @@ class SQLCompiler(Compiled):
                             binary.left._compiler_dispatch(self, **kw),
                             binary.right._compiler_dispatch(self, **kw)) \
             + (escape and
-                    (' ESCAPE ' + self.render_literal_value(escape, None))
+                    (' ESCAPE ' +
+                        self.render_literal_value(escape, sqltypes.STRINGTYPE))
                     or '')
 
     def visit_bindparam(self, bindparam, within_columns_clause=False,
@@ -921,7 +1086,7 @@ class SQLCompiler(Compiled):
         if literal_binds or \
             (within_columns_clause and \
                 self.ansi_bind_rules):
-            if bindparam.value is None:
+            if bindparam.required or bindparam.callable is not None:
                 raise exc.CompileError("Bind parameter without a "
                                         "renderable value not allowed here.")
             return self.render_literal_bindparam(bindparam,
@@ -953,25 +1118,48 @@ class SQLCompiler(Compiled):
 
         self.binds[bindparam.key] = self.binds[name] = bindparam
 
-        return self.bindparam_string(name, quote=bindparam.quote, **kwargs)
+        if bindparam.expanding:
+            self.contains_expanding_parameters = True
+
+        return self.bindparam_string(name, quote=bindparam.quote,
+                                    expanding=bindparam.expanding, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
         value = bindparam.value
-        processor = bindparam.type._cached_bind_processor(self.dialect)
-        if processor:
-            value = processor(value)
+        if bindparam.expanding:
+            return ", ".join(
+                        self.render_literal_value(v, bindparam.type)
+                        for v in value) or "NULL"
         return self.render_literal_value(value, bindparam.type)
 
     def render_literal_value(self, value, type_):
         """Render the value of a bind parameter as a quoted literal.
 
         This is used for statement sections that do not accept bind parameters
-        on the target driver/database.
+        on the target driver/database, as well as when the ``literal_binds``
+        flag is in effect.
 
-        This should be implemented by subclasses using the quoting services
-        of the DBAPI.
+        The value is rendered by the literal processor of the given
+        type, as returned by :meth:`.TypeEngine.literal_processor`.
+        For types which don't provide one, the type's bind processor is
+        applied and strings and numbers are rendered based on their
+        Python type.
+
+        Dialects may override this method in order to apply
+        additional escaping to the rendered value.
 
         """
+        if value is None:
+            return "NULL"
+
+        processor = type_._cached_literal_processor(self.dialect)
+        if processor:
+            return processor(value)
+
+        processor = type_._cached_bind_processor(self.dialect)
+        if processor:
+            value = processor(value)
+
         if isinstance(value, util.string_types):
             value = value.replace("'", "''")
             return "'%s'" % value
@@ -985,6 +1173,99 @@ class SQLCompiler(Compiled):
             raise NotImplementedError(
                         "Don't know how to literal-quote value %r" % value)
 
+    def literal_statements(self, multiparams):
+        """Render the string form of this statement once for each
+        parameter dictionary in the given sequence, with all bound
+        values rendered inline as literals.
+
+        Parameter dictionaries are interpreted in the same way as when
+        the statement is executed; values for bound parameters not
+        present in a dictionary are taken from the statement itself,
+        and :class:`.exc.InvalidRequestError` is raised if a required
+        value is missing.  Values are rendered using
+        :meth:`.TypeEngine.literal_processor`.
+
+        The statement is compiled only once more, into a template
+        which is then filled in with the literal values of each
+        parameter set, so that large numbers of statements can be
+        rendered without the overhead of compiling each one.  An
+        INSERT or UPDATE should be compiled with the ``column_keys``
+        argument, naming the keys present in the parameter sets::
+
+            compiled = table.insert().compile(dialect=engine.dialect,
+                                        column_keys=['id', 'data'])
+            for sql in compiled.literal_statements(
+                                [{"id": 1, "data": "d1"},
+                                 {"id": 2, "data": "d2"}]):
+                print(sql)
+
+        Returns an iterator of strings.
+
+        .. versionadded:: 0.9.0
+
+        .. seealso::
+
+            :meth:`.SQLCompiler.write_literal_statements`
+
+        """
+        compiler, parts = self._literal_template
+        binds = compiler.binds
+        render_literal_value = compiler.render_literal_value
+        for group, params in enumerate(multiparams):
+            pd = compiler.construct_params(params, _group_number=group)
+            text = list(parts)
+            for idx in range(1, len(parts), 2):
+                name = parts[idx]
+                bindparam = binds[name]
+                value = pd[name]
+                if bindparam.expanding:
+                    text[idx] = ", ".join(
+                                    render_literal_value(v, bindparam.type)
+                                    for v in value) or "NULL"
+                else:
+                    text[idx] = render_literal_value(value, bindparam.type)
+            yield "".join(text)
+
+    def write_literal_statements(self, fileobj, multiparams,
+                                        delimiter=";\n"):
+        """Write the string form of this statement to the given file-like
+        object once for each parameter dictionary in the given sequence,
+        with all bound values rendered inline as literals.
+
+        Each statement is followed by the given ``delimiter``.  The
+        statements are produced by :meth:`.SQLCompiler.literal_statements`
+        and written out one at a time, so that the parameter
+        dictionaries may be generated lazily as well.
+
+        .. versionadded:: 0.9.0
+
+        """
+        write = fileobj.write
+        for statement in self.literal_statements(multiparams):
+            write(statement)
+            write(delimiter)
+
+    @util.memoized_property
+    def _literal_template(self):
+        # compile the statement a second time, rendering each bound
+        # parameter as a NUL-delimited marker containing its name
+        cls = self.__class__
+        if cls not in _literal_template_compilers:
+            _literal_template_compilers[cls] = type(
+                            "%sLiteralTemplate" % cls.__name__, (cls, ),
+                            {"bindparam_string": _bind_marker_string})
+        compiler = _literal_template_compilers[cls](
+                            self.dialect, self.statement,
+                            column_keys=self.column_keys,
+                            inline=self.inline)
+        parts = compiler.string.split("\x00")
+        for name in parts[1::2] if len(parts) % 2 else [None]:
+            if name not in compiler.binds:
+                raise exc.CompileError(
+                        "Can't render literal statements for a statement "
+                        "which itself contains NUL characters")
+        return compiler, parts
+
     def _truncate_bindparam(self, bindparam):
         if bindparam in self.bind_names:
             return self.bind_names[bindparam]
@@ -1024,13 +1305,18 @@ class SQLCompiler(Compiled):
         return derived + "_" + str(anonymous_counter)
 
     def bindparam_string(self, name, quote=None,
-                        positional_names=None, **kw):
+                        positional_names=None, expanding=False, **kw):
         if self.positional:
             if positional_names is not None:
                 positional_names.append(name)
             else:
                 self.positiontup.append(name)
-        return self.bindtemplate % {'name': name}
+        if expanding:
+            # rendered into individual placeholders at execution time
+            # by DefaultExecutionContext._expand_in_parameters()
+            return "[EXPANDING_%s]" % name
+        else:
+            return self.bindtemplate % {'name': name}
 
     def visit_cte(self, cte, asfrom=False, ashint=False,
                                 fromhints=None,
@@ -1255,6 +1541,18 @@ class SQLCompiler(Compiled):
             elif element in cloned:
                 return cloned[element]
 
+            # visit a left-deep chain such as a + b + c from the innermost
+            # link outwards, so that _copy_internals() below finds
+            # the chained element already cloned
+            chain = []
+            link = element._chained_element
+            while link is not None and link not in column_translate[-1] \
+                    and link not in cloned:
+                chain.append(link)
+                link = link._chained_element
+            for link in reversed(chain):
+                visit(link, **kw)
+
             newelem = cloned[element] = element._clone()
 
             if newelem.__visit_name__ is join_name and \
@@ -1598,7 +1896,7 @@ class SQLCompiler(Compiled):
 
     def visit_insert(self, insert_stmt, **kw):
         self.isinsert = True
-        colparams = self._get_colparams(insert_stmt)
+        colparams = self._get_colparams(insert_stmt, **kw)
 
         if not colparams and \
                 not self.dialect.supports_default_values and \
@@ -1674,8 +1972,9 @@ class SQLCompiler(Compiled):
                             )
                         )
         else:
-            text += " VALUES (%s)" % \
+            self.insert_single_values_expr = \
                      ', '.join([c[1] for c in colparams])
+            text += " VALUES (%s)" % self.insert_single_values_expr
 
         if self.returning and not self.returning_precedes_values:
             text += " " + returning_clause
@@ -1731,7 +2030,7 @@ class SQLCompiler(Compiled):
         table_text = self.update_tables_clause(update_stmt, update_stmt.table,
                                                extra_froms, **kw)
 
-        colparams = self._get_colparams(update_stmt, extra_froms)
+        colparams = self._get_colparams(update_stmt, extra_froms, **kw)
 
         if update_stmt._hints:
             dialect_hints = dict([
@@ -1777,7 +2076,7 @@ class SQLCompiler(Compiled):
                 text += " " + extra_from_text
 
         if update_stmt._whereclause is not None:
-            text += " WHERE " + self.process(update_stmt._whereclause)
+            text += " WHERE " + self.process(update_stmt._whereclause, **kw)
 
         limit_clause = self.update_limit_clause(update_stmt)
         if limit_clause:
@@ -1791,16 +2090,17 @@ class SQLCompiler(Compiled):
 
         return text
 
-    def _create_crud_bind_param(self, col, value, required=False, name=None):
+    def _create_crud_bind_param(self, col, value, required=False, name=None,
+                                    **kw):
         if name is None:
             name = col.key
         bindparam = elements.BindParameter(name, value,
                             type_=col.type, required=required,
                             quote=col.quote)
         bindparam._is_crud = True
-        return bindparam._compiler_dispatch(self)
+        return bindparam._compiler_dispatch(self, **kw)
 
-    def _get_colparams(self, stmt, extra_tables=None):
+    def _get_colparams(self, stmt, extra_tables=None, **kw):
         """create a set of tuples representing column/string pairs for use
         in an INSERT or UPDATE statement.
 
@@ -1820,7 +2120,7 @@ class SQLCompiler(Compiled):
         if self.column_keys is None and stmt.parameters is None:
             return [
                         (c, self._create_crud_bind_param(c,
-                                    None, required=True))
+                                    None, required=True, **kw))
                         for c in stmt.table.columns
                     ]
 
@@ -1852,7 +2152,8 @@ class SQLCompiler(Compiled):
                     # add it to values() in an "as-is" state,
                     # coercing right side to bound param
                     if elements._is_literal(v):
-                        v = self.process(elements.BindParameter(None, v, type_=k.type))
+                        v = self.process(elements.BindParameter(
+                                            None, v, type_=k.type), **kw)
                     else:
                         v = self.process(v.self_group())
 
@@ -1886,7 +2187,7 @@ class SQLCompiler(Compiled):
                         value = normalized_params[c]
                         if elements._is_literal(value):
                             value = self._create_crud_bind_param(
-                                c, value, required=value is REQUIRED)
+                                c, value, required=value is REQUIRED, **kw)
                         else:
                             self.postfetch.append(c)
                             value = self.process(value.self_group())
@@ -1906,7 +2207,8 @@ class SQLCompiler(Compiled):
                             self.postfetch.append(c)
                         else:
                             values.append(
-                                (c, self._create_crud_bind_param(c, None))
+                                (c, self._create_crud_bind_param(
+                                                        c, None, **kw))
                             )
                             self.prefetch.append(c)
                     elif c.server_onupdate is not None:
@@ -1923,7 +2225,8 @@ class SQLCompiler(Compiled):
                                     c, value, required=value is REQUIRED,
                                     name=c.key
                                         if not stmt._has_multi_parameters
-                                        else "%s_0" % c.key
+                                        else "%s_0" % c.key,
+                                    **kw
                                     )
                 elif c.primary_key and implicit_returning:
                     self.returning.append(c)
@@ -1959,7 +2262,8 @@ class SQLCompiler(Compiled):
                                 self.returning.append(c)
                             else:
                                 values.append(
-                                    (c, self._create_crud_bind_param(c, None))
+                                    (c, self._create_crud_bind_param(
+                                                            c, None, **kw))
                                 )
                                 self.prefetch.append(c)
                         else:
@@ -1972,7 +2276,8 @@ class SQLCompiler(Compiled):
                             ):
 
                             values.append(
-                                (c, self._create_crud_bind_param(c, None))
+                                (c, self._create_crud_bind_param(
+                                                        c, None, **kw))
                             )
 
                             self.prefetch.append(c)
@@ -1996,7 +2301,7 @@ class SQLCompiler(Compiled):
                             self.postfetch.append(c)
                     else:
                         values.append(
-                            (c, self._create_crud_bind_param(c, None))
+                            (c, self._create_crud_bind_param(c, None, **kw))
                         )
                         self.prefetch.append(c)
                 elif c.server_default is not None:
@@ -2012,7 +2317,7 @@ class SQLCompiler(Compiled):
                         self.postfetch.append(c)
                     else:
                         values.append(
-                            (c, self._create_crud_bind_param(c, None))
+                            (c, self._create_crud_bind_param(c, None, **kw))
                         )
                         self.prefetch.append(c)
                 elif c.server_onupdate is not None:
@@ -2038,7 +2343,8 @@ class SQLCompiler(Compiled):
                             c,
                                 self._create_crud_bind_param(
                                         c, row[c.key],
-                                        name="%s_%d" % (c.key, i + 1)
+                                        name="%s_%d" % (c.key, i + 1),
+                                        **kw
                                 )
                                 if c.key in row else param
                         )
@@ -2093,7 +2399,7 @@ class SQLCompiler(Compiled):
 
         if delete_stmt._whereclause is not None:
             text += " WHERE "
-            text += delete_stmt._whereclause._compiler_dispatch(self)
+            text += delete_stmt._whereclause._compiler_dispatch(self, **kw)
 
         if self.returning and not self.returning_precedes_values:
             text += " " + self.returning_clause(
@@ -614,6 +614,52 @@ class DropConstraint(_CreateDropBase):
 class DDLBase(SchemaVisitor):
     def __init__(self, connection):
         self.connection = connection
+        self._existing_names = None
+
+    def _prefetch_existing_names(self):
+        """Check for the existence of tables and sequences against the
+        names of all relations and sequences in their schema, fetched once
+        per schema, rather than querying the database for each.
+
+        """
+        self._existing_names = {}
+
+    def _get_existing_names(self, kind, schema, get_names):
+        key = (kind, schema)
+        if key not in self._existing_names:
+            try:
+                names = get_names(self.connection, schema)
+            except NotImplementedError:
+                self._existing_names[key] = None
+            else:
+                names = set(names)
+                self._existing_names[key] = (
+                    names, set(name.lower() for name in names))
+        return self._existing_names[key]
+
+    def _has_object(self, kind, name, schema, get_names, has_object):
+        if self._existing_names is not None:
+            existing = self._get_existing_names(kind, schema, get_names)
+            if existing is not None:
+                names, lowered = existing
+                if name in names:
+                    return True
+                elif name.lower() not in lowered:
+                    return False
+                # else, only the case differs; leave it to the
+                # database whether or not it's the same name
+
+        return has_object(self.connection, name, schema=schema)
+
+    def _has_table(self, table):
+        return self._has_object('table', table.name, table.schema,
+                                    self.dialect._get_existing_table_names,
+                                    self.dialect.has_table)
+
+    def _has_sequence(self, sequence):
+        return self._has_object('sequence', sequence.name, sequence.schema,
+                                    self.dialect._get_existing_sequence_names,
+                                    self.dialect.has_sequence)
 
 
 class SchemaGenerator(DDLBase):
@@ -631,9 +677,7 @@ class SchemaGenerator(DDLBase):
         self.dialect.validate_identifier(table.name)
         if table.schema:
             self.dialect.validate_identifier(table.schema)
-        return not self.checkfirst or \
-                not self.dialect.has_table(self.connection,
-                                    table.name, schema=table.schema)
+        return not self.checkfirst or not self._has_table(table)
 
     def _can_create_sequence(self, sequence):
         return self.dialect.supports_sequences and \
@@ -642,10 +686,7 @@ class SchemaGenerator(DDLBase):
                  not sequence.optional) and
                     (
                         not self.checkfirst or
-                        not self.dialect.has_sequence(
-                                self.connection,
-                                sequence.name,
-                                schema=sequence.schema)
+                        not self._has_sequence(sequence)
                      )
             )
 
@@ -654,6 +695,8 @@ class SchemaGenerator(DDLBase):
             tables = self.tables
         else:
             tables = list(metadata.tables.values())
+        if self.checkfirst and self.dialect.batch_checkfirst:
+            self._prefetch_existing_names()
         collection = [t for t in sort_tables(tables)
                         if self._can_create_table(t)]
         seq_coll = [s for s in metadata._sequences.values()
@@ -722,6 +765,8 @@ class SchemaDropper(DDLBase):
             tables = self.tables
         else:
             tables = list(metadata.tables.values())
+        if self.checkfirst and self.dialect.batch_checkfirst:
+            self._prefetch_existing_names()
 
         collection = [
             t
@@ -753,18 +798,14 @@ class SchemaDropper(DDLBase):
         self.dialect.validate_identifier(table.name)
         if table.schema:
             self.dialect.validate_identifier(table.schema)
-        return not self.checkfirst or self.dialect.has_table(self.connection,
-                                            table.name, schema=table.schema)
+        return not self.checkfirst or self._has_table(table)
 
     def _can_drop_sequence(self, sequence):
         return self.dialect.supports_sequences and \
             ((not self.dialect.sequences_optional or
                  not sequence.optional) and
                 (not self.checkfirst or
-                self.dialect.has_sequence(
-                                self.connection,
-                                sequence.name,
-                                schema=sequence.schema))
+                self._has_sequence(sequence))
             )
 
     def visit_index(self, index):
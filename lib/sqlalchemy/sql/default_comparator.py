@@ -13,7 +13,7 @@ from . import type_api
 from .elements import BindParameter, True_, False_, BinaryExpression, \
         Null, _const_expr, _clause_element_as_expr, \
         ClauseList, ColumnElement, TextClause, UnaryExpression, \
-        collate, _is_literal
+        Grouping, collate, _is_literal
 from .selectable import SelectBase, Alias, Selectable, ScalarSelect
 
 class _DefaultColumnComparator(operators.ColumnOperators):
@@ -146,6 +146,14 @@ class _DefaultColumnComparator(operators.ColumnOperators):
         elif isinstance(seq_or_selectable, (Selectable, TextClause)):
             return self._boolean_compare(expr, op, seq_or_selectable,
                                   negate=negate_op, **kw)
+        elif isinstance(seq_or_selectable, BindParameter) and \
+                seq_or_selectable.expanding:
+            # a single placeholder, expanded into the individual
+            # elements of the sequence at execution time
+            return self._boolean_compare(expr, op,
+                                  Grouping(self._check_literal(
+                                        expr, op, seq_or_selectable)),
+                                  negate=negate_op)
 
         # Handle non selectable arguments as sequences
         args = []
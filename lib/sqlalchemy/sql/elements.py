@@ -15,7 +15,7 @@ from .. import util, exc, inspection
 from . import type_api
 from . import operators
 from .visitors import Visitable, cloned_traverse, traverse
-from .annotation import Annotated
+from .annotation import Annotated, _memoized_annotation
 import itertools
 from .base import Executable, PARSE_AUTOCOMMIT, Immutable, NO_ARG
 import re
@@ -205,6 +205,15 @@ class ClauseElement(Visitable):
 
     _order_by_label_element = None
 
+    _chained_element = None
+    """The child element which continues a left-deep chain of like
+    elements, such as the ``a + b`` within ``a + b + c``, if any.
+
+    Traversals which would otherwise recurse once per link use this
+    to walk such chains iteratively.
+
+    """
+
     def _clone(self):
         """Create a shallow copy of this ClauseElement.
 
@@ -259,6 +268,7 @@ class ClauseElement(Visitable):
     def __getstate__(self):
         d = self.__dict__.copy()
         d.pop('_is_clone_of', None)
+        d.pop('_annotation_cache', None)
         return d
 
     def _annotate(self, values):
@@ -701,6 +711,7 @@ class BindParameter(ColumnElement):
                             unique=False, required=NO_ARG,
                             quote=None, callable_=None,
                             isoutparam=False,
+                            expanding=False,
                             _compared_to_operator=None,
                             _compared_to_type=None):
         """Construct a new :class:`.BindParameter`.
@@ -767,7 +778,27 @@ class BindParameter(ColumnElement):
 
                 :func:`.outparam`
 
+            :param expanding:
+              if True, this parameter will be treated as an "expanding"
+              parameter at execution time; the parameter value is expected
+              to be a sequence, rather than a scalar value, and the
+              statement will be rendered with one placeholder per element
+              only when it is executed.  This allows a single compiled
+              statement to be cached and reused for IN expressions
+              against sequences of any length::
+
+                stmt = select([table]).where(
+                            table.c.id.in_(bindparam('ids', expanding=True)))
+
+                conn.execute(stmt, ids=[1, 2, 3])
 
+              An empty sequence renders the IN expression in the same
+              way as :meth:`.ColumnOperators.in_` against an empty list,
+              i.e. comparing the left side to itself with ``!=``, or with
+              ``=`` for NOT IN.  Expanding parameters can't be used with
+              ``executemany()`` or with the "numeric" paramstyle.
+
+              .. versionadded:: 0.9.0
 
         """
         if isinstance(key, ColumnClause):
@@ -801,6 +832,7 @@ class BindParameter(ColumnElement):
         self.isoutparam = isoutparam
         self.required = required
         self.quote = quote
+        self.expanding = expanding
         if type_ is None:
             if _compared_to_type is not None:
                 self.type = \
@@ -1155,9 +1187,29 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    @property
+    def _chained_element(self):
+        if self.clauses and isinstance(self.clauses[0], ClauseList):
+            return self.clauses[0]
+        else:
+            return None
+
     @property
     def _from_objects(self):
-        return list(itertools.chain(*[c._from_objects for c in self.clauses]))
+        if not self.clauses or not isinstance(self.clauses[0], ClauseList):
+            return list(itertools.chain(
+                            *[c._from_objects for c in self.clauses]))
+
+        # unroll nested lists such as and_(and_(a, b), c) iteratively
+        chain = [self]
+        while chain[-1]._chained_element is not None:
+            chain.append(chain[-1]._chained_element)
+        froms = list(itertools.chain(
+                        *[c._from_objects for c in chain.pop().clauses]))
+        while chain:
+            for c in chain.pop().clauses[1:]:
+                froms.extend(c._from_objects)
+        return froms
 
     def self_group(self, against=None):
         if self.group and operators.is_precedent(self.operator, against):
@@ -1641,9 +1693,28 @@ class BinaryExpression(ColumnElement):
     def is_comparison(self):
         return operators.is_comparison(self.operator)
 
+    @property
+    def _chained_element(self):
+        if isinstance(self.left, BinaryExpression):
+            return self.left
+        else:
+            return None
+
     @property
     def _from_objects(self):
-        return self.left._from_objects + self.right._from_objects
+        if not isinstance(self.left, BinaryExpression):
+            return self.left._from_objects + self.right._from_objects
+
+        # unroll chains such as a + b + c iteratively
+        rights = []
+        element = self
+        while isinstance(element, BinaryExpression):
+            rights.append(element.right)
+            element = element.left
+        froms = list(element._from_objects)
+        for right in reversed(rights):
+            froms.extend(right._from_objects)
+        return froms
 
     def _copy_internals(self, clone=_clone, **kw):
         self.left = clone(self.left, **kw)
@@ -1986,9 +2057,16 @@ class ColumnClause(Immutable, ColumnElement):
 
     def _set_table(self, table):
         self._memoized_property.expire_instance(self)
+        self.__dict__.pop('_annotation_cache', None)
         self.__dict__['table'] = table
     table = property(_get_table, _set_table)
 
+    def _annotate(self, values):
+        return _memoized_annotation(self, values, Annotated)
+
+    def _with_annotations(self, values):
+        return _memoized_annotation(self, values, Annotated)
+
     @_memoized_property
     def _from_objects(self):
         t = self.table
@@ -2360,6 +2438,13 @@ class AnnotatedColumnElement(Annotated):
                 self.__dict__.pop(attr)
 
     def _with_annotations(self, values):
+        if isinstance(self, Immutable):
+            return _memoized_annotation(self, values,
+                        AnnotatedColumnElement._copy_with_annotations)
+        else:
+            return self._copy_with_annotations(values)
+
+    def _copy_with_annotations(self, values):
         clone = super(AnnotatedColumnElement, self)._with_annotations(values)
         ColumnElement.comparator._reset(clone)
         return clone
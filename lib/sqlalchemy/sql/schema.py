@@ -368,6 +368,7 @@ class Table(SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop('autoload_replace', True)
         include_columns = kwargs.pop('include_columns', None)
+        _reflect_info = kwargs.pop('_reflect_info', None)
 
         self.implicit_returning = kwargs.pop('implicit_returning', True)
         self.quote = kwargs.pop('quote', None)
@@ -386,24 +387,33 @@ class Table(SchemaItem, TableClause):
         # we do it after the table is in the singleton dictionary to support
         # circular foreign keys
         if autoload:
-            self._autoload(metadata, autoload_with, include_columns)
+            self._autoload(metadata, autoload_with, include_columns,
+                                _reflect_info=_reflect_info)
 
         # initialize all the column, etc. objects.  done after reflection to
         # allow user-overrides
         self._init_items(*args)
 
     def _autoload(self, metadata, autoload_with, include_columns,
-                  exclude_columns=()):
+                  exclude_columns=(), _reflect_info=None):
         if self.primary_key.columns:
             PrimaryKeyConstraint(*[
                 c for c in self.primary_key.columns
                 if c.key in exclude_columns
             ])._set_parent_with_dispatch(self)
 
+        # reflection info fetched up front by MetaData.reflect()
+        # is only passed along if present, as dialects may
+        # implement reflecttable() without it
+        if _reflect_info is not None:
+            reflect_kw = {'_reflect_info': _reflect_info}
+        else:
+            reflect_kw = {}
+
         if autoload_with:
             autoload_with.run_callable(
                 autoload_with.dialect.reflecttable,
-                self, include_columns, exclude_columns
+                self, include_columns, exclude_columns, **reflect_kw
             )
         else:
             bind = _bind_or_error(metadata,
@@ -414,7 +424,7 @@ class Table(SchemaItem, TableClause):
                     "metadata.bind=<someengine>")
             bind.run_callable(
                     bind.dialect.reflecttable,
-                    self, include_columns, exclude_columns
+                    self, include_columns, exclude_columns, **reflect_kw
                 )
 
     @property
@@ -436,6 +446,7 @@ class Table(SchemaItem, TableClause):
                 (self.schema, schema))
 
         include_columns = kwargs.pop('include_columns', None)
+        _reflect_info = kwargs.pop('_reflect_info', None)
 
         if include_columns is not None:
             for c in self.c:
@@ -455,7 +466,8 @@ class Table(SchemaItem, TableClause):
             else:
                 exclude_columns = ()
             self._autoload(
-                self.metadata, autoload_with, include_columns, exclude_columns)
+                self.metadata, autoload_with, include_columns, exclude_columns,
+                _reflect_info=_reflect_info)
 
         self._extra_kwargs(**kwargs)
         self._init_items(*args)
@@ -1139,25 +1151,52 @@ class Column(SchemaItem, ColumnClause):
             raise exc.InvalidRequestError("Cannot initialize a sub-selectable"
                     " with this Column object until it's 'name' has "
                     "been assigned.")
-        try:
-            c = self._constructor(
-                _as_truncated(name or self.name) if \
-                                name_is_truncatable else (name or self.name),
-                self.type,
-                key=key if key else name if name else self.key,
-                primary_key=self.primary_key,
-                nullable=self.nullable,
-                quote=self.quote,
-                _proxies=[self], *fk)
-        except TypeError:
-            util.raise_from_cause(
-                TypeError(
-                    "Could not create a copy of this %r object.  "
-                    "Ensure the class includes a _constructor() "
-                    "attribute or method which accepts the "
-                    "standard Column constructor arguments, or "
-                    "references the Column class itself." % self.__class__)
-                )
+
+        # the same column tends to be proxied over and over, e.g. for
+        # each alias() of its table generated by ORM eager loading;
+        # after the first proxy is built with the constructor, further
+        # plain Column proxies with the same arguments are copied from
+        # its initial state instead.
+        template_key = (name.__class__, name, key.__class__, key,
+                            name_is_truncatable, self.name, self.key,
+                            self.type, self.primary_key, self.nullable,
+                            self.quote)
+        template = self._proxy_templates.get(template_key)
+        if template is not None:
+            c = Column.__new__(Column)
+            c.__dict__ = template.copy()
+            c.constraints = set()
+            c.foreign_keys = set()
+            c._proxies = [self]
+            util.set_creation_order(c)
+        else:
+            try:
+                c = self._constructor(
+                    _as_truncated(name or self.name) if \
+                                    name_is_truncatable else \
+                                    (name or self.name),
+                    self.type,
+                    key=key if key else name if name else self.key,
+                    primary_key=self.primary_key,
+                    nullable=self.nullable,
+                    quote=self.quote,
+                    _proxies=[self])
+            except TypeError:
+                util.raise_from_cause(
+                    TypeError(
+                        "Could not create a copy of this %r object.  "
+                        "Ensure the class includes a _constructor() "
+                        "attribute or method which accepts the "
+                        "standard Column constructor arguments, or "
+                        "references the Column class itself." % self.__class__)
+                    )
+            if c.__class__ is Column:
+                template = c.__dict__.copy()
+                del template['_proxies']
+                self._proxy_templates[template_key] = template
+
+        if fk:
+            c._init_items(*fk)
 
         c.table = selectable
         selectable._columns.add(c)
@@ -1168,6 +1207,10 @@ class Column(SchemaItem, ColumnClause):
         c.dispatch.after_parent_attach(c, selectable)
         return c
 
+    @util.memoized_property
+    def _proxy_templates(self):
+        return {}
+
     def get_children(self, schema_visitor=False, **kwargs):
         if schema_visitor:
             return [x for x in (self.default, self.onupdate)
@@ -2805,7 +2848,8 @@ class MetaData(SchemaItem):
         """
         return ddl.sort_tables(self.tables.values())
 
-    def reflect(self, bind=None, schema=None, views=False, only=None):
+    def reflect(self, bind=None, schema=None, views=False, only=None,
+                                reflection_cache=None, parallel=None):
         """Load all available table definitions from the database.
 
         Automatically creates ``Table`` entries in this ``MetaData`` for any
@@ -2840,6 +2884,37 @@ class MetaData(SchemaItem):
           with a table name and this ``MetaData`` instance as positional
           arguments and should return a true value for any table to reflect.
 
+        :param reflection_cache:
+          Optional, a :class:`.ReflectionCache` such as
+          :class:`.FileReflectionCache`, which will store the reflection
+          information for all tables in the schema, so that subsequent
+          calls, including those made in other processes, can construct
+          the :class:`.Table` objects without reflecting the schema again,
+          as long as the schema's definition hasn't changed.   Whether or
+          not it has changed is determined using a fingerprint of the
+          schema provided by the dialect, currently implemented for
+          SQLite and Postgresql; other dialects ignore this argument.
+
+          .. versionadded:: 0.9.0
+
+        :param parallel:
+          Optional, a number of threads among which the tables to be
+          reflected are divided.  Each thread checks out its own
+          connection from the engine's connection pool, which should
+          therefore allow at least this many connections, and queries
+          the database for its share of the tables; the
+          :class:`.Table` objects are then constructed in the calling
+          thread.   This is of most benefit for dialects which reflect
+          each table individually, and for high latency connections;
+          dialects which reflect many tables with one query for each
+          kind of information, such as Postgresql and SQLite 3.16 or
+          greater, ignore this option.
+          Note that the additional connections don't see tables created
+          within a transaction which isn't yet committed; such tables
+          are reflected using ``bind`` as usual.
+
+          .. versionadded:: 0.9.0
+
         """
         if bind is None:
             bind = _bind_or_error(self)
@@ -2857,12 +2932,24 @@ class MetaData(SchemaItem):
             if schema is not None:
                 reflect_opts['schema'] = schema
 
-            available = util.OrderedSet(bind.engine.table_names(schema,
-                                                            connection=conn))
-            if views:
-                available.update(
-                    bind.dialect.get_view_names(conn, schema)
-                )
+            cached = None
+            if reflection_cache is not None:
+                insp = inspection.inspect(conn)
+                cached = insp._get_cached_reflection_info(
+                                        reflection_cache, schema, views,
+                                        parallel=parallel)
+
+            if cached is not None:
+                table_names, reflect_info = cached
+                available = util.OrderedSet(table_names)
+            else:
+                reflect_info = None
+                available = util.OrderedSet(
+                            bind.engine.table_names(schema, connection=conn))
+                if views:
+                    available.update(
+                        bind.dialect.get_view_names(conn, schema)
+                    )
 
             if schema is not None:
                 available_w_schema = util.OrderedSet(["%s.%s" % (schema, name)
@@ -2890,6 +2977,25 @@ class MetaData(SchemaItem):
                         (bind.engine.url, s, ', '.join(missing)))
                 load = [name for name in only if name not in current]
 
+            if util.get_callable_argspec(
+                            bind.dialect.reflecttable)[2] is None:
+                # the dialect implements reflecttable() without
+                # **kw, and can't accept the reflection info
+                pass
+            elif reflect_info is not None:
+                reflect_opts['_reflect_info'] = reflect_info
+            elif len(load) > 1 and (
+                        bind.dialect.supports_multi_reflection or
+                        (parallel and parallel > 1)):
+                # fetch columns, constraints and indexes for all the
+                # tables being loaded up front, so that dialects
+                # supporting it can use one query for each, rather
+                # than several queries per table.
+                insp = inspection.inspect(conn)
+                reflect_opts['_reflect_info'] = \
+                            insp._get_reflection_info(schema, load,
+                                                    parallel=parallel)
+
             for name in load:
                 Table(name, self, **reflect_opts)
 
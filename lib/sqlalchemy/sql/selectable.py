@@ -267,9 +267,15 @@ class FromClause(Selectable):
             return column
         col, intersect = None, None
         target_set = column.proxy_set
-        cols = self.c
-        for c in cols:
-            expanded_proxy_set = set(_expand_cloned(c.proxy_set))
+        if self._cols_populated:
+            # only look at those columns which proxy the target in
+            # some way, located via an index maintained by the
+            # collection itself
+            cols = self._columns._proxy_candidates(target_set)
+        else:
+            cols = [(c, set(_expand_cloned(c.proxy_set)))
+                        for c in self.c]
+        for c, expanded_proxy_set in cols:
             i = target_set.intersection(expanded_proxy_set)
             if i and (not require_embedded
                       or embedded(expanded_proxy_set, target_set)):
@@ -1418,9 +1424,13 @@ class SelectBase(Executable, FromClause):
         if len(clauses) == 1 and clauses[0] is None:
             self._order_by_clause = ClauseList()
         else:
+            clauselist = ClauseList(*clauses)
             if getattr(self, '_order_by_clause', None) is not None:
-                clauses = list(self._order_by_clause) + list(clauses)
-            self._order_by_clause = ClauseList(*clauses)
+                # the existing clauses are already coerced; share them
+                # rather than coercing each one again on every call
+                clauselist.clauses = self._order_by_clause.clauses + \
+                                        clauselist.clauses
+            self._order_by_clause = clauselist
 
     def append_group_by(self, *clauses):
         """Append the given GROUP BY criterion applied to this selectable.
@@ -1435,9 +1445,13 @@ class SelectBase(Executable, FromClause):
         if len(clauses) == 1 and clauses[0] is None:
             self._group_by_clause = ClauseList()
         else:
+            clauselist = ClauseList(*clauses)
             if getattr(self, '_group_by_clause', None) is not None:
-                clauses = list(self._group_by_clause) + list(clauses)
-            self._group_by_clause = ClauseList(*clauses)
+                # the existing clauses are already coerced; share them
+                # rather than coercing each one again on every call
+                clauselist.clauses = self._group_by_clause.clauses + \
+                                        clauselist.clauses
+            self._group_by_clause = clauselist
 
     @property
     def _from_objects(self):
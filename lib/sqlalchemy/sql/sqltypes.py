@@ -153,6 +153,14 @@ class String(Concatenable, TypeEngine):
         self.unicode_error = unicode_error
         self._warn_on_bytestring = _warn_on_bytestring
 
+    def literal_processor(self, dialect):
+        def process(value):
+            if not isinstance(value, util.string_types):
+                value = util.text_type(value)
+            value = value.replace("'", "''")
+            return "'%s'" % value
+        return process
+
     def bind_processor(self, dialect):
         if self.convert_unicode or dialect.convert_unicode:
             if dialect.supports_unicode_binds and \
@@ -344,6 +352,11 @@ class Integer(_DateAffinity, TypeEngine):
     def python_type(self):
         return int
 
+    def literal_processor(self, dialect):
+        def process(value):
+            return str(int(value))
+        return process
+
     @util.memoized_property
     def _expression_adaptations(self):
         # TODO: need a dictionary object that will
@@ -487,6 +500,16 @@ class Numeric(_DateAffinity, TypeEngine):
         else:
             return float
 
+    def literal_processor(self, dialect):
+        def process(value):
+            if isinstance(value, float):
+                return repr(value)
+            else:
+                # coerce through Decimal so that only a number
+                # can be rendered
+                return str(decimal.Decimal(value))
+        return process
+
     def bind_processor(self, dialect):
         if dialect.supports_native_decimal:
             return None
@@ -642,6 +665,11 @@ class DateTime(_DateAffinity, TypeEngine):
     def python_type(self):
         return dt.datetime
 
+    def literal_processor(self, dialect):
+        def process(value):
+            return "'%s'" % value.isoformat(' ')
+        return process
+
     @util.memoized_property
     def _expression_adaptations(self):
         return {
@@ -667,6 +695,11 @@ class Date(_DateAffinity, TypeEngine):
     def python_type(self):
         return dt.date
 
+    def literal_processor(self, dialect):
+        def process(value):
+            return "'%s'" % value.isoformat()
+        return process
+
     @util.memoized_property
     def _expression_adaptations(self):
         return {
@@ -707,6 +740,11 @@ class Time(_DateAffinity, TypeEngine):
     def python_type(self):
         return dt.time
 
+    def literal_processor(self, dialect):
+        def process(value):
+            return "'%s'" % value.isoformat()
+        return process
+
     @util.memoized_property
     def _expression_adaptations(self):
         return {
@@ -1208,6 +1246,16 @@ class Boolean(TypeEngine, SchemaType):
     def python_type(self):
         return bool
 
+    def literal_processor(self, dialect):
+        if dialect.supports_native_boolean:
+            true, false = 'true', 'false'
+        else:
+            true, false = '1', '0'
+
+        def process(value):
+            return value and true or false
+        return process
+
     def bind_processor(self, dialect):
         if dialect.supports_native_boolean:
             return None
@@ -1279,6 +1327,16 @@ class Interval(_DateAffinity, TypeDecorator):
     def python_type(self):
         return dt.timedelta
 
+    def literal_processor(self, dialect):
+        impl_processor = self.impl.literal_processor(dialect)
+        if impl_processor is None:
+            return None
+        epoch = self.epoch
+
+        def process(value):
+            return impl_processor(epoch + value)
+        return process
+
     def bind_processor(self, dialect):
         impl_processor = self.impl.bind_processor(dialect)
         epoch = self.epoch
@@ -75,6 +75,28 @@ class TypeEngine(Visitable):
     def copy_value(self, value):
         return value
 
+    def literal_processor(self, dialect):
+        """Return a conversion function for processing literal values that are
+        to be rendered directly without using binds.
+
+        Returns a callable which will receive a Python value as the
+        sole positional argument and will return a string containing
+        the SQL literal for that value, as used when a statement is
+        compiled with the ``literal_binds`` flag or when
+        :meth:`.SQLCompiler.literal_statements` is used.  The value
+        passed is never ``None``; ``NULL`` is rendered separately.
+
+        If no processor is provided, the compiler falls back to
+        rendering strings and numbers based on their Python type,
+        after applying this type's bind processor.
+
+        :param dialect: Dialect instance in use.
+
+        .. versionadded:: 0.9.0
+
+        """
+        return None
+
     def bind_processor(self, dialect):
         """Return a conversion function for processing bind values.
 
@@ -275,6 +297,16 @@ class TypeEngine(Visitable):
             d['bind'] = bp = d['impl'].bind_processor(dialect)
             return bp
 
+    def _cached_literal_processor(self, dialect):
+        """Return a dialect-specific literal processor for this type."""
+
+        try:
+            return dialect._type_memos[self]['literal']
+        except KeyError:
+            d = self._dialect_info(dialect)
+            d['literal'] = lp = d['impl'].literal_processor(dialect)
+            return lp
+
     def _cached_result_processor(self, dialect, coltype):
         """Return a dialect-specific result processor for this type."""
 
@@ -697,6 +729,25 @@ class TypeDecorator(TypeEngine):
 
         raise NotImplementedError()
 
+    def process_literal_param(self, value, dialect):
+        """Receive a literal parameter value to be rendered inline within
+        a statement.
+
+        This method is used when the compiler renders a
+        literal value without using binds, typically within DDL
+        such as in the "server default" of a column or an expression
+        within a CHECK constraint, or when a statement is compiled
+        with the ``literal_binds`` flag.
+
+        The returned value is passed along to the literal processor
+        of ``self.impl``.  If this method is not implemented,
+        :meth:`process_bind_param` is used in its place.
+
+        .. versionadded:: 0.9.0
+
+        """
+        raise NotImplementedError()
+
     def process_result_value(self, value, dialect):
         """Receive a result-row column value to be converted.
 
@@ -771,6 +822,57 @@ class TypeDecorator(TypeEngine):
         else:
             return self.impl.bind_processor(dialect)
 
+    @util.memoized_property
+    def _has_literal_processor(self):
+        """memoized boolean, check if process_literal_param is implemented.
+
+        """
+
+        return self.__class__.process_literal_param.__code__ \
+            is not TypeDecorator.process_literal_param.__code__
+
+    def literal_processor(self, dialect):
+        """Provide a literal processing function for the given
+        :class:`.Dialect`.
+
+        Subclasses here will typically override
+        :meth:`.TypeDecorator.process_literal_param` instead of this method
+        directly.
+
+        By default, this method makes use of
+        :meth:`.TypeDecorator.process_bind_param` if that method is
+        implemented, where :meth:`.TypeDecorator.process_literal_param` is
+        not.  The rationale here is that :class:`.TypeDecorator` typically
+        deals with Python conversions of data that are above the layer of
+        database presentation.  With the value converted by
+        :meth:`.TypeDecorator.process_bind_param`, the underlying type will
+        then handle whether it needs to be presented to the DBAPI as a
+        bound parameter or to the database as an inline SQL value.
+
+        .. versionadded:: 0.9.0
+
+        """
+        if self._has_literal_processor:
+            process_param = self.process_literal_param
+        elif self._has_bind_processor:
+            process_param = self.process_bind_param
+        else:
+            process_param = None
+
+        impl_processor = self.impl.literal_processor(dialect)
+        if process_param is None or impl_processor is None:
+            # if the impl has no literal rendering of its own, the
+            # compiler renders the value based on its Python type
+            # after applying the full bind processor
+            return impl_processor
+
+        def process(value):
+            value = process_param(value, dialect)
+            if value is None:
+                return "NULL"
+            return impl_processor(value)
+        return process
+
     @util.memoized_property
     def _has_result_processor(self):
         """memoized boolean, check if process_result_value is implemented.
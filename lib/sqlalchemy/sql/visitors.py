@@ -25,7 +25,7 @@ http://techspot.zzzeek.org/2008/01/23/expression-transformations/
 
 from collections import deque
 from .. import util
-import operator
+import types
 from .. import exc
 
 __all__ = ['VisitableType', 'Visitable', 'ClauseVisitor',
@@ -64,19 +64,23 @@ def _generate_dispatch(cls):
     """
     if '__visit_name__' in cls.__dict__:
         visit_name = cls.__visit_name__
-        if isinstance(visit_name, str):
+        if isinstance(visit_name, util.string_types):
             # There is an optimization opportunity here because the
             # the string name of the class's __visit_name__ is known at
             # this early stage (import time) so it can be pre-constructed.
-            getter = operator.attrgetter("visit_%s" % visit_name)
+            # The visit method is located once per visitor class and
+            # stored in a dispatch table, so that each call is a
+            # dictionary lookup and a plain function call.
+            visit_attr = str("visit_%s" % visit_name)
+            dispatch = {}
 
             def _compiler_dispatch(self, visitor, **kw):
                 try:
-                    meth = getter(visitor)
-                except AttributeError:
-                    raise exc.UnsupportedCompilationError(visitor, cls)
-                else:
-                    return meth(self, **kw)
+                    fn = dispatch[visitor.__class__]
+                except KeyError:
+                    fn = dispatch[visitor.__class__] = \
+                            _dispatch_for(visitor, visit_attr, cls)
+                return fn(visitor, self, **kw)
         else:
             # The optimization opportunity is lost for this case because the
             # __visit_name__ is not yet a string. As a result, the visit
@@ -97,6 +101,30 @@ def _generate_dispatch(cls):
         cls._compiler_dispatch = _compiler_dispatch
 
 
+def _dispatch_for(visitor, visit_attr, cls):
+    """Locate the function which handles the given visit name
+    for the class of the given visitor.
+
+    Plain functions defined on the visitor's class are returned
+    directly; other kinds of attributes are looked up on the visitor
+    at call time.
+
+    """
+    for klass in visitor.__class__.__mro__:
+        if visit_attr in klass.__dict__:
+            fn = klass.__dict__[visit_attr]
+            if isinstance(fn, types.FunctionType):
+                return fn
+            break
+    else:
+        if not hasattr(visitor, visit_attr):
+            raise exc.UnsupportedCompilationError(visitor, cls)
+
+    def fn(visitor, element, **kw):
+        return getattr(visitor, visit_attr)(element, **kw)
+    return fn
+
+
 class Visitable(util.with_metaclass(VisitableType, object)):
     """Base class for visitable objects, applies the
     ``VisitableType`` metaclass.
@@ -275,11 +303,22 @@ def cloned_traverse(obj, opts, visitors):
             return elem
         else:
             if id(elem) not in cloned:
-                cloned[id(elem)] = newelem = elem._clone()
-                newelem._copy_internals(clone=clone)
-                meth = visitors.get(newelem.__visit_name__, None)
-                if meth:
-                    meth(newelem)
+                # clone a left-deep chain such as a + b + c from the
+                # innermost link outwards, so that each link's
+                # _copy_internals() finds its chained child already
+                # cloned rather than recursing into it
+                chain = [elem]
+                link = getattr(elem, '_chained_element', None)
+                while link is not None and link not in stop_on and \
+                        id(link) not in cloned:
+                    chain.append(link)
+                    link = link._chained_element
+                for link in reversed(chain):
+                    cloned[id(link)] = newelem = link._clone()
+                    newelem._copy_internals(clone=clone)
+                    meth = visitors.get(newelem.__visit_name__, None)
+                    if meth:
+                        meth(newelem)
             return cloned[id(elem)]
 
     if obj is not None:
@@ -293,20 +332,41 @@ def replacement_traverse(obj, opts, replace):
 
     cloned = {}
     stop_on = set([id(x) for x in opts.get('stop_on', [])])
+    replaced = {}
 
     def clone(elem, **kw):
         if id(elem) in stop_on or \
             'no_replacement_traverse' in elem._annotations:
             return elem
         else:
-            newelem = replace(elem)
+            if id(elem) in replaced:
+                newelem = replaced.pop(id(elem))
+            else:
+                newelem = replace(elem)
             if newelem is not None:
                 stop_on.add(id(newelem))
                 return newelem
             else:
                 if elem not in cloned:
-                    cloned[elem] = newelem = elem._clone()
-                    newelem._copy_internals(clone=clone, **kw)
+                    # as in cloned_traverse(), clone a left-deep chain
+                    # from the innermost link outwards.  replace() is
+                    # consulted for each link from the top down, same as
+                    # a recursive traversal would, and its answer kept
+                    # for when the link's parent asks for its clone.
+                    chain = [elem]
+                    link = getattr(elem, '_chained_element', None)
+                    while link is not None and link not in cloned and \
+                            id(link) not in stop_on and \
+                            'no_replacement_traverse' not in \
+                                link._annotations:
+                        replaced[id(link)] = newlink = replace(link)
+                        if newlink is not None:
+                            break
+                        chain.append(link)
+                        link = link._chained_element
+                    for link in reversed(chain):
+                        cloned[link] = newelem = link._clone()
+                        newelem._copy_internals(clone=clone, **kw)
                 return cloned[elem]
 
     if obj is not None:
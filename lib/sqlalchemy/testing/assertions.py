@@ -181,7 +181,8 @@ class AssertsCompiledSQL(object):
                         checkparams=None, dialect=None,
                         checkpositional=None,
                         use_default_dialect=False,
-                        allow_dialect_select=False):
+                        allow_dialect_select=False,
+                        literal_binds=False):
         if use_default_dialect:
             dialect = default.DefaultDialect()
         elif allow_dialect_select:
@@ -202,6 +203,9 @@ class AssertsCompiledSQL(object):
         if params is not None:
             kw['column_keys'] = list(params)
 
+        if literal_binds:
+            kw['compile_kwargs'] = {'literal_binds': True}
+
         if isinstance(clause, orm.Query):
             context = clause._compile_context()
             context.statement.use_labels = True
@@ -4,7 +4,7 @@ from .. import fixtures, config, util
 from ..config import requirements
 from ..assertions import eq_
 
-from sqlalchemy import Table, Column, Integer, String
+from sqlalchemy import MetaData, Table, Column, Integer, String
 
 
 class TableDDLTest(fixtures.TestBase):
@@ -44,5 +44,20 @@ class TableDDLTest(fixtures.TestBase):
             config.db, checkfirst=False
         )
 
+    @requirements.views
+    @util.provide_metadata
+    def test_create_all_checkfirst_existing_view(self):
+        table = self._simple_fixture()
+        table.create(config.db, checkfirst=False)
+        config.db.execute(
+                "CREATE VIEW test_view AS SELECT id, data FROM test_table")
+        try:
+            # the view counts as an existing table, as with has_table()
+            m = MetaData()
+            Table('test_view', m, Column('id', Integer))
+            m.create_all(config.db, checkfirst=True)
+        finally:
+            config.db.execute("DROP VIEW test_view")
+
 
 __all__ = ('TableDDLTest', )
@@ -361,6 +361,52 @@ class ComponentReflectionTest(fixtures.TablesTest):
     def test_get_indexes_with_schema(self):
         self._test_get_indexes(schema='test_schema')
 
+    def _test_get_multi(self, schema=None, table_names=None):
+        insp = inspect(testing.db)
+
+        def _columns(cols):
+            # types are compared on class only
+            return [
+                dict(col, type=col['type'].__class__) for col in cols
+            ]
+
+        def _indexes(indexes):
+            return sorted(indexes, key=lambda idx: idx['name'])
+
+        kinds = [('columns', _columns), ('pk_constraint', lambda pk: pk)]
+        if testing.requires.foreign_key_constraint_reflection.enabled:
+            kinds.append(('foreign_keys', lambda fks: fks))
+        if testing.requires.index_reflection.enabled:
+            kinds.append(('indexes', _indexes))
+
+        expected_names = table_names
+        if expected_names is None:
+            expected_names = insp.get_table_names(schema=schema)
+
+        for kind, normalize in kinds:
+            multi = getattr(insp, 'get_multi_%s' % kind)(
+                                schema=schema, table_names=table_names)
+            eq_(set(multi), set(expected_names))
+            for table_name in expected_names:
+                eq_(
+                    normalize(multi[table_name]),
+                    normalize(getattr(insp, 'get_%s' % kind)(
+                                table_name, schema=schema))
+                )
+
+    @testing.requires.table_reflection
+    def test_get_multi(self):
+        self._test_get_multi()
+
+    @testing.requires.table_reflection
+    def test_get_multi_table_names(self):
+        self._test_get_multi(table_names=['users', 'dingalings'])
+
+    @testing.requires.table_reflection
+    @testing.requires.schemas
+    def test_get_multi_with_schema(self):
+        self._test_get_multi(schema='test_schema')
+
 
     @testing.requires.unique_constraint_reflection
     def test_get_unique_constraints(self):
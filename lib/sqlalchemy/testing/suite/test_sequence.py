@@ -3,7 +3,7 @@ from ..config import requirements
 from ..assertions import eq_
 from ... import testing
 
-from ... import Integer, String, Sequence, schema
+from ... import Integer, String, Sequence, schema, inspect
 
 from ..schema import Table, Column
 
@@ -123,4 +123,25 @@ class HasSequenceTest(fixtures.TestBase):
         finally:
             testing.db.execute(schema.DropSequence(s1))
 
+    def test_get_sequence_names(self):
+        s1 = Sequence('user_id_seq')
+        testing.db.execute(schema.CreateSequence(s1))
+        try:
+            names = inspect(testing.db).get_sequence_names()
+            assert 'user_id_seq' in names
+        finally:
+            testing.db.execute(schema.DropSequence(s1))
+
+    @testing.requires.schemas
+    def test_get_sequence_names_schema(self):
+        s1 = Sequence('user_id_seq', schema="test_schema")
+        testing.db.execute(schema.CreateSequence(s1))
+        try:
+            insp = inspect(testing.db)
+            assert 'user_id_seq' in \
+                    insp.get_sequence_names(schema="test_schema")
+            assert 'user_id_seq' not in insp.get_sequence_names()
+        finally:
+            testing.db.execute(schema.DropSequence(s1))
+
 
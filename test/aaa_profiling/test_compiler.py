@@ -72,4 +72,30 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
         def go():
             s = select([t1], t1.c.c2 == t2.c.c1).apply_labels()
             s.compile(dialect=self.dialect)
-        go()
\ No newline at end of file
+        go()
+
+    def test_select_wide_or(self):
+        s = select([t1]).where(
+                    or_(*[
+                        and_(t1.c.c1 == i, t1.c.c2 != 'value %d' % i)
+                        for i in range(100)
+                    ])
+                )
+        s.compile(dialect=self.dialect)
+
+        @profiling.function_call_count()
+        def go():
+            s.compile(dialect=self.dialect)
+        go()
+
+    def test_select_deep_binary(self):
+        expr = t1.c.c1
+        for i in range(100):
+            expr = expr + t2.c.c1
+        s = select([expr])
+        s.compile(dialect=self.dialect)
+
+        @profiling.function_call_count()
+        def go():
+            s.compile(dialect=self.dialect)
+        go()
@@ -181,6 +181,77 @@ class LoadManyToOneFromIdentityTest(fixtures.MappedTest):
                 p.child
         go()
 
+class LazyLoadCollectionTest(fixtures.MappedTest):
+    """test overhead associated with one-to-many lazy loads.
+
+    Lazy loads with no options in effect make use of a
+    query compiled once per relationship, so that each
+    load only supplies bound parameter values.
+
+    """
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+                    Column('id', Integer, primary_key=True),
+                    Column('data', String(20))
+                )
+
+        Table('child', metadata,
+                    Column('id', Integer, primary_key=True),
+                    Column('data', String(20)),
+                    Column('parent_id', Integer, ForeignKey('parent.id'))
+                )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+
+        class Child(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Child, Parent, parent, child = (cls.classes.Child,
+                                cls.classes.Parent,
+                                cls.tables.parent,
+                                cls.tables.child)
+
+        mapper(Parent, parent, properties={
+            'children': relationship(Child, order_by=child.c.id)})
+        mapper(Child, child)
+
+    @classmethod
+    def insert_data(cls):
+        parent, child = cls.tables.parent, cls.tables.child
+
+        parent.insert().execute([
+            {'id': i, 'data': 'p%d' % i}
+            for i in range(1, 101)
+        ])
+        child.insert().execute([
+            {
+                'id': i,
+                'data': 'c%d' % i,
+                'parent_id': (i % 100) + 1
+            }
+            for i in range(1, 501)
+        ])
+
+    def test_one_to_many_lazyload(self):
+        Parent = self.classes.Parent
+
+        sess = Session()
+        parents = sess.query(Parent).all()
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            for p in parents:
+                p.children
+        go()
+
+
 class MergeBackrefsTest(fixtures.MappedTest):
 
     @classmethod
@@ -310,3 +381,97 @@ class DeferOptionsTest(fixtures.MappedTest):
             *[defer(letter) for letter in ['x', 'y', 'z', 'p', 'q', 'r']]).\
             all()
 
+
+class AnnotatedFilterTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('data', String(20)))
+        Table('child', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('data', String(20)),
+            Column('parent_id', Integer, ForeignKey('parent.id'))
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Basic):
+            pass
+        class Child(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Child, Parent, parent, child = (cls.classes.Child,
+                                cls.classes.Parent,
+                                cls.tables.parent,
+                                cls.tables.child)
+
+        mapper(Parent, parent, properties={
+            'children': relationship(Child, backref='parent')
+        })
+        mapper(Child, child)
+
+    def test_build_filters(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = Session()
+        p1 = Parent(id=5)
+
+        def build():
+            for i in range(100):
+                sess.query(Parent).\
+                    filter(Parent.data == 'p%d' % i).\
+                    filter(Parent.children.any(Child.data == 'c%d' % i))
+                sess.query(Child).filter(Child.parent == p1)
+
+        # warm up memoized annotations on mapped columns
+        build()
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            build()
+        go()
+
+
+class FlushUpdateTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('a', metadata,
+            Column('id', Integer, primary_key=True),
+            *[Column('c%d' % i, String(20)) for i in range(20)]
+        )
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        A = cls.classes.A
+        a = cls.tables.a
+        mapper(A, a)
+
+    @classmethod
+    def insert_data(cls):
+        A = cls.classes.A
+        s = Session()
+        s.add_all([
+            A(id=i, **dict(('c%d' % j, 'v%d' % j) for j in range(20)))
+            for i in range(1, 201)
+        ])
+        s.commit()
+
+    def test_update_one_column(self):
+        # the history of only the one changed attribute of each
+        # object is checked, rather than that of all twenty columns
+        A = self.classes.A
+        sess = Session()
+        for a in sess.query(A).all():
+            a.c5 = 'new value'
+
+        @profiling.function_call_count(variance=.10)
+        def go():
+            sess.flush()
+        go()
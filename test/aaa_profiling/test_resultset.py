@@ -4,6 +4,10 @@ from sqlalchemy import testing
 from sqlalchemy.testing import eq_
 from sqlalchemy.util import u
 from sqlalchemy.engine.result import RowProxy
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import base as postgresql_base, \
+    psycopg2 as postgresql_psycopg2
+import datetime
 import sys
 
 NUM_FIELDS = 10
@@ -14,12 +18,17 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
 
     @classmethod
     def setup_class(cls):
-        global t, t2, metadata
+        global t, t2, t3, metadata
         metadata = MetaData(testing.db)
         t = Table('table', metadata, *[Column('field%d' % fnum, String(50))
                   for fnum in range(NUM_FIELDS)])
         t2 = Table('table2', metadata, *[Column('field%d' % fnum,
                    Unicode(50)) for fnum in range(NUM_FIELDS)])
+        t3 = Table('table3', metadata,
+                   Column('created', DateTime),
+                   Column('updated', DateTime),
+                   Column('day', Date),
+                   Column('time', Time))
 
     def setup(self):
         metadata.create_all()
@@ -29,10 +38,15 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
         t2.insert().execute([dict(('field%d' % fnum, u('value%d' % fnum))
                             for fnum in range(NUM_FIELDS)) for r_num in
                             range(NUM_RECORDS)])
+        now = datetime.datetime(2013, 10, 15, 12, 57, 18, 54321)
+        t3.insert().execute([dict(created=now, updated=now,
+                                day=now.date(), time=now.time())
+                            for r_num in range(NUM_RECORDS)])
 
         # warm up type caches
         t.select().execute().fetchall()
         t2.select().execute().fetchall()
+        t3.select().execute().fetchall()
 
     def teardown(self):
         metadata.drop_all()
@@ -45,6 +59,33 @@ class ResultSetTest(fixtures.TestBase, AssertsExecutionResults):
     def test_unicode(self):
         [tuple(row) for row in t2.select().execute().fetchall()]
 
+    @profiling.function_call_count()
+    def test_datetime(self):
+        [tuple(row) for row in t3.select().execute().fetchall()]
+
+    def test_insert_executemany(self):
+        params = [dict(('field%d' % fnum, u('value%d' % fnum))
+                    for fnum in range(NUM_FIELDS))
+                    for r_num in range(NUM_RECORDS)]
+        stmt = t2.insert()
+
+        @profiling.function_call_count()
+        def go():
+            testing.db.execute(stmt, params)
+        go()
+
+    def test_cached_statement(self):
+        stmt = t.select().limit(1)
+        conn = testing.db.connect().execution_options(compiled_cache={})
+        conn.execute(stmt).fetchall()
+
+        @profiling.function_call_count()
+        def go():
+            for i in range(100):
+                conn.execute(stmt).fetchall()
+        go()
+        conn.close()
+
     def test_contains_doesnt_compile(self):
         row = t.select().execute().first()
         c1 = Column('some column', Integer) + Column("some other column", Integer)
@@ -79,6 +120,57 @@ class ExecutionTest(fixtures.TestBase):
         go()
 
 
+class PGTypeProcessingTest(fixtures.TestBase):
+    """Profile the result processing of Postgresql ARRAY and HSTORE
+    values, which takes place in Python independently of the database
+    the tests are run against."""
+
+    def _result_processor(self, type_, dialect):
+        return type_.dialect_impl(dialect).result_processor(dialect, None)
+
+    def _test_array(self, type_, value):
+        proc = self._result_processor(type_, postgresql_base.PGDialect())
+
+        @profiling.function_call_count()
+        def go():
+            for i in range(10):
+                proc(value)
+        go()
+
+    def test_array(self):
+        self._test_array(postgresql.ARRAY(Integer), list(range(1000)))
+
+    def test_array_two_dimensions(self):
+        self._test_array(postgresql.ARRAY(Integer, dimensions=2),
+                    [list(range(i, i + 10)) for i in range(0, 1000, 10)])
+
+    def test_array_item_processor(self):
+        class MyInt(TypeDecorator):
+            impl = Integer
+
+            def process_result_value(self, value, dialect):
+                return value
+
+        self._test_array(postgresql.ARRAY(MyInt), list(range(1000)))
+
+    def test_array_psycopg2(self):
+        # psycopg2 returns lists already, so there's nothing to do
+        proc = self._result_processor(postgresql.ARRAY(Integer),
+                                        postgresql_psycopg2.dialect())
+        eq_(proc, None)
+
+    def test_hstore(self):
+        value = ", ".join('"key%d"=>"value%d"' % (i, i) for i in range(100))
+        proc = self._result_processor(postgresql.HSTORE(),
+                                        postgresql_base.PGDialect())
+
+        @profiling.function_call_count()
+        def go():
+            for i in range(10):
+                proc(value)
+        go()
+
+
 class RowProxyTest(fixtures.TestBase):
     __requires__ = 'cpython',
 
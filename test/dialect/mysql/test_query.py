@@ -127,3 +127,27 @@ class MatchTest(fixtures.TestBase, AssertsCompiledSQL):
         eq_([1, 3, 5], [r.id for r in results])
 
 
+
+
+class ServerSideCursorsTest(fixtures.TestBase):
+    __only_on__ = ('mysql+mysqldb', 'mysql+pymysql')
+
+    @testing.provide_metadata
+    def test_stream_results(self):
+        t = Table('stream', self.metadata, Column('x', Integer))
+        self.metadata.create_all(testing.db)
+        testing.db.execute(t.insert(), [{'x': i} for i in range(100)])
+
+        sscursor = testing.db.dialect._sscursor
+        conn = testing.db.connect()
+        try:
+            r = conn.execution_options(stream_results=True).\
+                        execute(t.select().order_by(t.c.x))
+            assert isinstance(r.cursor, sscursor)
+            eq_([row.x for row in r], list(range(100)))
+
+            r = conn.execute(t.select())
+            assert not isinstance(r.cursor, sscursor)
+            r.close()
+        finally:
+            conn.close()
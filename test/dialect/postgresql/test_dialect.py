@@ -13,10 +13,11 @@ from sqlalchemy import Table, Column, select, MetaData, text, Integer, \
             SmallInteger, Enum, REAL, update, insert, Index, delete, \
             and_, Date, TypeDecorator, Time, Unicode, Interval, or_, Text
 from sqlalchemy import exc, schema
+from sqlalchemy.util import u, b
 from sqlalchemy.dialects.postgresql import base as postgresql
 import logging
 import logging.handlers
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import Mock, call
 
 class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
 
@@ -214,3 +215,305 @@ class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
                 ddl_compiler.get_column_specification(t.c.c),
                 "c %s NOT NULL" % expected
             )
+
+
+class ExecutemanyModeTest(fixtures.TestBase):
+    def _fixture(self, **kw):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        dialect = psycopg2.dialect(**kw)
+        dialect._psycopg2_extras = Mock()
+        return dialect
+
+    def _table(self):
+        return Table('data', MetaData(),
+                    Column('x', Integer),
+                    Column('y', String(50)))
+
+    def _executemany(self, dialect, stmt, statement=None):
+        compiled = stmt.compile(dialect=dialect)
+        context = Mock(isinsert=compiled.isinsert, compiled=compiled)
+        cursor = Mock()
+        params = [{'x': 1, 'y': 'a'}, {'x': 2, 'y': 'b'}]
+        dialect.do_executemany(cursor, statement or str(compiled),
+                                params, context)
+        return cursor, params
+
+    def test_default(self):
+        dialect = self._fixture()
+        cursor, params = self._executemany(dialect, self._table().insert())
+        eq_(
+            cursor.executemany.mock_calls,
+            [call('INSERT INTO data (x, y) VALUES (%(x)s, %(y)s)', params)]
+        )
+        eq_(dialect._psycopg2_extras.mock_calls, [])
+
+    def test_values_insert(self):
+        dialect = self._fixture(executemany_mode='values')
+        cursor, params = self._executemany(dialect, self._table().insert())
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [call.execute_values(cursor,
+                        'INSERT INTO data (x, y) VALUES %s', params,
+                        template='(%(x)s, %(y)s)', page_size=1000)]
+        )
+        eq_(cursor.executemany.mock_calls, [])
+
+    def test_values_update(self):
+        dialect = self._fixture(executemany_mode='values',
+                                executemany_batch_page_size=10)
+        t = self._table()
+        cursor, params = self._executemany(dialect,
+                            t.update().where(t.c.x == bindparam('b_x')))
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [call.execute_batch(cursor,
+                        'UPDATE data SET x=%(x)s, y=%(y)s '
+                        'WHERE data.x = %(b_x)s', params,
+                        page_size=10)]
+        )
+
+    def test_values_modified_statement(self):
+        dialect = self._fixture(executemany_mode='values')
+        cursor, params = self._executemany(dialect, self._table().insert(),
+                    '/* comment */ INSERT INTO data (x, y) '
+                    'VALUES (%(x)s, %(y)s, 5)')
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [call.execute_batch(cursor,
+                        '/* comment */ INSERT INTO data (x, y) '
+                        'VALUES (%(x)s, %(y)s, 5)', params,
+                        page_size=100)]
+        )
+
+    def test_batch_insert(self):
+        dialect = self._fixture(executemany_mode='batch',
+                                executemany_values_page_size=10)
+        cursor, params = self._executemany(dialect, self._table().insert())
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [call.execute_batch(cursor,
+                        'INSERT INTO data (x, y) VALUES (%(x)s, %(y)s)',
+                        params, page_size=100)]
+        )
+
+    def test_invalid_mode(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value for 'executemany_mode': 'rows'",
+            psycopg2.dialect, executemany_mode='rows'
+        )
+
+    def test_old_psycopg2(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        assert_raises_message(
+            exc.ArgumentError,
+            "executemany_mode requires psycopg2 2.7 or greater",
+            psycopg2.dialect, executemany_mode='batch',
+                    dbapi=Mock(__version__='2.6.2 (dt dec pq3 ext)')
+        )
+
+    @testing.only_on('postgresql+psycopg2', 'psycopg2-specific feature')
+    @testing.provide_metadata
+    def test_roundtrip(self):
+        t = Table('data', self.metadata,
+                    Column('x', Integer, primary_key=True),
+                    Column('y', String(50)))
+        t.create(testing.db)
+        for mode in ('batch', 'values'):
+            eng = engines.testing_engine(options={
+                                    'executemany_mode': mode,
+                                    'executemany_batch_page_size': 7,
+                                    'executemany_values_page_size': 7})
+            with eng.begin() as conn:
+                conn.execute(t.delete())
+                conn.execute(t.insert(), [
+                                {'x': i, 'y': 'y%d' % i}
+                                for i in range(50)])
+                conn.execute(t.update().
+                                where(t.c.x == bindparam('xval')).
+                                values(y=bindparam('yval')), [
+                                {'xval': i, 'yval': 'z%d' % i}
+                                for i in range(0, 50, 2)])
+                eq_(
+                    conn.execute(
+                        select([t.c.x, t.c.y]).order_by(t.c.x)).fetchall(),
+                    [(i, ('z%d' if i % 2 == 0 else 'y%d') % i)
+                        for i in range(50)]
+                )
+
+
+class CopyFromTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = postgresql.dialect()
+
+    def _table(self, metadata=None):
+        return Table('data', metadata or MetaData(),
+                    Column('id', Integer, primary_key=True),
+                    Column('name', String(50)),
+                    Column('created', DateTime),
+                    Column('scores', postgresql.ARRAY(Integer)),
+                    Column('raw', postgresql.BYTEA))
+
+    def teardown(self):
+        from sqlalchemy.orm import clear_mappers
+        clear_mappers()
+
+    def _mapped(self, metadata=None):
+        from sqlalchemy.orm import mapper
+
+        class Data(object):
+            pass
+        t = self._table(metadata)
+        mapper(Data, t, properties={'data_name': t.c.name})
+        return Data
+
+    def _read(self, copy, size=-1):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        return copy._copy_stream(psycopg2.dialect(), 'utf-8').read(size)
+
+    def test_compile(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        t = self._table()
+        self.assert_compile(
+            copy_from(t, []),
+            "COPY data (id, name, created, scores, raw) FROM STDIN"
+        )
+        self.assert_compile(
+            copy_from(t, [], columns=[t.c.name, 'id']),
+            "COPY data (name, id) FROM STDIN"
+        )
+
+    def test_compile_mapped(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        Data = self._mapped()
+        self.assert_compile(
+            copy_from(Data, [], columns=['data_name', 'id']),
+            "COPY data (name, id) FROM STDIN"
+        )
+
+    def test_compile_unsupported(self):
+        from sqlalchemy.dialects.postgresql import copy_from, pg8000
+        assert_raises_message(
+            exc.CompileError,
+            "The 'postgresql\+pg8000' dialect does not support "
+            "COPY FROM STDIN",
+            copy_from(self._table(), []).compile, dialect=pg8000.dialect()
+        )
+
+    def test_wrong_table(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        other = Table('other', MetaData(), Column('x', Integer))
+        assert_raises_message(
+            exc.ArgumentError,
+            "Column other.x is not part of table data",
+            copy_from, self._table(), [], columns=[other.c.x]
+        )
+
+    def test_text_format(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        rows = [
+            (1, u('some\tname\\'), datetime.datetime(2013, 10, 15, 12, 5),
+                [1, None, 3], b('\x01\xff')),
+            (2, None, None, None, None)
+        ]
+        eq_(
+            self._read(copy_from(self._table(), rows)),
+            b('1\tsome\\tname\\\\\t2013-10-15T12:05:00\t'
+                '{"1",NULL,"3"}\t\\\\x01ff\n'
+                '2\t\\N\t\\N\t\\N\t\\N\n')
+        )
+
+    def test_unicode(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        t = self._table()
+        eq_(
+            self._read(copy_from(t, [(1, u('méil'))],
+                            columns=[t.c.id, t.c.name])),
+            u('1\tméil\n').encode('utf-8')
+        )
+
+    def test_dict_rows_mapped(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        Data = self._mapped()
+        eq_(
+            self._read(copy_from(Data, [{'id': 1, 'data_name': 'n1'},
+                                        {'id': 2}],
+                            columns=['id', 'data_name'])),
+            b('1\tn1\n2\t\\N\n')
+        )
+
+    def test_bounded_read(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        t = self._table()
+        consumed = []
+
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield (i, 'name%d' % i)
+
+        stream = copy_from(t, rows(), columns=[t.c.id, t.c.name]).\
+                        _copy_stream(postgresql.dialect(), 'utf-8')
+        eq_(stream.read(10), b('0\tname0\n1\t'))
+        eq_(consumed, [0, 1])
+        eq_(stream.read(10), b('name1\n2\tna'))
+        eq_(consumed, [0, 1, 2])
+        data = stream.read(1000)
+        eq_(data, b('me2\n') + b('').join(
+                b('%d\tname%d\n' % (i, i)) for i in range(3, 10)))
+        eq_(stream.read(1000), b(''))
+
+    def test_execute(self):
+        from sqlalchemy.dialects.postgresql import copy_from, psycopg2
+        dialect = psycopg2.dialect()
+        t = self._table()
+        copy = copy_from(t, [(1, 'n1')], columns=[t.c.id, t.c.name],
+                            buffer_size=100)
+        compiled = copy.compile(dialect=dialect)
+        dialect._psycopg2_extensions = Mock(encodings={'UTF8': 'utf_8'})
+        cursor = Mock(connection=Mock(encoding='UTF8'))
+        context = Mock(copy_from=copy)
+        dialect.do_execute(cursor, str(compiled), {}, context)
+        eq_(len(cursor.copy_expert.mock_calls), 1)
+        statement, stream = cursor.copy_expert.mock_calls[0][1]
+        eq_(statement, "COPY data (id, name) FROM STDIN")
+        eq_(cursor.copy_expert.mock_calls[0][2], {'size': 100})
+        eq_(stream.read(), b('1\tn1\n'))
+
+    @testing.only_on('postgresql+psycopg2', 'psycopg2-specific feature')
+    @testing.provide_metadata
+    def test_roundtrip(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        t = self._table(self.metadata)
+        self.metadata.create_all(testing.db)
+        rows = [
+            (i, u('name\t%d\\\n') % i,
+                datetime.datetime(2013, 10, 15, 12, 5, i),
+                [i, None], b('\x00\xff'))
+            for i in range(50)
+        ]
+        rows.append((50, None, None, None, None))
+        testing.db.execute(copy_from(t, iter(rows), buffer_size=64))
+        eq_(
+            testing.db.execute(t.select().order_by(t.c.id)).fetchall(),
+            rows
+        )
+
+    @testing.only_on('postgresql+psycopg2', 'psycopg2-specific feature')
+    @testing.provide_metadata
+    def test_roundtrip_session(self):
+        from sqlalchemy.dialects.postgresql import copy_from
+        from sqlalchemy.orm import Session
+        Data = self._mapped(self.metadata)
+        self.metadata.create_all(testing.db)
+
+        sess = Session(testing.db)
+        sess.execute(copy_from(Data, ({'id': i, 'data_name': 'n%d' % i}
+                                        for i in range(10)),
+                                columns=['id', 'data_name']))
+        eq_(
+            [(d.id, d.data_name) for d in
+                sess.query(Data).order_by(Data.id)],
+            [(i, 'n%d' % i) for i in range(10)]
+        )
+        sess.rollback()
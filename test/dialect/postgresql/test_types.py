@@ -12,7 +12,7 @@ from sqlalchemy import Table, Column, select, MetaData, text, Integer, \
             SmallInteger, Enum, REAL, update, insert, Index, delete, \
             and_, Date, TypeDecorator, Time, Unicode, Interval, or_, Text
 from sqlalchemy.orm import Session, mapper, aliased
-from sqlalchemy import exc, schema, types
+from sqlalchemy import exc, schema, types, event
 from sqlalchemy.dialects.postgresql import base as postgresql
 from sqlalchemy.dialects.postgresql import HSTORE, hstore, array, \
             INT4RANGE, INT8RANGE, NUMRANGE, DATERANGE, TSRANGE, TSTZRANGE
@@ -243,6 +243,41 @@ class EnumTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
         metadata.create_all(checkfirst=False)
         metadata.drop_all(checkfirst=False)
 
+    @testing.provide_metadata
+    def test_generate_multiple_checkfirst(self):
+        """Test that create_all() / drop_all() with checkfirst
+        look up the names of existing types once, rather than
+        once for each enum.
+
+        """
+        metadata = self.metadata
+
+        e1 = Enum('one', 'two', name="myenum")
+        Table('e1', metadata,
+            Column('c1', e1),
+            Column('c2', Enum('three', 'four', name="myotherenum"))
+        )
+        e1.create(testing.db)
+
+        def go(fn):
+            stmts = []
+
+            def before_cursor_execute(conn, cursor, statement, *arg):
+                if 'pg_type' in statement:
+                    stmts.append(statement)
+            event.listen(testing.db, "before_cursor_execute",
+                                before_cursor_execute)
+            try:
+                fn(checkfirst=True)
+            finally:
+                event.remove(testing.db, "before_cursor_execute",
+                                before_cursor_execute)
+            return len(stmts)
+
+        eq_(go(metadata.create_all), 1)
+        eq_(go(metadata.drop_all), 1)
+        eq_(go(metadata.drop_all), 1)
+
     def test_non_native_dialect(self):
         engine = engines.testing_engine()
         engine.connect()
@@ -515,6 +550,57 @@ class TimePrecisionTest(fixtures.TestBase, AssertsCompiledSQL):
         eq_(t2.c.c5.type.timezone, False)
         eq_(t2.c.c6.type.timezone, True)
 
+class ArrayProcessingTest(fixtures.TestBase):
+    def _result_processor(self, type_, dialect):
+        return type_._cached_result_processor(dialect, None)
+
+    def _bind_processor(self, type_, dialect):
+        return type_._cached_bind_processor(dialect)
+
+    def test_result_no_item_processor(self):
+        proc = self._result_processor(
+                    postgresql.ARRAY(Integer), postgresql.PGDialect())
+        eq_(proc([1, 2, 3]), [1, 2, 3])
+        eq_(proc([[1, 2], [3, 4]]), [[1, 2], [3, 4]])
+        eq_(proc([]), [])
+        eq_(proc(None), None)
+
+    def test_result_as_tuple(self):
+        proc = self._result_processor(
+                    postgresql.ARRAY(Integer, as_tuple=True),
+                    postgresql.PGDialect())
+        eq_(proc([[1, 2], [3, 4]]), ((1, 2), (3, 4)))
+
+    def test_result_item_processor(self):
+        class MyInt(TypeDecorator):
+            impl = Integer
+
+            def process_result_value(self, value, dialect):
+                return value * 10
+
+        proc = self._result_processor(
+                    postgresql.ARRAY(MyInt, dimensions=2),
+                    postgresql.PGDialect())
+        eq_(proc([[1, 2], [3, 4]]), [[10, 20], [30, 40]])
+
+    def test_bind_tuple_to_list(self):
+        proc = self._bind_processor(
+                    postgresql.ARRAY(Integer), postgresql.PGDialect())
+        eq_(proc((1, 2, 3)), [1, 2, 3])
+        eq_(proc(((1, 2), (3, 4))), [[1, 2], [3, 4]])
+
+    def test_result_psycopg2(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+
+        dialect = psycopg2.PGDialect_psycopg2()
+        is_(self._result_processor(postgresql.ARRAY(Integer), dialect),
+                None)
+
+        proc = self._result_processor(
+                    postgresql.ARRAY(Integer, as_tuple=True), dialect)
+        eq_(proc([[1, 2], [3, 4]]), ((1, 2), (3, 4)))
+
+
 class ArrayTest(fixtures.TablesTest, AssertsExecutionResults):
 
     __only_on__ = 'postgresql'
@@ -1069,6 +1155,17 @@ class HStoreTest(fixtures.TestBase):
             {'\\"a': '\\"1'}
         )
 
+    def test_result_deserialize_null_and_empty(self):
+        from sqlalchemy.engine import default
+
+        dialect = default.DefaultDialect()
+        proc = self.test_table.c.hash.type._cached_result_processor(
+                    dialect, None)
+        eq_(
+            proc('"key1"=>NULL, "key2" => "",  "key3"=>"NULL"'),
+            {"key1": None, "key2": "", "key3": "NULL"}
+        )
+
     def test_bind_serialize_psycopg2(self):
         from sqlalchemy.dialects.postgresql import psycopg2
 
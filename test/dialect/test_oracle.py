@@ -11,6 +11,7 @@ from sqlalchemy.util import u, b
 from sqlalchemy import util
 from sqlalchemy.testing import assert_raises, assert_raises_message
 from sqlalchemy.testing.engines import testing_engine
+from sqlalchemy.testing.mock import Mock, call
 from sqlalchemy.dialects.oracle import cx_oracle, base as oracle
 from sqlalchemy.engine import default
 import decimal
@@ -72,6 +73,37 @@ class CXOracleArgsTest(fixtures.TestBase):
                             exclude_setinputsizes=('NCLOB',))
         eq_(dialect.exclude_setinputsizes, set([cx_Oracle.NCLOB]))
 
+class CXOracleStatementCacheTest(fixtures.TestBase):
+    def _dialect(self):
+        return cx_oracle.dialect(prepared_statement_cache_size=10)
+
+    def test_cache_size(self):
+        eq_(self._dialect().prepared_statement_cache_size, 10)
+
+    def test_execute_prepared(self):
+        dialect = self._dialect()
+        cursor = Mock()
+        dialect.do_execute(cursor, "select 1 from dual", {'x': 1},
+                                Mock(_cursor_prepared=True))
+        dialect.do_executemany(cursor, "select 1 from dual", ({'x': 1}, ),
+                                Mock(_cursor_prepared=True))
+        eq_(
+            cursor.mock_calls,
+            [call.execute(None, {'x': 1}), call.executemany(None, [{'x': 1}])]
+        )
+
+    def test_execute_not_prepared(self):
+        dialect = self._dialect()
+        cursor = Mock()
+        dialect.do_execute(cursor, "select 1 from dual", {'x': 1},
+                                Mock(_cursor_prepared=False))
+        dialect.do_execute(cursor, "select 1 from dual", {'x': 1})
+        eq_(
+            cursor.mock_calls,
+            [call.execute("select 1 from dual", {'x': 1})] * 2
+        )
+
+
 class QuotedBindRoundTripTest(fixtures.TestBase):
 
     __only_on__ = 'oracle'
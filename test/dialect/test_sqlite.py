@@ -638,6 +638,52 @@ class DialectTest(fixtures.TestBase, AssertsExecutionResults):
         finally:
             meta.drop_all()
 
+    def test_schema_fingerprint(self):
+        dialect = testing.db.dialect
+        conn = testing.db.connect()
+        try:
+            fp = dialect.get_schema_fingerprint(conn)
+            eq_(dialect.get_schema_fingerprint(conn), fp)
+
+            conn.execute("CREATE TABLE fp_test (id INTEGER)")
+            fp2 = dialect.get_schema_fingerprint(conn)
+            assert fp2 != fp
+
+            conn.execute("ALTER TABLE fp_test ADD COLUMN data VARCHAR")
+            fp3 = dialect.get_schema_fingerprint(conn)
+            assert fp3 not in (fp, fp2)
+
+            conn.execute("CREATE TEMPORARY TABLE fp_temp (id INTEGER)")
+            assert dialect.get_schema_fingerprint(conn) != fp3
+            eq_(dialect.get_schema_fingerprint(conn, schema='main'),
+                    dialect.get_schema_fingerprint(conn, schema='main'))
+
+            conn.execute("DROP TABLE fp_temp")
+            eq_(dialect.get_schema_fingerprint(conn), fp3)
+        finally:
+            conn.execute("DROP TABLE IF EXISTS fp_test")
+            conn.close()
+
+    @testing.provide_metadata
+    def test_stream_results(self):
+        from sqlalchemy.engine import result
+        t = Table('stream', self.metadata, Column('x', Integer))
+        self.metadata.create_all(testing.db)
+        testing.db.execute(t.insert(), [{'x': i} for i in range(100)])
+
+        conn = testing.db.connect()
+        try:
+            r = conn.execution_options(stream_results=True).\
+                        execute(t.select().order_by(t.c.x))
+            assert isinstance(r, result.BufferedRowResultProxy)
+            eq_([row.x for row in r], list(range(100)))
+
+            r = conn.execute(t.select())
+            assert not isinstance(r, result.BufferedRowResultProxy)
+            r.close()
+        finally:
+            conn.close()
+
     def test_create_index_with_schema(self):
         """Test creation of index with explicit schema"""
 
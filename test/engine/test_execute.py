@@ -3,11 +3,13 @@
 from sqlalchemy.testing import eq_, assert_raises, assert_raises_message, \
     config, is_
 import re
+import datetime
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
-    bindparam, select, event, TypeDecorator, create_engine, Sequence
-from sqlalchemy.sql import column, literal
+    bindparam, select, event, TypeDecorator, create_engine, Sequence, \
+    DateTime
+from sqlalchemy.sql import column, literal, literal_column
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
 from sqlalchemy import testing
@@ -601,6 +603,199 @@ class CompiledCacheTest(fixtures.TestBase):
         assert len(cache) == 1
         eq_(conn.execute("select count(*) from users").scalar(), 3)
 
+    def test_cache_result_metadata(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+        cached_conn.execute(users.insert(), {'user_id': 1, 'user_name': 'u1'})
+
+        stmt = select([users.c.user_id, users.c.user_name])
+        r1 = cached_conn.execute(stmt)
+        r2 = cached_conn.execute(stmt)
+        assert r1._metadata is r2._metadata
+        eq_(r1.fetchall(), [(1, 'u1')])
+        row = r2.first()
+        eq_(row[users.c.user_name], 'u1')
+        eq_(row['user_id'], 1)
+
+        r3 = conn.execute(stmt)
+        assert r3._metadata is not r1._metadata
+        eq_(r3.fetchall(), [(1, 'u1')])
+
+    def test_cache_result_metadata_fallback_not_memoized(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+        cached_conn.execute(users.insert(), {'user_id': 1, 'user_name': 'u1'})
+
+        stmt = select([users.c.user_id, users.c.user_name])
+        result_metadata = cached_conn.execute(stmt)._metadata
+        keys = set(result_metadata._keymap)
+        for i in range(3):
+            row = cached_conn.execute(stmt).first()
+            eq_(row[column('user_name')], 'u1')
+
+        # the keymap shared among results isn't added to
+        eq_(set(result_metadata._keymap), keys)
+
+        # whereas that of a single result is
+        r1 = conn.execute(stmt)
+        c1 = column('user_name')
+        eq_(r1.first()[c1], 'u1')
+        assert c1 in r1._metadata._keymap
+
+    @testing.only_on('sqlite')
+    def test_cache_result_metadata_raw_colnames(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+        raw_conn = cached_conn.execution_options(sqlite_raw_colnames=True)
+
+        stmt = select([users.c.user_id])
+        r1 = cached_conn.execute(stmt)
+        r2 = raw_conn.execute(stmt)
+        r3 = raw_conn.execute(stmt)
+        assert r1._metadata is not r2._metadata
+        assert r2._metadata is r3._metadata
+
+class PreparedStatementCacheTest(fixtures.TestBase):
+    __requires__ = 'sqlite',
+
+    def setup(self):
+        self.eng = eng = create_engine('sqlite://')
+        self.metadata = MetaData()
+        self.t = Table('t', self.metadata,
+                    Column('x', Integer, primary_key=True),
+                    Column('y', Integer))
+        self.metadata.create_all(eng)
+        eng.execute(self.t.insert(), [{'x': 1, 'y': 1}, {'x': 2, 'y': 2}])
+
+        # sqlite doesn't support the option; turn it on directly to
+        # test the engine's side of things
+        eng.dialect.prepared_statement_cache_size = 2
+
+        self.cursors = cursors = []
+
+        @event.listens_for(eng, "before_cursor_execute")
+        def cursor_execute(conn, cursor, statement, parameters,
+                                context, executemany):
+            cursors.append(cursor)
+
+    def teardown(self):
+        self.eng.dispose()
+
+    def _cache(self, conn):
+        return conn.connection.info['prepared_statement_cache']
+
+    def test_unsupported(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "The sqlite\+pysqlite dialect does not support "
+            "prepared_statement_cache_size",
+            create_engine, 'sqlite://', prepared_statement_cache_size=10
+        )
+
+    def test_cursor_reused(self):
+        t = self.t
+        conn = self.eng.connect()
+        s1 = select([t.c.y]).where(t.c.x == bindparam('x'))
+        eq_(conn.execute(s1, x=1).fetchall(), [(1, )])
+        eq_(conn.execute(s1, x=2).fetchall(), [(2, )])
+        conn.execute(t.update().values(y=5))
+        eq_(conn.execute(s1, x=2).fetchall(), [(5, )])
+
+        c1, c2, c3, c4 = self.cursors
+        is_(c1, c2)
+        is_(c1, c4)
+        assert c3 is not c1
+        eq_(len(self._cache(conn)), 2)
+
+    def test_lru_closes_cursor(self):
+        t = self.t
+        conn = self.eng.connect()
+        s1 = select([t.c.x])
+        s2 = select([t.c.y])
+        s3 = select([t.c.x, t.c.y])
+        conn.execute(s1).fetchall()
+        conn.execute(s2).fetchall()
+        conn.execute(s1).fetchall()
+        conn.execute(s3).fetchall()
+
+        c1, c2, c3, c4 = self.cursors
+        is_(c1, c3)
+        eq_(
+            set(self._cache(conn).values()),
+            set([c1, c4])
+        )
+        # the cursor for s2 was least recently used, and was closed
+        assert_raises(self.eng.dialect.dbapi.ProgrammingError,
+                        c2.execute, "select 1")
+
+    def test_concurrent_results(self):
+        t = self.t
+        conn = self.eng.connect()
+        s1 = select([t.c.y]).order_by(t.c.x)
+        r1 = conn.execute(s1)
+        r2 = conn.execute(s1)
+        eq_(r1.fetchone(), (1, ))
+        eq_(r2.fetchall(), [(1, ), (2, )])
+        eq_(r1.fetchall(), [(2, )])
+
+        c1, c2 = self.cursors
+        assert c1 is not c2
+        eq_(list(self._cache(conn).values()), [c2])
+
+    def test_closed_result_values(self):
+        t = self.t
+        conn = self.eng.connect()
+        r1 = conn.execute(t.insert(), y=10)
+        r2 = conn.execute(t.insert(), y=11)
+        eq_(r1.lastrowid, 3)
+        eq_(r2.lastrowid, 4)
+
+        r1 = conn.execute(t.update().where(t.c.x == bindparam('id')),
+                                id=3, y=12)
+        r2 = conn.execute(t.update().where(t.c.x == bindparam('id')),
+                                id=5, y=12)
+        eq_(r1.rowcount, 1)
+        eq_(r2.rowcount, 0)
+
+        c1, c2, c3, c4 = self.cursors
+        is_(c1, c2)
+        is_(c3, c4)
+
+    def test_statement_changed_by_event(self):
+        t = self.t
+        conn = self.eng.connect()
+        s1 = select([t.c.y]).where(t.c.x == 1)
+
+        @event.listens_for(conn, "before_cursor_execute", retval=True)
+        def cursor_execute(conn, cursor, statement, parameters,
+                                context, executemany):
+            return statement.replace("x = ?", "x = ? + 1"), parameters
+
+        eq_(conn.execute(s1).fetchall(), [(2, )])
+        eq_(conn.execute(s1).fetchall(), [(2, )])
+
+        c1, c2 = self.cursors
+        assert c1 is not c2
+        eq_(len(self._cache(conn)), 0)
+
+    def test_invalidate(self):
+        conn = self.eng.connect()
+        # the memory database doesn't survive the reconnect
+        s1 = select([literal(1)])
+        conn.execute(s1).fetchall()
+        eq_(len(self._cache(conn)), 1)
+
+        conn.invalidate()
+        conn.execute(s1).fetchall()
+
+        c1, c2 = self.cursors
+        assert c1 is not c2
+        eq_(list(self._cache(conn).values()), [c2])
+
+
 class LogParamsTest(fixtures.TestBase):
     __only_on__ = 'sqlite'
     __requires__ = 'ad_hoc_engines',
@@ -1123,6 +1318,24 @@ class AlternateResultProxyTest(fixtures.TestBase):
     def test_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def test_buffered_column_result_proxy_compiled_cache(self):
+        class ExcCtx(default.DefaultExecutionContext):
+            def get_result_proxy(self):
+                return _result.BufferedColumnResultProxy(self)
+        self.engine.dialect.execution_ctx_cls = ExcCtx
+
+        conn = self.engine.connect().execution_options(compiled_cache={})
+        stmt = select([
+                    self.table.c.x,
+                    literal_column("'2013-10-15 12:57:18.000000'", DateTime)
+                ]).where(self.table.c.x == 1)
+        for i in range(2):
+            eq_(
+                conn.execute(stmt).fetchall(),
+                [(1, datetime.datetime(2013, 10, 15, 12, 57, 18))]
+            )
+        conn.close()
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
 
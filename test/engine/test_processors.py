@@ -1,5 +1,6 @@
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import assert_raises_message, eq_
+import datetime
 
 
 class _DateProcessorTest(fixtures.TestBase):
@@ -45,6 +46,40 @@ class _DateProcessorTest(fixtures.TestBase):
             self.module.str_to_time, "5:a"
         )
 
+    def test_date(self):
+        eq_(self.module.str_to_date("2012-10-15"),
+            datetime.date(2012, 10, 15))
+        eq_(self.module.str_to_date(None), None)
+
+    def test_datetime(self):
+        eq_(self.module.str_to_datetime("2012-10-15 12:57:18.054321"),
+            datetime.datetime(2012, 10, 15, 12, 57, 18, 54321))
+        eq_(self.module.str_to_datetime("2012-10-15 12:57:18"),
+            datetime.datetime(2012, 10, 15, 12, 57, 18))
+        eq_(self.module.str_to_datetime(None), None)
+
+    def test_time(self):
+        eq_(self.module.str_to_time("12:57:18.054321"),
+            datetime.time(12, 57, 18, 54321))
+        eq_(self.module.str_to_time("12:57:18"),
+            datetime.time(12, 57, 18))
+        eq_(self.module.str_to_time(None), None)
+
+    def test_datetime_nonstandard_widths(self):
+        eq_(self.module.str_to_datetime("2012-1-5 2:57:18.5"),
+            datetime.datetime(2012, 1, 5, 2, 57, 18, 5))
+        eq_(self.module.str_to_time("2:57:18.5"),
+            datetime.time(2, 57, 18, 5))
+        eq_(self.module.str_to_date("2012-1-5"),
+            datetime.date(2012, 1, 5))
+
+    def test_datetime_out_of_range(self):
+        assert_raises_message(
+            ValueError,
+            "month must be in 1..12",
+            self.module.str_to_datetime, "2012-13-15 12:57:18"
+        )
+
 
 class PyDateProcessorTest(_DateProcessorTest):
     @classmethod
@@ -1,5 +1,9 @@
 import operator
 
+import os
+import shutil
+import tempfile
+import time
 import unicodedata
 import sqlalchemy as sa
 from sqlalchemy import schema, events, event, inspect
@@ -9,6 +13,7 @@ from sqlalchemy.testing import ComparesTables, \
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.testing import eq_, assert_raises, assert_raises_message
 from sqlalchemy import testing
+from sqlalchemy.engine import reflection
 from sqlalchemy.util import ue
 
 
@@ -841,6 +846,107 @@ class ReflectionTest(fixtures.TestBase, ComparesTables):
             m9.reflect()
             self.assert_(not m9.tables)
 
+    def _batched_reflection_fixture(self):
+        parent = Table('rt_parent', self.metadata,
+                    Column('id', sa.Integer, primary_key=True))
+        names = ['rt_parent']
+        for i in range(5):
+            name = 'rt_child_%d' % i
+            Table(name, self.metadata,
+                    Column('id', sa.Integer, primary_key=True),
+                    Column('parent_id', sa.Integer,
+                            sa.ForeignKey(parent.c.id), index=True))
+            names.append(name)
+        self.metadata.create_all()
+        return names
+
+    def _reflect_statements(self, fn):
+        stmts = []
+
+        @event.listens_for(testing.db, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters,
+                                                    *arg):
+            stmts.append((statement, parameters))
+        try:
+            fn()
+        finally:
+            event.remove(testing.db, "before_cursor_execute",
+                            before_cursor_execute)
+        return stmts
+
+    def _reflect_only(self, names):
+        m = MetaData()
+        stmts = self._reflect_statements(
+                        lambda: m.reflect(testing.db, only=names))
+        eq_(set(m.tables), set(names))
+        return stmts
+
+    @testing.only_if(
+            lambda: testing.db.dialect.supports_multi_reflection,
+            "batched reflection queries")
+    @testing.provide_metadata
+    def test_reflect_all_batched(self):
+        names = self._batched_reflection_fixture()
+
+        # the number of statements doesn't depend on the number
+        # of tables reflected
+        eq_(len(self._reflect_only(names[0:2])),
+                len(self._reflect_only(names)))
+
+    @testing.only_if(
+            lambda: testing.db.dialect.supports_multi_reflection,
+            "batched reflection queries")
+    @testing.provide_metadata
+    def test_reflect_only_batched_filters_by_name(self):
+        names = self._batched_reflection_fixture()
+
+        # the requested names are bound to the batched queries,
+        # rather than all tables in the schema being read
+        # and filtered afterwards
+        bound = set()
+        for statement, parameters in self._reflect_only(names[0:2]):
+            if isinstance(parameters, dict):
+                parameters = parameters.values()
+            bound.update(parameters)
+        assert set(names[0:2]).issubset(bound)
+
+    @testing.provide_metadata
+    def test_reflect_only_one_not_batched(self):
+        names = self._batched_reflection_fixture()
+
+        # a single table is reflected the same way as Table()
+        # with autoload, rather than fetching information up front
+        def autoload():
+            m = MetaData()
+            Table(names[0], m, autoload=True, autoload_with=testing.db)
+        eq_(
+            len(self._reflect_only(names[0:1])),
+            len(self._reflect_statements(autoload)) + 1
+        )
+
+    @testing.provide_metadata
+    def test_reflect_all_reflecttable_without_kw(self):
+        Table('rt_a', self.metadata,
+                    Column('id', sa.Integer, primary_key=True),
+                    Column('data', sa.String(30)))
+        self.metadata.create_all()
+
+        dialect = testing.db.dialect
+        dialect_reflecttable = dialect.reflecttable
+
+        # the signature documented prior to 0.9
+        def reflecttable(connection, table, include_columns,
+                                exclude_columns=None):
+            return dialect_reflecttable(connection, table, include_columns,
+                                exclude_columns)
+        dialect.reflecttable = reflecttable
+        try:
+            m = MetaData()
+            m.reflect(testing.db, only=['rt_a'])
+        finally:
+            del dialect.reflecttable
+        eq_(list(m.tables['rt_a'].c.keys()), ['id', 'data'])
+
     def test_reflect_all_conn_closing(self):
         m1 = MetaData()
         c = testing.db.connect()
@@ -1271,6 +1377,276 @@ class SchemaTest(fixtures.TestBase):
 
 
 
+class ParallelReflectionTest(fixtures.TestBase):
+
+    def setup(self):
+        if testing.against('sqlite'):
+            # the threads need to see the same database; a file
+            # database uses NullPool, so that connections are closed
+            # in the thread which created them.
+            self.engine = sa.create_engine('sqlite:///rt_parallel.db')
+        else:
+            self.engine = testing.db
+
+        self.metadata = MetaData()
+        parent = Table('rt_parent', self.metadata,
+                    Column('id', sa.Integer, primary_key=True),
+                    Column('data', sa.String(30)))
+        self.names = ['rt_parent']
+        for i in range(5):
+            name = 'rt_child_%d' % i
+            Table(name, self.metadata,
+                    Column('id', sa.Integer, primary_key=True),
+                    Column('parent_id', sa.Integer,
+                            sa.ForeignKey(parent.c.id), index=True))
+            self.names.append(name)
+        self.metadata.create_all(self.engine)
+
+        # dialects which batch reflection don't use threads; most of
+        # these tests are concerned with those.
+        dialect = self.engine.dialect
+        self.batched = dialect.supports_multi_reflection
+        dialect.supports_multi_reflection = False
+
+    def teardown(self):
+        self.engine.dialect.supports_multi_reflection = self.batched
+        self.metadata.drop_all(self.engine)
+        if self.engine is not testing.db:
+            self.engine.dispose()
+            os.remove('rt_parallel.db')
+
+    def test_reflect_parallel(self):
+        m1 = MetaData()
+        m1.reflect(self.engine, only=self.names)
+        m2 = MetaData()
+        m2.reflect(self.engine, only=self.names, parallel=3)
+
+        def columns(table):
+            return [
+                (c.name, c.primary_key, c.nullable, type(c.type),
+                    [fk.target_fullname for fk in c.foreign_keys])
+                for c in table.c
+            ]
+
+        eq_(list(m1.tables), list(m2.tables))
+        for name in self.names:
+            eq_(columns(m1.tables[name]), columns(m2.tables[name]))
+            eq_(
+                set(idx.name for idx in m1.tables[name].indexes),
+                set(idx.name for idx in m2.tables[name].indexes)
+            )
+
+    def test_reflect_parallel_connections(self):
+        connections = set()
+
+        @event.listens_for(self.engine, "checkout")
+        def checkout(dbapi_con, con_record, con_proxy):
+            connections.add(dbapi_con)
+        try:
+            m = MetaData()
+            m.reflect(self.engine, only=self.names, parallel=3)
+        finally:
+            event.remove(self.engine, "checkout", checkout)
+        eq_(set(m.tables), set(self.names))
+        assert len(connections) > 1
+
+    def test_reflect_parallel_error(self):
+        def get_multi_columns(*arg, **kw):
+            raise sa.exc.DBAPIError("some error", None, None)
+        dialect = self.engine.dialect
+        dialect.get_multi_columns = get_multi_columns
+        try:
+            assert_raises_message(
+                sa.exc.DBAPIError,
+                "some error",
+                MetaData().reflect, self.engine, only=self.names, parallel=3
+            )
+        finally:
+            del dialect.get_multi_columns
+
+    def _reflect_timed(self, **kw):
+        m = MetaData()
+        start = time.time()
+        m.reflect(self.engine, only=self.names, **kw)
+        eq_(set(m.tables), set(self.names))
+        return time.time() - start
+
+    def test_reflect_parallel_speedup(self):
+        dialect = self.engine.dialect
+        get_columns = dialect.get_columns
+
+        # simulate a high latency connection
+        def slow_get_columns(*arg, **kw):
+            time.sleep(.05)
+            return get_columns(*arg, **kw)
+        dialect.get_columns = slow_get_columns
+        try:
+            serial = self._reflect_timed()
+            parallel = self._reflect_timed(parallel=3)
+        finally:
+            del dialect.get_columns
+        assert parallel < serial * .7, (parallel, serial)
+
+    @testing.only_if(
+            lambda: testing.db.dialect.supports_multi_reflection,
+            "dialect doesn't batch reflection")
+    def test_reflect_parallel_batched_serial(self):
+        self.engine.dialect.supports_multi_reflection = True
+        connections = set()
+        stmts = []
+
+        @event.listens_for(self.engine, "checkout")
+        def checkout(dbapi_con, con_record, con_proxy):
+            connections.add(dbapi_con)
+
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters,
+                                                    *arg):
+            stmts.append(statement)
+
+        try:
+            MetaData().reflect(self.engine, only=self.names)
+            serial = len(stmts)
+            del stmts[:]
+            connections.clear()
+            MetaData().reflect(self.engine, only=self.names, parallel=3)
+        finally:
+            event.remove(self.engine, "checkout", checkout)
+            event.remove(self.engine, "before_cursor_execute",
+                            before_cursor_execute)
+
+        # the tables are reflected with one query for each kind of
+        # information, rather than once more per thread
+        eq_(len(stmts), serial)
+        eq_(len(connections), 1)
+
+
+class _DictReflectionCache(reflection.ReflectionCache):
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+
+class ReflectionCacheTest(fixtures.TestBase):
+    __only_on__ = ('sqlite', 'postgresql')
+
+    def setup(self):
+        self.metadata = MetaData()
+        parent = Table('rc_parent', self.metadata,
+                Column('id', sa.Integer, primary_key=True),
+                Column('data', sa.String(30)))
+        Table('rc_child', self.metadata,
+                Column('id', sa.Integer, primary_key=True),
+                Column('parent_id', sa.Integer, sa.ForeignKey(parent.c.id),
+                                    index=True))
+        self.metadata.create_all(testing.db)
+
+    def teardown(self):
+        self.metadata.drop_all(testing.db)
+
+    def _reflect(self, cache):
+        stmts = []
+
+        @event.listens_for(testing.db, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            stmts.append(statement)
+        try:
+            m = MetaData()
+            m.reflect(testing.db,
+                        only=lambda name, m: name.startswith('rc_'),
+                        reflection_cache=cache)
+        finally:
+            event.remove(testing.db, "before_cursor_execute",
+                            before_cursor_execute)
+        return m, len(stmts)
+
+    def _assert_tables(self, m, names=('rc_child', 'rc_parent')):
+        eq_(sorted(m.tables), list(names))
+        eq_(
+            [c.name for c in m.tables['rc_parent'].c],
+            ['id', 'data']
+        )
+        assert isinstance(m.tables['rc_parent'].c.data.type, sa.String)
+        eq_(
+            list(m.tables['rc_child'].primary_key),
+            [m.tables['rc_child'].c.id]
+        )
+        assert m.tables['rc_child'].c.parent_id.references(
+                                    m.tables['rc_parent'].c.id)
+        eq_(
+            [idx.name for idx in m.tables['rc_child'].indexes],
+            ['ix_rc_child_parent_id']
+        )
+
+    def test_cached(self):
+        cache = _DictReflectionCache()
+        m1, count = self._reflect(cache)
+        self._assert_tables(m1)
+        eq_(len(cache.entries), 1)
+
+        # only the fingerprint is fetched
+        m2, count = self._reflect(cache)
+        self._assert_tables(m2)
+        eq_(count, 1)
+
+    def test_schema_change_invalidates(self):
+        cache = _DictReflectionCache()
+        self._reflect(cache)
+
+        Table('rc_other', self.metadata,
+                Column('id', sa.Integer, primary_key=True)).\
+                create(testing.db)
+        m, count = self._reflect(cache)
+        self._assert_tables(m, ('rc_child', 'rc_other', 'rc_parent'))
+        assert count > 1
+
+        m, count = self._reflect(cache)
+        self._assert_tables(m, ('rc_child', 'rc_other', 'rc_parent'))
+        eq_(count, 1)
+
+    def test_no_fingerprint(self):
+        dialect = testing.db.dialect
+        dialect.get_schema_fingerprint = lambda *arg, **kw: None
+        try:
+            cache = _DictReflectionCache()
+            m, count = self._reflect(cache)
+        finally:
+            del dialect.get_schema_fingerprint
+        self._assert_tables(m)
+        eq_(cache.entries, {})
+
+    def test_file_cache(self):
+        directory = tempfile.mkdtemp()
+        try:
+            cache = reflection.FileReflectionCache(
+                                os.path.join(directory, 'cache'))
+            self._reflect(cache)
+            filenames = os.listdir(cache.directory)
+            eq_(len(filenames), 1)
+
+            m, count = self._reflect(
+                        reflection.FileReflectionCache(cache.directory))
+            self._assert_tables(m)
+            eq_(count, 1)
+
+            # an unreadable file is replaced
+            with open(os.path.join(cache.directory, filenames[0]), 'wb') \
+                    as file_:
+                file_.write(b'garbage')
+            m, count = self._reflect(cache)
+            self._assert_tables(m)
+            assert count > 1
+
+            m, count = self._reflect(cache)
+            eq_(count, 1)
+        finally:
+            shutil.rmtree(directory)
+
 
 # Tests related to engine.reflection
 
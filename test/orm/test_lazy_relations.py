@@ -76,6 +76,46 @@ class LazyTest(_fixtures.FixtureTest):
             User(id=10, addresses=[])
         ] == q.all()
 
+    def _assert_target_eagerloads(self, lazy):
+        users, orders, items, order_items, User, Order, Item = (
+                                self.tables.users,
+                                self.tables.orders,
+                                self.tables.items,
+                                self.tables.order_items,
+                                self.classes.User,
+                                self.classes.Order,
+                                self.classes.Item)
+
+        mapper(User, users, properties={
+            'orders': relationship(Order, order_by=orders.c.id)
+        })
+        mapper(Order, orders, properties={
+            'items': relationship(Item, secondary=order_items,
+                                order_by=items.c.id, lazy=lazy)
+        })
+        mapper(Item, items)
+
+        sess = create_session()
+        u = sess.query(User).get(7)
+
+        def go():
+            eq_(u.orders, [
+                Order(id=1, items=[Item(id=1), Item(id=2), Item(id=3)]),
+                Order(id=3, items=[Item(id=3), Item(id=4), Item(id=5)]),
+                Order(id=5, items=[Item(id=5)])
+            ])
+        self.assert_sql_count(testing.db, go, 2 if lazy == 'subquery' else 1)
+
+    def test_target_subqueryload(self):
+        """lazy load of a mapper with a subqueryload relationship."""
+
+        self._assert_target_eagerloads('subquery')
+
+    def test_target_joinedload(self):
+        """lazy load of a mapper with a joinedload relationship."""
+
+        self._assert_target_eagerloads('joined')
+
     def test_orderby_secondary(self):
         """tests that a regular mapper select on a single table can order by a relationship to a second table"""
 
@@ -692,3 +732,51 @@ class CorrelatedTest(fixtures.MappedTest):
         ])
 
 
+class LazyLoadAutoflushTest(fixtures.MappedTest):
+
+    @classmethod
+    def define_tables(cls, meta):
+        Table('a', meta,
+              Column('id', Integer, primary_key=True),
+              Column('b_id', Integer, ForeignKey('b.id')))
+        Table('b', meta,
+              Column('id', Integer, primary_key=True,
+                        test_needs_autoincrement=True),
+              Column('data', String(30)))
+
+    @classmethod
+    def setup_classes(cls):
+        class A(cls.Basic):
+            pass
+
+        class B(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        A, B = cls.classes.A, cls.classes.B
+        a, b = cls.tables.a, cls.tables.b
+
+        mapper(A, a, properties={
+            'b': relationship(B),
+            # the extra criterion means this isn't a "get" load
+            'b_view': relationship(B,
+                        primaryjoin=sa.and_(a.c.b_id == b.c.id,
+                                            b.c.data != None),
+                        viewonly=True)
+        })
+        mapper(B, b)
+
+    def test_params_read_after_autoflush(self):
+        A, B = self.classes.A, self.classes.B
+
+        sess = create_session(autoflush=True, autocommit=False)
+        a1 = A(id=1)
+        sess.add(a1)
+        sess.commit()
+
+        b1 = B(data='b1')
+        a1.b = b1
+        # the autoflush assigns a1.b_id, which the load
+        # must use as its parameter
+        eq_(a1.b_view, b1)
@@ -2286,7 +2286,7 @@ class ComparatorFactoryTest(_fixtures.FixtureTest, AssertsCompiledSQL):
                 dialect=default.DefaultDialect())
 
 
-class DeferredTest(_fixtures.FixtureTest):
+class DeferredTest(_fixtures.FixtureTest, AssertsCompiledSQL):
 
     def test_basic(self):
         """A basic deferred load."""
@@ -2629,6 +2629,176 @@ class DeferredTest(_fixtures.FixtureTest):
         self.sql_count_(0, go)
         eq_(item.description, 'item 4')
 
+    def test_load_only(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders)
+
+        sess = create_session()
+        q = sess.query(Order).order_by(Order.id).\
+                    options(sa.orm.load_only("isopen", "description"))
+        self.assert_compile(q,
+            "SELECT orders.id AS orders_id, "
+            "orders.description AS orders_description, "
+            "orders.isopen AS orders_isopen "
+            "FROM orders ORDER BY orders.id",
+            dialect=default.DefaultDialect())
+
+        o1 = q.first()
+        assert 'user_id' not in o1.__dict__
+        def go():
+            eq_(o1.user_id, 7)
+        self.sql_count_(1, go)
+
+    def test_load_only_class_attrs(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders, properties={
+            'description': deferred(orders.c.description)})
+
+        sess = create_session()
+        q = sess.query(Order).\
+                    options(sa.orm.load_only(Order.description))
+        self.assert_compile(q,
+            "SELECT orders.description AS orders_description, "
+            "orders.id AS orders_id "
+            "FROM orders",
+            dialect=default.DefaultDialect())
+
+    def test_load_only_unicode_names(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders)
+
+        sess = create_session()
+        q = sess.query(Order).\
+                    options(sa.orm.load_only(util.u("description")))
+        self.assert_compile(q,
+            "SELECT orders.id AS orders_id, "
+            "orders.description AS orders_description "
+            "FROM orders",
+            dialect=default.DefaultDialect())
+
+    def test_load_only_path(self):
+        users, User, orders, Order = (self.tables.users,
+                                self.classes.User,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        mapper(User, users, properties={
+            'orders': relationship(Order, order_by=orders.c.id)})
+        mapper(Order, orders)
+
+        sess = create_session()
+        u1 = sess.query(User).filter_by(id=7).options(
+                    sa.orm.load_only("orders.description")).one()
+        o1 = u1.orders[0]
+        assert 'description' in o1.__dict__
+        assert 'isopen' not in o1.__dict__
+        eq_(o1.isopen, 0)
+
+    def test_load_only_mismatched_paths(self):
+        users, User, orders, Order = (self.tables.users,
+                                self.classes.User,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        mapper(User, users)
+        mapper(Order, orders)
+
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "load_only\(\) attributes must all refer to the same entity; "
+            "got orders.description, isopen",
+            sa.orm.load_only, "orders.description", "isopen"
+        )
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "load_only\(\) attributes must all refer to the same entity; "
+            "got User.name, Order.isopen",
+            sa.orm.load_only, User.name, Order.isopen
+        )
+
+    def test_load_only_path_many_attrs(self):
+        users, User, orders, Order = (self.tables.users,
+                                self.classes.User,
+                                self.tables.orders,
+                                self.classes.Order)
+
+        mapper(User, users, properties={
+            'orders': relationship(Order, order_by=orders.c.id)})
+        mapper(Order, orders)
+
+        sess = create_session()
+        u1 = sess.query(User).filter_by(id=7).options(
+                    sa.orm.load_only("orders.description",
+                                        "orders.isopen")).one()
+        o1 = u1.orders[0]
+        assert 'description' in o1.__dict__
+        assert 'isopen' in o1.__dict__
+        assert 'address_id' not in o1.__dict__
+
+    def test_load_only_cached_per_mapper(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        m = mapper(Order, orders)
+        sess = create_session()
+        sess.query(Order).options(
+                    sa.orm.load_only("description", "isopen")).all()
+        load, defer = m._load_only_props(("isopen", "description"))
+        is_(m._load_only_props(("description", "isopen"))[1], defer)
+        eq_(
+            set(p.key for p in defer),
+            set(["user_id", "address_id"])
+        )
+
+    def test_load_only_no_property(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders)
+        sess = create_session()
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "Can't find property named 'foo'",
+            sess.query(Order).options,
+            sa.orm.load_only("description", "foo")
+        )
+
+    def test_mapper_load_only(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders, load_only=['description'])
+
+        sess = create_session()
+        q = sess.query(Order).order_by(Order.id)
+        self.assert_compile(q,
+            "SELECT orders.id AS orders_id, "
+            "orders.description AS orders_description "
+            "FROM orders ORDER BY orders.id",
+            dialect=default.DefaultDialect())
+
+        self.assert_compile(q.options(sa.orm.undefer('isopen')),
+            "SELECT orders.id AS orders_id, "
+            "orders.description AS orders_description, "
+            "orders.isopen AS orders_isopen "
+            "FROM orders ORDER BY orders.id",
+            dialect=default.DefaultDialect())
+
+        o1 = q.first()
+        def go():
+            eq_(o1.address_id, 1)
+        self.sql_count_(1, go)
+
+    def test_mapper_load_only_no_property(self):
+        orders, Order = self.tables.orders, self.classes.Order
+
+        mapper(Order, orders, load_only=['foo'])
+        assert_raises_message(
+            sa.exc.ArgumentError,
+            "Mapper .* has no property 'foo'",
+            sa.orm.configure_mappers
+        )
+
 
 class SecondaryOptionsTest(fixtures.MappedTest):
     """test that the contains_eager() option doesn't bleed into a secondary load."""
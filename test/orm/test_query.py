@@ -7,6 +7,7 @@ from sqlalchemy import exc as sa_exc, util
 from sqlalchemy.sql import compiler, table, column
 from sqlalchemy.sql import expression
 from sqlalchemy.engine import default
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import attributes, mapper, relationship, backref, \
     configure_mappers, create_session, synonym, Session, class_mapper, \
     aliased, column_property, joinedload_all, joinedload, Query,\
@@ -390,6 +391,93 @@ class GetTest(QueryTest):
         q = s.query(User.id)
         assert_raises(sa_exc.InvalidRequestError, q.get, (5, ))
 
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = create_session()
+        users = s.query(User).get_many([8, 19, 7, 8])
+        eq_([u and u.id for u in users], [8, None, 7, 8])
+        assert users[0] is users[3]
+
+    def test_get_many_identity_map(self):
+        User = self.classes.User
+
+        s = create_session()
+        u7 = s.query(User).get(7)
+
+        def go():
+            eq_(s.query(User).get_many([7]), [u7])
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            users = s.query(User).get_many([9, 7, 8, 10])
+            eq_([u.id for u in users], [9, 7, 8, 10])
+            assert users[1] is u7
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_expired(self):
+        User = self.classes.User
+
+        s = create_session()
+        users = s.query(User).order_by(User.id).all()
+        ids = [u.id for u in users]
+        for u in users:
+            s.expire(u)
+
+        def go():
+            eq_(s.query(User).get_many(ids), users)
+            eq_([u.__dict__['name'] for u in users],
+                ['jack', 'ed', 'fred', 'chuck'])
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_get_many_expired_deleted(self):
+        User, users = self.classes.User, self.tables.users
+
+        s = Session()
+        u7, u8 = s.query(User).get_many([7, 8])
+        s.expire(u7)
+        s.expire(u8)
+        s.execute(users.delete().where(users.c.id == 8))
+        try:
+            eq_(s.query(User).get_many([7, 8]), [u7, None])
+            assert u8 not in s
+        finally:
+            s.rollback()
+
+    def test_get_many_chunksize(self):
+        User = self.classes.User
+
+        s = create_session()
+
+        def go():
+            users = s.query(User).get_many([7, 8, 9, 10, 11], chunksize=2)
+            eq_([u and u.id for u in users], [7, 8, 9, 10, None])
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_get_many_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        result = s.query(CompositePk).get_many([(100, 100), (1, 2)])
+        eq_(result[0], None)
+        eq_((result[1].i, result[1].j, result[1].k), (1, 2, 3))
+
+    def test_get_many_too_few_params(self):
+        CompositePk = self.classes.CompositePk
+
+        s = Session()
+        q = s.query(CompositePk)
+        assert_raises(sa_exc.InvalidRequestError, q.get_many, [(1, 2), 7])
+
+    def test_session_get_many(self):
+        User = self.classes.User
+
+        s = create_session()
+        eq_(
+            [u and u.id for u in s.get_many(User, [10, 19, 7])],
+            [10, None, 7]
+        )
+
     def test_get_null_pk(self):
         """test that a mapping which can have None in a
         PK (i.e. map to an outerjoin) works with get()."""
@@ -1220,6 +1308,25 @@ class FilterTest(QueryTest, AssertsCompiledSQL):
             users
         )
 
+    def test_deep_criterion_chain(self):
+        User = self.classes.User
+
+        ualias = aliased(User)
+        crit = ualias.id == 0
+        for i in range(3000):
+            crit = or_(crit, ualias.id == i)
+        q = create_session().query(ualias).filter(crit)
+
+        # sqlite dialect also runs the statement through the nested
+        # join rewrite, which clones the whole statement
+        self.assert_compile(
+            q,
+            "SELECT users_1.id AS users_1_id, users_1.name AS users_1_name "
+            "FROM users AS users_1 WHERE " +
+                " OR ".join(["users_1.id = ?"] * 3001),
+            dialect=sqlite.dialect()
+        )
+
     @testing.requires.offset
     def test_limit_offset(self):
         User = self.classes.User
@@ -12,7 +12,7 @@ from sqlalchemy import testing
 from sqlalchemy import Integer, String, Sequence
 from sqlalchemy.testing.schema import Table, Column
 from sqlalchemy.orm import mapper, relationship, backref, joinedload, \
-    exc as orm_exc, object_session, was_deleted
+    exc as orm_exc, object_session, was_deleted, identity
 from sqlalchemy.util import pypy
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
@@ -1269,6 +1269,136 @@ class StrongIdentityMapTest(_fixtures.FixtureTest):
         self.assert_(len(s.identity_map) == 0)
 
 
+class LRUIdentityMapTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    def _fixture(self, capacity, **kw):
+        users, User = self.tables.users, self.classes.User
+        mapper(User, users)
+        return Session(
+                    identity_cls=lambda: identity.LRUInstanceDict(
+                                            capacity=capacity, threshold=0),
+                    **kw)
+
+    def test_identity_cls(self):
+        s = self._fixture(5)
+        assert isinstance(s.identity_map, identity.LRUInstanceDict)
+        s.close()
+        assert isinstance(s.identity_map, identity.LRUInstanceDict)
+
+    @testing.requires.predictable_gc
+    def test_retains_recent(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        for i in range(10):
+            s.add(User(name='u%d' % i))
+            s.flush()
+        gc_collect()
+        eq_(len(s.identity_map), 5)
+
+        # most recently added are retained
+        eq_(
+            sorted(u.name for u in s.identity_map.values()),
+            ['u5', 'u6', 'u7', 'u8', 'u9']
+        )
+
+    @testing.requires.predictable_gc
+    def test_access_refreshes(self):
+        User = self.classes.User
+        s = self._fixture(3)
+
+        for i in range(3):
+            s.add(User(name='u%d' % i))
+            s.flush()
+        keys = sorted(s.identity_map.keys(), key=lambda k: k[1])
+
+        # touch the oldest
+        s.identity_map[keys[0]]
+
+        s.add(User(name='u3'))
+        s.flush()
+        gc_collect()
+        eq_(
+            sorted(u.name for u in s.identity_map.values()),
+            ['u0', 'u2', 'u3']
+        )
+
+    @testing.requires.predictable_gc
+    def test_modified_flushed_then_evicted(self):
+        User = self.classes.User
+        s = self._fixture(2)
+
+        s.add_all([User(name='u%d' % i) for i in range(2)])
+        s.flush()
+        u0 = s.query(User).filter_by(name='u0').one()
+        u0.name = 'u0 modified'
+        del u0
+
+        s.add_all([User(name='u%d' % i) for i in range(2, 5)])
+        s.flush()
+        gc_collect()
+        eq_(len(s.identity_map), 2)
+
+        u0 = s.query(User).filter_by(name='u0').first()
+        assert u0 is None
+        assert 'u0 modified' not in [u.name for u in s.identity_map.values()]
+
+    @testing.requires.predictable_gc
+    def test_modified_not_evicted(self):
+        User = self.classes.User
+        s = self._fixture(2, autoflush=False)
+
+        s.add_all([User(name='u%d' % i) for i in range(5)])
+        s.flush()
+        s.query(User).filter_by(name='u0').one().name = 'u0 modified'
+        gc_collect()
+
+        # load the other objects, past capacity, without flushing
+        eq_(len(s.query(User).filter(User.name != 'u0').all()), 4)
+        gc_collect()
+
+        # the unflushed change is retained along with the two
+        # most recently loaded objects
+        eq_(len(s.identity_map), 3)
+        eq_(len(s.dirty), 1)
+        assert 'u0 modified' in [u.name for u in s.identity_map.values()]
+
+        s.flush()
+        eq_(
+            s.query(User.name).filter_by(name='u0 modified').count(),
+            1
+        )
+
+    @testing.requires.predictable_gc
+    def test_referenced_not_evicted(self):
+        User = self.classes.User
+        s = self._fixture(2)
+
+        u0 = User(name='u0')
+        s.add(u0)
+        s.flush()
+
+        s.add_all([User(name='u%d' % i) for i in range(1, 5)])
+        s.flush()
+        gc_collect()
+        assert s.identity_map.contains_state(attributes.instance_state(u0))
+        eq_(len(s.identity_map), 3)
+
+    @testing.requires.predictable_gc
+    def test_prune(self):
+        User = self.classes.User
+        s = self._fixture(5)
+
+        s.add_all([User(name='u%d' % i) for i in range(3)])
+        s.flush()
+        u1 = s.query(User).filter_by(name='u1').one()
+        gc_collect()
+        eq_(len(s.identity_map), 3)
+        eq_(s.identity_map.prune(), 2)
+        eq_(list(s.identity_map.values()), [u1])
+
+
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
 
@@ -1475,7 +1605,7 @@ class SessionInterface(fixtures.TestBase):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blacklist = set(('begin', 'query'))
+        blacklist = set(('begin', 'query', 'get_many'))
 
         ok = set()
         for meth in Session.public_methods:
@@ -17,6 +17,7 @@ from sqlalchemy.orm import mapper, relationship, create_session, \
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy.testing.assertsql import AllOf, CompiledSQL
+from sqlalchemy.testing.mock import Mock
 from sqlalchemy import testing, util
 
 class UnitOfWorkTest(object):
@@ -2173,6 +2174,79 @@ class BooleanColTest(fixtures.MappedTest):
         eq_(sess.query(T).filter(T.value==True).all(), [T(value=True, name="t1"),T(value=True, name="t3")])
 
 
+class ChangedColumnsTest(fixtures.MappedTest):
+    """Test that UPDATE statements include only those columns
+    with net changes."""
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t1', metadata,
+            Column('id', Integer, primary_key=True,
+                        test_needs_autoincrement=True),
+            Column('a', String(30)),
+            Column('b', String(30)),
+            Column('c', String(30)))
+
+    @classmethod
+    def setup_classes(cls):
+        class Foo(cls.Basic):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(cls.classes.Foo, cls.tables.t1)
+
+    def _fixture(self):
+        Foo = self.classes.Foo
+        sess = Session()
+        objs = [Foo(a='a%d' % i, b='b%d' % i, c='c%d' % i)
+                    for i in range(3)]
+        sess.add_all(objs)
+        sess.commit()
+        return sess, objs, [f.id for f in objs]
+
+    def test_update_changed_columns(self):
+        sess, (f1, f2, f3), (id1, id2, id3) = self._fixture()
+
+        f1.a = 'a1new'
+        f2.b = 'b1'
+        f2.c = 'c1'
+        f3.b = 'b3new'
+        f3.c = 'c3new'
+
+        # f2 has no net change
+        self.assert_sql_execution(testing.db,
+            sess.flush,
+            CompiledSQL(
+                "UPDATE t1 SET a=:a WHERE t1.id = :t1_id",
+                [{'a': 'a1new', 't1_id': id1}]
+            ),
+            CompiledSQL(
+                "UPDATE t1 SET b=:b, c=:c WHERE t1.id = :t1_id",
+                [{'b': 'b3new', 'c': 'c3new', 't1_id': id3}]
+            ),
+        )
+
+    def test_unchanged_attributes_not_checked(self):
+        Foo = self.classes.Foo
+        sess, objs, ids = self._fixture()
+
+        for f in objs:
+            f.a = f.a + 'new'
+
+        impl = Foo.b.impl
+        get_history = impl.get_history = Mock(side_effect=impl.get_history)
+        try:
+            sess.flush()
+        finally:
+            del impl.get_history
+        eq_(get_history.call_count, 0)
+        eq_(
+            sess.query(Foo.a).order_by(Foo.id).all(),
+            [('a0new', ), ('a1new', ), ('a2new', )]
+        )
+
+
 class RowSwitchTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
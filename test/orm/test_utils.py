@@ -1,4 +1,5 @@
 from sqlalchemy.testing import assert_raises, assert_raises_message
+import weakref
 from sqlalchemy.orm import util as orm_util
 from sqlalchemy import Column
 from sqlalchemy import util
@@ -10,6 +11,7 @@ from sqlalchemy.orm import mapper, create_session
 from sqlalchemy.testing import fixtures
 from test.orm import _fixtures
 from sqlalchemy.testing import eq_, is_
+from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.orm.path_registry import PathRegistry, RootRegistry
 from sqlalchemy import inspect
 
@@ -184,6 +186,21 @@ class AliasedClassTest(fixtures.TestBase):
         assert_table(Point.left_of(p2), table)
         assert_table(alias.left_of(p2), alias_table)
 
+    def test_not_retained_by_table_columns(self):
+        class Point(object):
+            pass
+        table = self.point_map(Point)
+
+        def go():
+            alias = aliased(Point, table)
+            alias.x == 5
+            is_(alias.x.__clause_element__()._deannotate(), table.c.x)
+            return weakref.ref(inspect(alias))
+
+        ref = go()
+        gc_collect()
+        is_(ref(), None)
+
 class IdentityKeyTest(_fixtures.FixtureTest):
     run_inserts = None
 
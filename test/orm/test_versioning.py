@@ -624,6 +624,32 @@ class InheritanceTwoVersionIdsTest(fixtures.MappedTest):
         # base is not
         eq_(select([base.c.version_id]).scalar(), None)
 
+    def test_base_version_sub_change(self):
+        Base, sub, base, Sub = (self.classes.Base,
+                                self.tables.sub,
+                                self.tables.base,
+                                self.classes.Sub)
+
+        mapper(Base, base,
+                version_id_col=base.c.version_id)
+        mapper(Sub, sub, inherits=Base)
+
+        session = Session()
+        s1 = Sub(data='s1', sub_data='s1')
+        session.add(s1)
+        session.commit()
+
+        # no net change
+        eq_(s1.sub_data, 's1')
+        s1.sub_data = 's1'
+        session.commit()
+        eq_(select([base.c.version_id]).scalar(), 1)
+
+        # a change in the sub table only increments the version
+        s1.sub_data = 's2'
+        session.commit()
+        eq_(select([base.c.version_id]).scalar(), 2)
+
     def test_mismatch_version_col_warning(self):
         Base, sub, base, Sub = (self.classes.Base,
                                 self.tables.sub,
@@ -0,0 +1,73 @@
+"""Time an executemany() INSERT of 1k, 10k and 100k parameter sets
+against SQLite, reporting how long the conversion of bind parameters
+in the execution context takes separately from the total.
+
+Run as::
+
+    python test/perf/executemany.py
+
+"""
+from sqlalchemy import __version__
+from sqlalchemy import create_engine, MetaData, Table, Column, \
+    Integer, String, Numeric, DateTime, Unicode
+from sqlalchemy.engine import default
+from decimal import Decimal
+import datetime
+import time
+
+metadata = MetaData()
+
+data = Table('data', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String(50)),
+    Column('description', Unicode(100)),
+    Column('amount', Numeric(10, 2)),
+    Column('created', DateTime),
+)
+
+engine = create_engine('sqlite://')
+metadata.create_all(engine)
+
+_init_compiled = default.DefaultExecutionContext._init_compiled.__func__
+timings = []
+
+
+def _timed_init_compiled(cls, *arg):
+    now = time.time()
+    try:
+        return _init_compiled(cls, *arg)
+    finally:
+        timings.append(time.time() - now)
+
+default.DefaultExecutionContext._init_compiled = \
+                classmethod(_timed_init_compiled)
+
+
+def runit(num):
+    now = datetime.datetime(2013, 6, 1, 12, 30, 15)
+    params = [
+        {
+            "id": i,
+            "name": "name %d" % i,
+            "description": u"description %d" % i,
+            "amount": Decimal("%d.25" % i),
+            "created": now
+        }
+        for i in range(num)
+    ]
+
+    conn = engine.connect()
+    trans = conn.begin()
+    del timings[:]
+    start = time.time()
+    conn.execute(data.insert(), params)
+    total = time.time() - start
+    trans.rollback()
+    conn.close()
+    return sum(timings), total
+
+print("SQLA Version: %s" % __version__)
+for num in (1000, 10000, 100000):
+    convert, total = runit(num)
+    print("%d rows: %.3f sec to prepare parameters, %.3f sec total" %
+                (num, convert, total))
@@ -0,0 +1,64 @@
+"""Time the construction of Core select() and ORM Query objects through
+long chains of generative method calls, as builder-style code does.
+
+Each "step" below applies one round of where()/filter(), order_by(),
+group_by() and column()/add_columns(); the time per step should stay
+flat as the chain gets longer.
+
+Run as::
+
+    python test/perf/generative.py
+
+"""
+from sqlalchemy import __version__
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.declarative import declarative_base
+import time
+
+Base = declarative_base()
+
+
+class Widget(Base):
+    __tablename__ = 'widget'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    size = Column(Integer)
+
+widget = Widget.__table__
+session = Session()
+
+
+def build_select(steps):
+    stmt = select([widget.c.id])
+    for i in range(steps):
+        stmt = stmt.where(widget.c.size > i).\
+                    order_by(widget.c.name).\
+                    group_by(widget.c.size).\
+                    column(widget.c.name)
+    return stmt
+
+
+def build_query(steps):
+    query = session.query(Widget)
+    for i in range(steps):
+        query = query.filter(Widget.size > i).\
+                    order_by(Widget.name).\
+                    group_by(Widget.size).\
+                    add_columns(Widget.name)
+    return query
+
+
+def runit(fn, steps, num):
+    start = time.time()
+    for i in range(num):
+        fn(steps)
+    return (time.time() - start) / (num * steps) * 1000000
+
+print("SQLA Version: %s" % __version__)
+for steps, num in ((15, 1000), (150, 100), (1500, 10)):
+    print("%d steps: select %.1f usec/step, Query %.1f usec/step" % (
+                steps,
+                runit(build_select, steps, num),
+                runit(build_query, steps, num)))
@@ -874,6 +874,57 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             "SELECT t.x FROM t WHERE t.x = :x_1 OR t.x = :x_2"
         )
 
+    def test_deep_binary_chain(self):
+        t = table('t', column('x'), column('y'))
+
+        expr = t.c.x
+        for i in range(5000):
+            expr = expr + t.c.y
+        self.assert_compile(
+            select([expr.label('total')]),
+            "SELECT %s AS total FROM t" %
+                " + ".join(["t.x"] + ["t.y"] * 5000)
+        )
+
+    def test_deep_binary_chain_mixed_operators(self):
+        t = table('t', column('x'), column('y'))
+
+        expr = t.c.x * t.c.y
+        for i in range(5000):
+            expr = expr + t.c.y
+        self.assert_compile(
+            expr == 5,
+            "t.x * " + " + ".join(["t.y"] * 5001) + " = :param_1",
+            checkparams={'param_1': 5}
+        )
+
+    def test_deep_binary_chain_positional(self):
+        t = table('t', column('x'))
+
+        expr = t.c.x
+        for i in range(2000):
+            expr = expr + literal(i)
+        self.assert_compile(
+            expr,
+            " + ".join(["t.x"] + ["?"] * 2000),
+            checkpositional=tuple(range(2000)),
+            dialect=sqlite.dialect()
+        )
+
+    def test_deep_conjunction_chain(self):
+        t = table('t', column('x'))
+
+        stmt = select([t])
+        for i in range(5000):
+            stmt = stmt.where(t.c.x != i)
+        self.assert_compile(
+            stmt,
+            "SELECT t.x FROM t WHERE " +
+                " AND ".join(["t.x != ?"] * 5000),
+            checkpositional=tuple(range(5000)),
+            dialect=sqlite.dialect()
+        )
+
     def test_distinct(self):
         self.assert_compile(
             select([table1.c.myid.distinct()]),
@@ -2763,6 +2814,133 @@ class CRUDTest(fixtures.TestBase, AssertsCompiledSQL):
             "UPDATE foo SET id=:id, foo_id=:foo_id WHERE foo.id = :foo_id_1"
         )
 
+    def test_insert_literal_binds(self):
+        self.assert_compile(
+            table1.insert().values(myid=3, name="jack's"),
+            "INSERT INTO mytable (myid, name) VALUES (3, 'jack''s')",
+            literal_binds=True
+        )
+
+    def test_insert_multivalues_literal_binds(self):
+        self.assert_compile(
+            table1.insert().values([
+                {"myid": 1, "name": "a"},
+                {"myid": 2, "name": "b"}
+            ]),
+            "INSERT INTO mytable (myid, name) VALUES (1, 'a'), (2, 'b')",
+            dialect=postgresql.dialect(),
+            literal_binds=True
+        )
+
+    def test_update_literal_binds(self):
+        self.assert_compile(
+            table1.update().values(name="jack").where(table1.c.myid == 7),
+            "UPDATE mytable SET name='jack' WHERE mytable.myid = 7",
+            literal_binds=True
+        )
+
+    def test_delete_literal_binds(self):
+        self.assert_compile(
+            table1.delete().where(table1.c.name == "jack"),
+            "DELETE FROM mytable WHERE mytable.name = 'jack'",
+            literal_binds=True
+        )
+
+    def test_insert_literal_binds_none(self):
+        self.assert_compile(
+            table1.insert().values(myid=7, name=None),
+            "INSERT INTO mytable (myid, name) VALUES (7, NULL)",
+            literal_binds=True
+        )
+
+    def test_insert_literal_binds_no_value(self):
+        assert_raises_message(
+            exc.CompileError,
+            "Bind parameter without a renderable value",
+            table1.insert().compile,
+            column_keys=['myid'],
+            compile_kwargs={"literal_binds": True}
+        )
+
+    def test_literal_statements_insert(self):
+        compiled = table1.insert().compile(column_keys=['myid', 'name'])
+        eq_(
+            list(compiled.literal_statements([
+                {"myid": 1, "name": "jack"},
+                {"myid": 2, "name": "o'neil"},
+            ])),
+            [
+                "INSERT INTO mytable (myid, name) VALUES (1, 'jack')",
+                "INSERT INTO mytable (myid, name) VALUES (2, 'o''neil')",
+            ]
+        )
+
+    def test_literal_statements_positional(self):
+        for dialect in (sqlite.dialect(), mysql.dialect(),
+                            postgresql.dialect(), oracle.dialect()):
+            compiled = table1.insert().compile(dialect=dialect,
+                                            column_keys=['myid', 'name'])
+            eq_(
+                list(compiled.literal_statements([{"myid": 1, "name": "x"}])),
+                ["INSERT INTO mytable (myid, name) VALUES (1, 'x')"]
+            )
+
+    def test_literal_statements_defaults(self):
+        stmt = table1.update().where(table1.c.myid == bindparam('oldid')).\
+                    values(name=bindparam('newname'), description='d')
+        compiled = stmt.compile()
+        eq_(
+            list(compiled.literal_statements([
+                {"oldid": 7, "newname": "ed"},
+                {"oldid": 8, "newname": "wendy", "description": "e"},
+            ])),
+            [
+                "UPDATE mytable SET name='ed', description='d' "
+                "WHERE mytable.myid = 7",
+                "UPDATE mytable SET name='wendy', description='e' "
+                "WHERE mytable.myid = 8",
+            ]
+        )
+
+    def test_literal_statements_expanding(self):
+        stmt = select([table1.c.myid]).where(
+                table1.c.myid.in_(bindparam('ids', expanding=True)))
+        eq_(
+            list(stmt.compile().literal_statements(
+                        [{"ids": [1, 2, 3]}, {"ids": []}])),
+            [
+                "SELECT mytable.myid \nFROM mytable \n"
+                "WHERE mytable.myid IN (1, 2, 3)",
+                "SELECT mytable.myid \nFROM mytable \n"
+                "WHERE mytable.myid IN (NULL)",
+            ]
+        )
+
+    def test_literal_statements_required(self):
+        compiled = table1.insert().compile(column_keys=['myid', 'name'])
+        assert_raises_message(
+            exc.InvalidRequestError,
+            "A value is required for bind parameter 'name', "
+            "in parameter group 1",
+            list,
+            compiled.literal_statements([
+                {"myid": 1, "name": "jack"},
+                {"myid": 2},
+            ])
+        )
+
+    def test_write_literal_statements(self):
+        compiled = table1.insert().compile(column_keys=['myid'])
+        buf = util.StringIO()
+        compiled.write_literal_statements(buf,
+                            ({"myid": i} for i in range(3)))
+        eq_(
+            buf.getvalue(),
+            "INSERT INTO mytable (myid) VALUES (0);\n"
+            "INSERT INTO mytable (myid) VALUES (1);\n"
+            "INSERT INTO mytable (myid) VALUES (2);\n"
+        )
+
 class DDLTest(fixtures.TestBase, AssertsCompiledSQL):
     __dialect__ = 'default'
 
@@ -4,16 +4,28 @@ from sqlalchemy.engine import default
 from sqlalchemy import MetaData, Table, Column, Integer, Sequence
 from sqlalchemy import schema
 from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing import eq_
 
 class EmitDDLTest(fixtures.TestBase):
     def _mock_connection(self, item_exists):
         def has_item(connection, name, schema):
             return item_exists(name)
 
+        def get_names(prefix):
+            def get_names(connection, schema):
+                return [name for name in
+                            ['%s%d' % (prefix, i) for i in range(1, 6)]
+                            if item_exists(name)]
+            return get_names
+
         return Mock(dialect=Mock(
                     supports_sequences=True,
                     has_table=Mock(side_effect=has_item),
-                    has_sequence=Mock(side_effect=has_item)
+                    has_sequence=Mock(side_effect=has_item),
+                    _get_existing_table_names=Mock(
+                                    side_effect=get_names('t')),
+                    _get_existing_sequence_names=Mock(
+                                    side_effect=get_names('s'))
                 )
                 )
 
@@ -149,6 +161,108 @@ class EmitDDLTest(fixtures.TestBase):
 
         self._assert_drop_tables([t1, t2, t3, t4, t5], generator, m)
 
+    def test_create_metadata_checkfirst_batched(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(True, None,
+                        item_exists=lambda t: t not in ("t2", "t4")
+                        )
+
+        self._assert_create_tables([t2, t4], generator, m)
+        dialect = generator.dialect
+        eq_(dialect._get_existing_table_names.call_count, 1)
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_drop_metadata_checkfirst_batched(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_drop_fixture(True, None,
+                        item_exists=lambda t: t in ("t2", "t4")
+                        )
+
+        self._assert_drop_tables([t2, t4], generator, m)
+        dialect = generator.dialect
+        eq_(dialect._get_existing_table_names.call_count, 1)
+        eq_(dialect.has_table.call_count, 0)
+
+    def test_create_metadata_checkfirst_not_batched(self):
+        m, t1, t2, t3, t4, t5 = self._table_fixture()
+        generator = self._mock_create_fixture(True, None,
+                        item_exists=lambda t: t not in ("t2", "t4")
+                        )
+        dialect = generator.dialect
+        dialect.batch_checkfirst = False
+
+        self._assert_create_tables([t2, t4], generator, m)
+        eq_(dialect._get_existing_table_names.call_count, 0)
+        eq_(dialect.has_table.call_count, 5)
+
+    def test_create_metadata_checkfirst_per_schema(self):
+        m = MetaData()
+        t1 = Table('t1', m, Column('x', Integer))
+        t2 = Table('t2', m, Column('x', Integer), schema='s')
+        t3 = Table('t3', m, Column('x', Integer), schema='s')
+        generator = self._mock_create_fixture(True, None)
+
+        self._assert_create_tables([t1, t2, t3], generator, m)
+        eq_(
+            sorted(call[1][1] for call in
+                generator.dialect._get_existing_table_names.mock_calls),
+            [None, 's']
+        )
+
+    def test_create_metadata_checkfirst_case_differs(self):
+        m = MetaData()
+        Table('T1', m, Column('x', Integer))
+        t2 = Table('T2', m, Column('x', Integer))
+
+        # "t1" is present; the database decides if "T1" is the same
+        generator = self._mock_create_fixture(True, None,
+                        item_exists=lambda t: t in ('t1', 'T1'))
+
+        self._assert_create_tables([t2], generator, m)
+        eq_(
+            [call[1][1] for call in generator.dialect.has_table.mock_calls],
+            ['T1']
+        )
+
+    def test_create_seq_checkfirst_batched(self):
+        m, t1, t2, s1, s2 = self._table_seq_fixture()
+        generator = self._mock_create_fixture(True, None,
+                        item_exists=lambda t: t not in ("t1", "s1")
+                        )
+
+        self._assert_create([t1, s1], generator, m)
+        dialect = generator.dialect
+        eq_(dialect._get_existing_sequence_names.call_count, 1)
+        eq_(dialect.has_sequence.call_count, 0)
+
+    def test_create_seq_checkfirst_no_sequence_names(self):
+        m, t1, t2, s1, s2 = self._table_seq_fixture()
+        generator = self._mock_create_fixture(True, None,
+                        item_exists=lambda t: t not in ("t1", "s1")
+                        )
+        dialect = generator.dialect
+        dialect._get_existing_sequence_names.side_effect = NotImplementedError()
+
+        self._assert_create([t1, s1], generator, m)
+        eq_(dialect._get_existing_sequence_names.call_count, 1)
+        eq_(
+            [call[1][1] for call in dialect.has_sequence.mock_calls],
+            ['s1']
+        )
+
+    def test_existing_table_names_include_views(self):
+        dialect = default.DefaultDialect()
+        dialect.get_table_names = Mock(return_value=['t1'])
+        dialect.get_view_names = Mock(return_value=['v1'])
+        eq_(dialect._get_existing_table_names(Mock(), 's'), ['t1', 'v1'])
+        eq_(dialect.get_view_names.mock_calls[0][1][1], 's')
+
+    def test_existing_table_names_no_view_names(self):
+        dialect = default.DefaultDialect()
+        dialect.get_table_names = Mock(return_value=['t1'])
+        dialect.get_view_names = Mock(side_effect=NotImplementedError())
+        eq_(dialect._get_existing_table_names(Mock(), None), ['t1'])
+
     def _assert_create_tables(self, elements, generator, argument):
         self._assert_ddl(schema.CreateTable, elements, generator, argument)
 
@@ -292,6 +292,43 @@ class ClauseTest(fixtures.TestBase, AssertsCompiledSQL):
         clause = t1.c.col2 == t2.c.col2
         eq_(str(clause), str(CloningVisitor().traverse(clause)))
 
+    def test_deep_binary_chain(self):
+        expr = t1.c.col1
+        for i in range(5000):
+            expr = expr + t2.c.col1
+        cloned = CloningVisitor().traverse(expr)
+        is_(cloned.left.left.left.right.table, t2)
+        eq_(str(cloned), str(expr))
+        eq_(cloned._from_objects, [t1] + [t2] * 5000)
+
+    def test_deep_and_chain(self):
+        expr = t1.c.col1 == 5
+        for i in range(5000):
+            expr = and_(expr, t2.c.col2 == i)
+        cloned = CloningVisitor().traverse(expr)
+        eq_(str(cloned), str(expr))
+        eq_(len(list(cloned._from_objects)), 5001)
+
+    def test_deep_chain_visit_order(self):
+        expr = t1.c.col1
+        for i in range(5):
+            expr = expr + literal(i)
+
+        visited = []
+        class Vis(CloningVisitor):
+            def visit_binary(self, binary):
+                visited.append(binary.right.value)
+
+            def visit_bindparam(self, bind):
+                visited.append("bind %d" % bind.value)
+
+        Vis().traverse(expr)
+        eq_(
+            visited,
+            ["bind 0", 0, "bind 1", 1, "bind 2", 2,
+                "bind 3", 3, "bind 4", 4]
+        )
+
     def test_binary_anon_label_quirk(self):
         t = table('t1', column('col1'))
 
@@ -760,6 +797,39 @@ class ClauseAdapterTest(fixtures.TestBase, AssertsCompiledSQL):
                             'table2 WHERE t1alias.col1 = table2.col1) '
                             'AS anon_1 FROM table1 AS t1alias')
 
+    def test_deep_binary_chain(self):
+        t1alias = t1.alias('t1alias')
+        expr = t1.c.col1
+        for i in range(5000):
+            expr = expr + t1.c.col2
+        adapted = sql_util.ClauseAdapter(t1alias).traverse(expr)
+        eq_(
+            str(adapted),
+            " + ".join(["t1alias.col1"] + ["t1alias.col2"] * 5000)
+        )
+
+    def test_deep_chain_replaced_link(self):
+        t1alias = t1.alias('t1alias')
+        inner = t1.c.col1 + t1.c.col2
+        expr = inner
+        for i in range(5000):
+            expr = expr + t1.c.col3
+
+        replaced = []
+
+        def replace(elem):
+            if elem is inner:
+                replaced.append(elem)
+                return t1alias.c.col1
+        adapted = ReplacingCloningVisitor()
+        adapted.replace = replace
+        adapted = adapted.traverse(expr)
+        eq_(len(replaced), 1)
+        eq_(
+            str(adapted),
+            " + ".join(["t1alias.col1"] + ["table1.col3"] * 5000)
+        )
+
     @testing.fails_on_everything_except()
     def test_joins_dont_adapt(self):
         # adapting to a join, i.e. ClauseAdapter(t1.join(t2)), doesn't
@@ -1276,6 +1346,38 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
                             'table1.col3 FROM table1')
 
 
+    def test_order_by(self):
+        s = t1.select().order_by(t1.c.col1)
+        select_copy = s.order_by(t1.c.col2.desc())
+        self.assert_compile(select_copy,
+                            'SELECT table1.col1, table1.col2, '
+                            'table1.col3 FROM table1 '
+                            'ORDER BY table1.col1, table1.col2 DESC')
+        self.assert_compile(s,
+                            'SELECT table1.col1, table1.col2, '
+                            'table1.col3 FROM table1 ORDER BY table1.col1')
+
+        # existing criteria are carried over as is
+        is_(select_copy._order_by_clause.clauses[0],
+                s._order_by_clause.clauses[0])
+
+        self.assert_compile(select_copy.order_by(None).order_by(t1.c.col3),
+                            'SELECT table1.col1, table1.col2, '
+                            'table1.col3 FROM table1 ORDER BY table1.col3')
+
+    def test_group_by(self):
+        s = t1.select().group_by(t1.c.col1)
+        select_copy = s.group_by(t1.c.col2)
+        self.assert_compile(select_copy,
+                            'SELECT table1.col1, table1.col2, '
+                            'table1.col3 FROM table1 '
+                            'GROUP BY table1.col1, table1.col2')
+        self.assert_compile(s,
+                            'SELECT table1.col1, table1.col2, '
+                            'table1.col3 FROM table1 GROUP BY table1.col1')
+        is_(select_copy._group_by_clause.clauses[0],
+                s._group_by_clause.clauses[0])
+
     def test_prefixes(self):
         s = t1.select()
         self.assert_compile(s,
@@ -5,7 +5,7 @@ from sqlalchemy import Column, Integer, MetaData, String, Table,\
 from sqlalchemy.dialects import mysql, postgresql
 from sqlalchemy.engine import default
 from sqlalchemy.testing import AssertsCompiledSQL,\
-    assert_raises_message, fixtures
+    assert_raises_message, eq_, fixtures
 
 
 class _InsertTestBase(object):
@@ -182,6 +182,21 @@ class InsertTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             checkparams={"name_1": "foo"}
         )
 
+    def test_insert_single_values_expr(self):
+        table1 = self.tables.mytable
+
+        compiled = insert(table1).compile(dialect=postgresql.dialect())
+        eq_(compiled.insert_single_values_expr,
+            '%(myid)s, %(name)s, %(description)s')
+
+        for stmt in (
+                table1.insert().values([{'myid': 1}, {'myid': 2}]),
+                table1.insert().from_select(
+                        ['myid'], select([table1.c.myid])),
+                table1.insert().values({})):
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            eq_(compiled.insert_single_values_expr, None)
+
 
 class EmptyTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
     __dialect__ = 'default'
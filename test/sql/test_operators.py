@@ -778,6 +778,47 @@ class InTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         self.assert_compile(~self.table1.c.myid.in_([]),
         "mytable.myid = mytable.myid")
 
+    def test_in_expanding(self):
+        from sqlalchemy import bindparam
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('q', expanding=True)),
+            "mytable.myid IN ([EXPANDING_q])"
+        )
+
+    def test_notin_expanding(self):
+        from sqlalchemy import bindparam
+        self.assert_compile(
+            ~self.table1.c.myid.in_(bindparam('q', expanding=True)),
+            "mytable.myid NOT IN ([EXPANDING_q])"
+        )
+
+    def test_in_expanding_type(self):
+        from sqlalchemy import bindparam
+        expr = self.table1.c.myid.in_(bindparam('q', expanding=True))
+        is_(expr.right.element.type._type_affinity, Integer)
+
+    def test_in_expanding_literal_binds(self):
+        from sqlalchemy import bindparam
+        expr = self.table1.c.myid.in_(
+                    bindparam('q', value=[1, 2, 3], expanding=True))
+        eq_(
+            str(expr.compile(compile_kwargs={"literal_binds": True})),
+            "mytable.myid IN (1, 2, 3)"
+        )
+
+    def test_in_expanding_literal_binds_empty(self):
+        from sqlalchemy import bindparam
+        expr = self.table1.c.myid.in_(
+                    bindparam('q', value=[], expanding=True))
+        eq_(
+            str(expr.compile(compile_kwargs={"literal_binds": True})),
+            "mytable.myid != mytable.myid"
+        )
+        eq_(
+            str((~expr).compile(compile_kwargs={"literal_binds": True})),
+            "mytable.myid = mytable.myid"
+        )
+
 
 class MathOperatorTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = 'default'
@@ -1195,6 +1195,163 @@ class QueryTest(fixtures.TestBase):
         r = s.execute(search_key=None).fetchall()
         assert len(r) == 0
 
+    def test_expanding_in(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+        users.insert().execute(user_id=9, user_name=None)
+
+        stmt = select([users.c.user_id]).where(
+                    users.c.user_name.in_(bindparam('uname', expanding=True))
+                ).order_by(users.c.user_id)
+
+        with testing.db.connect() as conn:
+            eq_(
+                conn.execute(stmt, uname=['jack']).fetchall(),
+                [(7, )]
+            )
+            eq_(
+                conn.execute(stmt, uname=['jack', 'fred']).fetchall(),
+                [(7, ), (8, )]
+            )
+            eq_(
+                conn.execute(stmt, uname=[]).fetchall(),
+                []
+            )
+
+    def test_expanding_in_empty(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+        users.insert().execute(user_id=9, user_name=None)
+
+        stmt = select([users.c.user_id]).where(
+                    and_(
+                        users.c.user_name.notin_(
+                                bindparam('uname', expanding=True)),
+                        users.c.user_id.in_(
+                                bindparam('userid', expanding=True))
+                    )
+                ).order_by(users.c.user_id)
+
+        with testing.db.connect() as conn:
+            eq_(
+                conn.execute(stmt, uname=[], userid=[7, 8, 9]).fetchall(),
+                [(7, ), (8, )]
+            )
+            eq_(
+                conn.execute(stmt, uname=['jack'], userid=[]).fetchall(),
+                []
+            )
+            eq_(
+                conn.execute(stmt, uname=['jack'],
+                                userid=[7, 8, 9]).fetchall(),
+                [(8, )]
+            )
+
+    def test_expanding_in_empty_left_bind(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+
+        stmt = select([users.c.user_id]).where(
+                    and_(
+                        (users.c.user_id + bindparam('offset')).notin_(
+                                bindparam('userid', expanding=True)),
+                        users.c.user_id != bindparam('notid')
+                    )
+                ).order_by(users.c.user_id)
+
+        with testing.db.connect() as conn:
+            eq_(
+                conn.execute(stmt, offset=1, userid=[],
+                                notid=8).fetchall(),
+                [(7, )]
+            )
+
+    @testing.only_on('sqlite')
+    def test_expanding_in_numeric_paramstyle(self):
+        eng = engines.testing_engine(options={"paramstyle": "numeric"})
+        stmt = select([users.c.user_id]).where(
+                    users.c.user_id.in_(bindparam('userid', expanding=True)))
+
+        with eng.connect() as conn:
+            assert_raises_message(
+                exc.StatementError,
+                r"original cause: CompileError: 'expanding' parameters "
+                "are not supported with the 'numeric' paramstyle",
+                conn.execute, stmt, userid=[7]
+            )
+
+    def test_expanding_in_multiple(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+        users.insert().execute(user_id=9, user_name='ed')
+
+        stmt = select([users.c.user_id]).where(
+                    and_(
+                        users.c.user_name.in_(
+                                bindparam('uname', expanding=True)),
+                        users.c.user_id.in_(
+                                bindparam('userid', expanding=True)),
+                        users.c.user_id != bindparam('notid')
+                    )
+                ).order_by(users.c.user_id)
+
+        with testing.db.connect() as conn:
+            eq_(
+                conn.execute(stmt, uname=['jack', 'fred', 'ed'],
+                                userid=[8, 9], notid=9).fetchall(),
+                [(8, )]
+            )
+
+    @testing.only_on('sqlite')
+    def test_expanding_in_named_paramstyle(self):
+        eng = engines.testing_engine(options={"paramstyle": "named"})
+        users.create(eng, checkfirst=True)
+        eng.execute(users.insert(), [
+                    dict(user_id=7, user_name='jack'),
+                    dict(user_id=8, user_name='fred'),
+                    dict(user_id=9, user_name='ed')])
+
+        stmt = select([users.c.user_id]).where(
+                    and_(
+                        users.c.user_id.in_(
+                                bindparam('userid', expanding=True)),
+                        users.c.user_name != bindparam('uname')
+                    )
+                ).order_by(users.c.user_id)
+
+        with eng.connect() as conn:
+            eq_(
+                conn.execute(stmt, userid=[7, 8, 9],
+                                uname='fred').fetchall(),
+                [(7, ), (9, )]
+            )
+
+    def test_expanding_in_compiled_cache(self):
+        users.insert().execute(user_id=7, user_name='jack')
+        users.insert().execute(user_id=8, user_name='fred')
+
+        stmt = select([users.c.user_id]).where(
+                    users.c.user_id.in_(bindparam('userid', expanding=True))
+                ).order_by(users.c.user_id)
+
+        cache = {}
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache=cache)
+            eq_(conn.execute(stmt, userid=[7]).fetchall(), [(7, )])
+            eq_(conn.execute(stmt, userid=[7, 8]).fetchall(), [(7, ), (8, )])
+            eq_(len(cache), 1)
+
+    def test_expanding_in_executemany(self):
+        stmt = select([users.c.user_id]).where(
+                    users.c.user_id.in_(bindparam('userid', expanding=True)))
+
+        with testing.db.connect() as conn:
+            assert_raises_message(
+                exc.StatementError,
+                "'expanding' parameters can't be used with executemany",
+                conn.execute, stmt, [{"userid": [7]}, {"userid": [8]}]
+            )
+
     @testing.emits_warning('.*empty sequence.*')
     def test_literal_in(self):
         """similar to test_bind_in but use a bind with a value."""
@@ -1,7 +1,7 @@
 """Test various algorithmic properties of selectables."""
 
 from sqlalchemy.testing import eq_, assert_raises, \
-    assert_raises_message, is_
+    assert_raises_message, is_, is_not_
 from sqlalchemy import *
 from sqlalchemy.testing import fixtures, AssertsCompiledSQL, \
     AssertsExecutionResults
@@ -211,6 +211,20 @@ class SelectableTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiled
                 is s.c.table1_col1
             assert s.corresponding_column(a1.c.col1) is s.c.a1_col1
 
+    def test_distance_on_aliases_repeated(self):
+        # lookups against the same selectable make use of an
+        # index of proxied columns; results are the same
+        # as that of the first lookup
+        a1 = table1.alias('a1')
+        s = select([a1, table1], use_labels=True)
+        for i in range(3):
+            assert s.corresponding_column(table1.c.col1) \
+                is s.c.table1_col1
+            assert s.corresponding_column(a1.c.col1) is s.c.a1_col1
+            assert s.corresponding_column(table1.c.col2) \
+                is s.c.table1_col2
+            assert s.corresponding_column(table2.c.col1) is None
+
     def test_join_against_self(self):
         jj = select([table1.c.col1.label('bar_col1')])
         jjj = join(table1, jj, table1.c.col1 == jj.c.bar_col1)
@@ -325,6 +339,62 @@ class SelectableTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiled
         criterion = a.c.col1 == table2.c.col2
         self.assert_(criterion.compare(j.onclause))
 
+    def test_table_alias_repeated(self):
+        a1, a2, a3 = table2.alias(), table2.alias(), table2.alias()
+
+        for a in (a1, a2, a3):
+            for col in table2.c:
+                proxy = a.c[col.key]
+                is_(proxy.table, a)
+                eq_(proxy._proxies, [col])
+                eq_(proxy.name, col.name)
+                is_(proxy.type, col.type)
+                assert a.corresponding_column(col) is proxy
+            eq_(list(a.primary_key), [a.c.col1])
+            assert a.c.col1.primary_key
+            assert not a.c.col2.primary_key
+
+        assert a1.c.col1 is not a2.c.col1
+        assert a2.c.col1 is not a3.c.col1
+
+        # foreign keys are per-proxy, referring to the proxy as parent
+        fk1, = a1.c.col2.foreign_keys
+        fk2, = a2.c.col2.foreign_keys
+        assert fk1 is not fk2
+        is_(fk1.parent, a1.c.col2)
+        is_(fk2.parent, a2.c.col2)
+        is_(fk2.column, table1.c.col1)
+        eq_(a1.c.col1.foreign_keys, set())
+        eq_(a1.c.col2.constraints, set())
+        assert a1.c.col2.constraints is not a2.c.col2.constraints
+
+    def test_table_alias_repeated_labels(self):
+        s1 = select([table1.alias('a').c.col1]).apply_labels()
+        s2 = select([table1.alias('b').c.col1]).apply_labels()
+        s3 = select([table1.alias('a').c.col1]).apply_labels()
+
+        eq_(s1.c.keys(), ['a_col1'])
+        eq_(s2.c.keys(), ['b_col1'])
+        eq_(s3.c.keys(), ['a_col1'])
+        s = select([table1.c.col1]).alias()
+        eq_(s.c.keys(), ['col1'])
+        is_(s.c.col1.table, s)
+
+    def test_alias_column_subclass(self):
+        canary = []
+
+        class MyColumn(Column):
+            def __init__(self, *arg, **kw):
+                canary.append(arg[0])
+                super(MyColumn, self).__init__(*arg, **kw)
+
+        t = Table('t', MetaData(), MyColumn('x', Integer))
+        del canary[:]
+        a1, a2 = t.alias(), t.alias()
+        assert isinstance(a1.c.x, MyColumn)
+        assert isinstance(a2.c.x, MyColumn)
+        eq_(canary, ['x', 'x'])
+
     def test_union(self):
 
         # tests that we can correspond a column in a Select statement
@@ -693,6 +763,26 @@ class RefreshForNewColTest(fixtures.TestBase):
         j._refresh_for_new_column(q)
         assert j.c.b_q is q
 
+    def test_join_init_correspondence(self):
+        a = table('a', column('x'))
+        b = table('b', column('y'))
+        j = a.join(b, a.c.x == b.c.y)
+        q = column('q')
+        is_(j.corresponding_column(q), None)
+        b.append_column(q)
+        j._refresh_for_new_column(q)
+        is_(j.corresponding_column(q), q)
+
+    def test_aliased_select_init_correspondence(self):
+        a = table('a', column('x'))
+        b = table('b', column('y'))
+        s = select([a, b]).apply_labels().alias()
+        q = column('q')
+        is_(s.corresponding_column(q), None)
+        b.append_column(q)
+        s._refresh_for_new_column(q)
+        is_(s.corresponding_column(q), s.c.b_q)
+
 
     def test_join_samename_init(self):
         a = table('a', column('x'))
@@ -1460,6 +1550,81 @@ class AnnotationsTest(fixtures.TestBase):
         c1.name = 'somename'
         eq_(c1_a.name, 'somename')
 
+    def test_annotate_memoized(self):
+        t = table('t', column('x'))
+        x_a = t.c.x._annotate({"foo": "bar"})
+        is_(t.c.x._annotate({"foo": "bar"}), x_a)
+        is_not_(t.c.x._annotate({"foo": "bat"}), x_a)
+
+        x_ab = x_a._annotate({"bat": "hoho"})
+        is_(x_a._annotate({"bat": "hoho"}), x_ab)
+        eq_(x_ab._annotations, {"foo": "bar", "bat": "hoho"})
+        is_(x_ab._deannotate(values=("bat", )), x_ab._deannotate(("bat", )))
+        is_(x_ab._deannotate(), t.c.x)
+
+    def test_annotate_memoized_unhashable(self):
+        t = table('t', column('x'))
+        x_a = t.c.x._annotate({"foo": ["bar"]})
+        is_not_(t.c.x._annotate({"foo": ["bar"]}), x_a)
+        eq_(x_a._annotations, {"foo": ["bar"]})
+
+    def test_annotate_memoized_not_copied(self):
+        t = table('t', column('x'))
+        x_a = t.c.x._annotate({"foo": "bar"})
+        x_b = x_a._annotate({"foo": "bat"})
+        eq_(x_b._annotations, {"foo": "bat"})
+        eq_(t.c.x._annotate({"foo": "bat"})._annotations, {"foo": "bat"})
+        assert '_annotation_cache' not in t.c.x.__getstate__()
+
+    def test_annotate_memoized_bounded(self):
+        from sqlalchemy.sql import annotation
+        t = table('t', column('x'))
+        size = annotation._annotation_cache_size
+        for i in range(size * 4):
+            t.c.x._annotate({"foo": i})
+        eq_(len(t.c.x._annotation_cache), size)
+
+    def test_annotate_memoized_keeps_recent(self):
+        from sqlalchemy.sql import annotation
+        t = table('t', column('x'))
+        x_a = t.c.x._annotate({"foo": "bar"})
+        for i in range(annotation._annotation_cache_size * 4):
+            t.c.x._annotate({"foo": i})
+            is_(t.c.x._annotate({"foo": "bar"}), x_a)
+        x_b = t.c.x._annotate({"foo": "bat"})
+        is_(t.c.x._annotate({"foo": "bat"}), x_b)
+
+    def test_annotate_not_memoized_aliased_entity(self):
+        import gc
+        import weakref
+
+        class Entity(object):
+            _annotation_no_memo = True
+
+        t = table('t', column('x'))
+        entity = Entity()
+        x_a = t.c.x._annotate({"parententity": entity})
+        is_not_(t.c.x._annotate({"parententity": entity}), x_a)
+
+        ref = weakref.ref(entity)
+        del entity, x_a
+        gc.collect()
+        assert ref() is None
+
+    def test_annotate_not_memoized_mutable(self):
+        t = table('t', column('x'))
+        expr = t.c.x == 5
+        is_not_(expr._annotate({"foo": "bar"}), expr._annotate({"foo": "bar"}))
+
+    def test_annotate_memoized_late_table(self):
+        from sqlalchemy.schema import Column
+        c1 = Column('x', Integer)
+        c1_a = c1._annotate({"foo": "bar"})
+        t1 = Table('t1', MetaData(), c1)
+        c1_b = c1._annotate({"foo": "bar"})
+        is_not_(c1_b, c1_a)
+        is_(c1_b.table, t1)
+
     def test_custom_constructions(self):
         from sqlalchemy.schema import Column
         class MyColumn(Column):
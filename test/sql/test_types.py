@@ -1344,6 +1344,130 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
         self.assert_compile(types.DECIMAL(2, 4), 'DECIMAL(2, 4)')
 
 
+class LiteralTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = 'default'
+
+    def _assert_literal(self, type_, value, expected, dialect=None):
+        self.assert_compile(literal(value, type_), expected,
+                                dialect=dialect, literal_binds=True)
+
+    def test_string(self):
+        self._assert_literal(String(), "some string", "'some string'")
+        self._assert_literal(Unicode(), util.u("rêve"),
+                                util.u("'rêve'"))
+        self._assert_literal(String(), "o'neil'; drop table x",
+                                "'o''neil''; drop table x'")
+
+    def test_string_non_string_value(self):
+        self._assert_literal(String(), 5, "'5'")
+        self._assert_literal(Unicode(), 5, "'5'")
+
+    def test_string_backslash(self):
+        self._assert_literal(String(), "a\\b", "'a\\b'")
+        self._assert_literal(String(), "a\\b", "'a\\\\b'",
+                            dialect=dialects.mysql.dialect())
+
+    def test_integer(self):
+        self._assert_literal(Integer(), 5, "5")
+        self._assert_literal(BigInteger(), 10 ** 12, "1000000000000")
+
+    def test_integer_not_a_number(self):
+        assert_raises(
+            ValueError,
+            literal("5; drop table x", Integer()).compile,
+            compile_kwargs={"literal_binds": True}
+        )
+
+    def test_numeric(self):
+        self._assert_literal(Numeric(), decimal.Decimal("12.25"), "12.25")
+        self._assert_literal(Numeric(), 12, "12")
+        self._assert_literal(Float(), 12.5, "12.5")
+
+    def test_numeric_not_a_number(self):
+        assert_raises(
+            decimal.InvalidOperation,
+            literal("5; drop table x", Numeric()).compile,
+            compile_kwargs={"literal_binds": True}
+        )
+
+    def test_boolean(self):
+        self._assert_literal(Boolean(), True, "1")
+        self._assert_literal(Boolean(), False, "0")
+        self._assert_literal(Boolean(), True, "true",
+                        dialect=dialects.postgresql.dialect())
+        self._assert_literal(Boolean(), False, "false",
+                        dialect=dialects.postgresql.dialect())
+
+    def test_dates(self):
+        self._assert_literal(DateTime(),
+                        datetime.datetime(2013, 6, 1, 12, 30, 15),
+                        "'2013-06-01 12:30:15'")
+        self._assert_literal(Date(), datetime.date(2013, 6, 1),
+                        "'2013-06-01'")
+        self._assert_literal(Time(), datetime.time(12, 30, 15),
+                        "'12:30:15'")
+
+    def test_sqlite_dates(self):
+        dialect = dialects.sqlite.dialect()
+        self._assert_literal(DateTime(),
+                        datetime.datetime(2013, 6, 1, 12, 30, 15),
+                        "'2013-06-01 12:30:15.000000'", dialect=dialect)
+        self._assert_literal(Date(), datetime.date(2013, 6, 1),
+                        "'2013-06-01'", dialect=dialect)
+
+    def test_interval(self):
+        self._assert_literal(Interval(), datetime.timedelta(days=1),
+                        "'1970-01-02 00:00:00'")
+
+    def test_type_decorator_bind_param(self):
+        class MyType(types.TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "BIND_IN" + value
+
+        self._assert_literal(MyType(), "foo", "'BIND_INfoo'")
+
+    def test_type_decorator_literal_param(self):
+        class MyType(types.TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "BIND_IN" + value
+
+            def process_literal_param(self, value, dialect):
+                return "LITERAL_IN" + value
+
+        self._assert_literal(MyType(), "foo", "'LITERAL_INfoo'")
+
+    def test_type_decorator_bind_param_none(self):
+        class MyType(types.TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return None
+
+        self._assert_literal(MyType(), "foo", "NULL")
+
+    def test_no_literal_processor(self):
+        class MyType(types.UserDefinedType):
+            def bind_processor(self, dialect):
+                def process(value):
+                    return value * 2
+                return process
+
+        self._assert_literal(MyType(), 5, "10")
+        self._assert_literal(MyType(), "x", "'xx'")
+
+    def test_no_literal_rendering(self):
+        assert_raises_message(
+            NotImplementedError,
+            "Don't know how to literal-quote value",
+            literal(object(), types.NullType()).compile,
+            compile_kwargs={"literal_binds": True}
+        )
+
+
 
 
 class NumericRawSQLTest(fixtures.TestBase):